@@ -0,0 +1,93 @@
+"""
+Measure how late the event loop runs a 1ms heartbeat while an AsyncHashMap serves concurrent lookups and bulk loads
+players, compared with calling the blocking HashMap.update_many from a coroutine.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_async_latency --players 1000000 --readers 10 --chunk-size 1000
+"""
+import argparse
+import asyncio
+import gc
+import random
+import statistics
+import time
+
+from src.async_hash_map import AsyncHashMap
+from src.player import Player
+
+
+async def heartbeat(lateness: list[float], stop: asyncio.Event, interval: float = 0.001):
+    """
+    Sleep for <interval> over and over, recording how much later than asked for each sleep returned.
+    """
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lateness.append(time.perf_counter() - start - interval)
+
+
+async def reader(hash_map: AsyncHashMap, keys: list[str], stop: asyncio.Event, rng: random.Random) -> int:
+    lookups = 0
+    while not stop.is_set():
+        # A request handler's worth of single lookups between yields to the event loop
+        for key in rng.sample(keys, 10):
+            await hash_map.get(key)
+        lookups += 10
+        await asyncio.sleep(0)
+    return lookups
+
+
+async def run(players: list[Player], readers: int, chunk_size: int, blocking: bool) -> tuple[list[float], int, float]:
+    rng = random.Random(0)
+    hash_map = AsyncHashMap(chunk_size=chunk_size)
+
+    # Give the readers something to find before the bulk load starts
+    warm = players[:len(players) // 10]
+    await hash_map.update_many(warm)
+    keys = [player.uid for player in warm]
+
+    stop = asyncio.Event()
+    lateness = []
+    beat = asyncio.create_task(heartbeat(lateness, stop))
+    reading = [asyncio.create_task(reader(hash_map, keys, stop, rng)) for i in range(readers)]
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    if blocking:
+        hash_map.hash_map.update_many(players[len(warm):])
+    else:
+        await hash_map.update_many(players[len(warm):])
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    lookups = sum(await asyncio.gather(*reading))
+    await beat
+    return lateness, lookups, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--readers", type=int, default=10, help="Number of concurrent lookup tasks")
+    parser.add_argument("--chunk-size", type=int, default=AsyncHashMap.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--keep-gc", action="store_true",
+                        help="Leave the cyclic garbage collector on, whose full collections dwarf the chunk pauses")
+    args = parser.parse_args()
+
+    if not args.keep_gc:
+        gc.disable()
+
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+
+    print(f"{'bulk load':>10} {'load s':>8} {'lookups':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for blocking in (True, False):
+        lateness, lookups, elapsed = asyncio.run(run(players, args.readers, args.chunk_size, blocking))
+        lateness.sort()
+        p99 = lateness[int(len(lateness) * 0.99)] if lateness else 0.0
+        print(f"{'blocking' if blocking else 'async':>10} {elapsed:>8.2f} {lookups:>9,} "
+              f"{statistics.median(lateness) * 1000:>8.2f} {p99 * 1000:>8.2f} {lateness[-1] * 1000:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare resolving a batch of uids with HashMap.get_many against calling HashMap.get for each uid.
+
+get_many hashes the whole batch with NumPy when it is installed, falling back to hashing each key in Python.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch_lookup --players 200000 --batch 5000
+"""
+import argparse
+import random
+import time
+from unittest import mock
+
+from src import hashing
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def get_each(hash_map: HashMap, keys: list[str]) -> list:
+    results = []
+    for key in keys:
+        try:
+            results.append(hash_map.get(key))
+        except KeyError:
+            results.append(None)
+    return results
+
+
+def keys_per_second(lookup, hash_map: HashMap, batches: list[list[str]]) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        lookup(hash_map, batch)
+    return sum(map(len, batches)) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=5_000, help="Number of uids resolved per batch")
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--miss-rate", type=float, default=0.1, help="Fraction of uids that are not stored")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    hash_map = HashMap.from_players(players)
+
+    batches = [
+        [f"MISSING-{rng.randrange(args.players)}" if rng.random() < args.miss_rate
+         else f"ID-{rng.randrange(args.players)}" for _ in range(args.batch)]
+        for _ in range(args.batches)
+    ]
+    assert get_each(hash_map, batches[0]) == hash_map.get_many(batches[0])
+
+    results = [("get per key", keys_per_second(get_each, hash_map, batches))]
+    with mock.patch.object(hashing, "numpy", None):
+        results.append(("get_many (python)", keys_per_second(HashMap.get_many, hash_map, batches)))
+    if hashing.numpy is not None:
+        results.append(("get_many (numpy)", keys_per_second(HashMap.get_many, hash_map, batches)))
+    else:
+        print("numpy is not installed, skipping the vectorised get_many")
+
+    print(f"{'lookup':<20}{'keys/s':>14}")
+    for name, rate in results:
+        print(f"{name:<20}{rate:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
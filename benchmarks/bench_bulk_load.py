@@ -0,0 +1,57 @@
+"""
+Compare the time taken to load a roster into a HashMap one add at a time with HashMap.from_players.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bulk_load --players 1000000
+"""
+import argparse
+import gc
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def load_with_add(players: list[Player]) -> HashMap:
+    hash_map = HashMap()
+    for player in players:
+        hash_map.add(player)
+    return hash_map
+
+
+def load_with_add_pre_sized(players: list[Player]) -> HashMap:
+    hash_map = HashMap(capacity=len(players))
+    for player in players:
+        hash_map.add(player)
+    return hash_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000, help="Number of players to load")
+    args = parser.parse_args()
+
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+
+    loaders = (
+        ("add", load_with_add),
+        ("add (capacity=n)", load_with_add_pre_sized),
+        ("from_players", HashMap.from_players),
+        ("from_players (open)", lambda values: HashMap.from_players(values, storage=HashMap.STORAGE_OPEN_ADDRESSING)),
+    )
+
+    print(f"{'loader':<22}{'seconds':>10}{'players/s':>14}")
+    for name, loader in loaders:
+        gc.collect()
+        start = time.perf_counter()
+        hash_map = loader(players)
+        elapsed = time.perf_counter() - start
+
+        assert len(hash_map) == len(players)
+        print(f"{name:<22}{elapsed:>10.2f}{len(players) / elapsed:>14,.0f}")
+        del hash_map
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Measure a HashMap under churn, players constantly logging out (pop) and logging in (add), with and without a
+NodePool recycling the removed nodes. For each, reports the latency percentiles of add and pop and the garbage
+collections triggered during the churn. A separate run under tracemalloc counts the nodes allocated during the churn
+that are still in the map at its end, along with all the memory allocated during the churn that is still in use.
+The map's length never changes, so without a pool every such node replaces one that was freed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_churn --players 100000 --cycles 200000 --pool 1024
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def percentile(sorted_values: list[int], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class Churn:
+    """
+    Half of a population of players online in a HashMap, the other half offline. Every cycle logs a random online
+    player out and a random offline player in, so the map keeps the same length throughout.
+    """
+
+    def __init__(self, players: int, node_pool: int | None, new_players: bool, seed: int):
+        self.rng = random.Random(seed)
+        self.new_players = new_players
+        population = [Player(f"ID-{i}", f"Player {i}") for i in range(2 * players)]
+        self.online = population[:players]
+        self.offline = population[players:]
+        self.hash_map = HashMap.from_players(self.online, node_pool=node_pool)
+
+    def run(self, cycles: int, timings: tuple[list[int], list[int]] = None):
+        """
+        :param cycles: The number of players logged out and in.
+        :param timings: Lists the duration of every pop and of every add are appended to, in nanoseconds.
+        """
+        rng, online, offline, hash_map = self.rng, self.online, self.offline, self.hash_map
+        clock = time.perf_counter_ns
+
+        for _ in range(cycles):
+            # Swap the chosen player to the end of its list, so that moving it to the other list is O(1)
+            index = rng.randrange(len(online))
+            online[index], online[-1] = online[-1], online[index]
+            leaving = online.pop()
+
+            index = rng.randrange(len(offline))
+            offline[index], offline[-1] = offline[-1], offline[index]
+            joining = offline.pop()
+            if self.new_players:
+                joining = Player(joining.uid, joining.name)
+
+            start = clock()
+            hash_map.pop(leaving.uid)
+            middle = clock()
+            hash_map.add(joining)
+            end = clock()
+
+            offline.append(leaving)
+            online.append(joining)
+            if timings is not None:
+                timings[0].append(middle - start)
+                timings[1].append(end - middle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000, help="Number of players online at any time")
+    parser.add_argument("--cycles", type=int, default=200_000, help="Number of players logged out and in")
+    parser.add_argument("--pool", type=int, default=1024, help="Capacity of the NodePool")
+    parser.add_argument("--new-players", action="store_true",
+                        help="Create a new Player for every login instead of reusing the one that logged out")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'pool':<8}{'op':<6}{'p50 ns':>10}{'p99 ns':>10}{'p99.9 ns':>10}{'max ns':>12}"
+          f"{'cycles/s':>12}{'gc 0/1/2':>12}{'new nodes':>12}{'live KiB':>11}")
+    for node_pool in (None, args.pool):
+        label = "off" if node_pool is None else str(node_pool)
+
+        churn = Churn(args.players, node_pool, args.new_players, args.seed)
+        # Warm up, which also fills the pool
+        churn.run(min(args.cycles, 10_000))
+        gc.collect()
+
+        timings = ([], [])
+        collections = [generation["collections"] for generation in gc.get_stats()]
+        start = time.perf_counter()
+        churn.run(args.cycles, timings)
+        rate = args.cycles / (time.perf_counter() - start)
+        collections = [generation["collections"] - before for generation, before in zip(gc.get_stats(), collections)]
+
+        # Tracing slows every allocation down, so memory is measured on a run of its own
+        tracemalloc.start()
+        churn.run(args.cycles)
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        live = sum(trace.size for trace in snapshot.traces)
+        # Nodes are allocated by PlayerList, or by NodePool when it has none to reuse
+        nodes = sum(stat.count for stat in snapshot.filter_traces([
+            tracemalloc.Filter(True, "*player_list.py"), tracemalloc.Filter(True, "*player_node.py"),
+        ]).statistics("filename"))
+
+        for op, durations in zip(("pop", "add"), timings):
+            durations.sort()
+            print(f"{label:<8}{op:<6}{percentile(durations, 0.5):>10,.0f}{percentile(durations, 0.99):>10,.0f}"
+                  f"{percentile(durations, 0.999):>10,.0f}{durations[-1]:>12,}{rate:>12,.0f}"
+                  f"{'/'.join(map(str, collections)):>12}{nodes:>12,}{live / 1024:>11,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Compare the throughput of a ConcurrentHashMap with a HashMap behind a single global lock, with a mixed load of
+lookups and writes spread over 1, 4 and 16 threads.
+
+On a standard CPython build the GIL runs one thread at a time, so striping mostly removes lock convoys rather than
+adding parallelism; run with a free-threaded build to see the stripes scale.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_concurrent --players 100000 --operations 200000 --write-ratio 0.1
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.concurrent_hash_map import ConcurrentHashMap
+from src.hash_map import HashMap
+from src.player import Player
+
+
+class GlobalLockHashMap:
+    """
+    The baseline: a HashMap with every operation behind one lock.
+    """
+
+    def __init__(self, players: list[Player]):
+        self._lock = threading.Lock()
+        self._hash_map = HashMap.from_players(players)
+
+    def get(self, key: str) -> Player:
+        with self._lock:
+            return self._hash_map.get(key)
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._hash_map.put(key, value)
+
+
+def run(hash_map, operations: list[tuple[bool, str]], threads: int) -> float:
+    """
+    Split <operations> over <threads> threads and return the operations per second.
+    """
+    chunks = [operations[i::threads] for i in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def work(chunk):
+        barrier.wait()
+        for is_write, key in chunk:
+            if is_write:
+                hash_map.put(key, "John Doe")
+            else:
+                hash_map.get(key)
+
+    workers = [threading.Thread(target=work, args=(chunk,)) for chunk in chunks]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return len(operations) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="Fraction of operations that are puts")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--stripes", type=int, default=ConcurrentHashMap.DEFAULT_STRIPES)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    operations = [(rng.random() < args.write_ratio, f"ID-{rng.randrange(args.players)}")
+                  for i in range(args.operations)]
+
+    print(f"{'threads':>8} {'global lock ops/s':>18} {'striped ops/s':>14}")
+    for threads in args.threads:
+        baseline = run(GlobalLockHashMap(players), operations, threads)
+        striped = run(ConcurrentHashMap.from_players(players, stripes=args.stripes), operations, threads)
+        print(f"{threads:>8} {baseline:>18,.0f} {striped:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
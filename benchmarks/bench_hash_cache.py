@@ -0,0 +1,67 @@
+"""
+Micro-benchmarks showing the effect of caching hashes on Player and on the nodes of each PlayerList.
+
+"cached" uses the default HashMap, which reuses the hash stored on each Player and node. "recomputed" passes the
+pearson hash in as a hash_function, so the uid of every player added is hashed again, and searches a PlayerList
+comparing keys only.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hash_cache --players 200000
+"""
+import argparse
+import random
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.player_list import PlayerList
+
+
+def ops_per_second(operation, values) -> float:
+    start = time.perf_counter()
+    for value in values:
+        operation(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000, help="Number of players to add")
+    parser.add_argument("--chain", type=int, default=1_000, help="Length of the PlayerList searched by find")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    lookups = [player.uid for player in rng.choices(players, k=args.players)]
+
+    results = []
+
+    results.append(("hash(player)",
+                    ops_per_second(hash, players),
+                    ops_per_second(lambda player: Player.pearson_hash(player.uid), players)))
+
+    cached = HashMap()
+    recomputed = HashMap(hash_function=Player.pearson_hash)
+    results.append(("HashMap.add", ops_per_second(cached.add, players), ops_per_second(recomputed.add, players)))
+    results.append(("HashMap[key]",
+                    ops_per_second(cached.__getitem__, lookups),
+                    ops_per_second(recomputed.__getitem__, lookups)))
+
+    # A long chain exaggerates the cost of comparing every key while searching it
+    chain = PlayerList()
+    for player in players[:args.chain]:
+        chain.append(player)
+    keys = [(player.uid, hash(player)) for player in rng.choices(players[:args.chain], k=args.chain)]
+    results.append(("PlayerList.find",
+                    ops_per_second(lambda key: chain.find(*key), keys),
+                    ops_per_second(lambda key: chain.find(key[0]), keys)))
+
+    print(f"{'operation':<18}{'cached ops/s':>16}{'recomputed ops/s':>20}")
+    for name, with_cache, without_cache in results:
+        print(f"{name:<18}{with_cache:>16,.0f}{without_cache:>20,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Compare importing a player export by first building a list of every Player with streaming it into the HashMap chunk
+by chunk: without knowing the number of rows, knowing it up front, and knowing it with a pool of parsing workers.
+Both CSV and JSON Lines are tried. Reports rows per second and peak resident set size.
+
+Each import runs in a fresh interpreter, as the peak resident set size of a process never goes down.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ingest --rows 1000000 --workers 2
+"""
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from src import ingest
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def write_exports(directory: str, rows: int) -> dict[str, str]:
+    paths = {"csv": os.path.join(directory, "players.csv"), "jsonl": os.path.join(directory, "players.jsonl")}
+
+    with open(paths["csv"], "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(("uid", "name"))
+        writer.writerows((f"ID-{i}", f"Player {i}") for i in range(rows))
+
+    with open(paths["jsonl"], "w", encoding="utf-8") as file:
+        file.writelines(json.dumps({"uid": f"ID-{i}", "name": f"Player {i}"}) + "\n" for i in range(rows))
+
+    return paths
+
+
+def import_once(path: str, mode: str, workers: int, rows: int):
+    """
+    Import <path> into a new HashMap and print the report as JSON. Run in its own interpreter by main.
+    """
+    hash_map = HashMap()
+
+    if mode == "list":
+        start = time.perf_counter()
+        players = [Player(uid, name) for chunk in ingest.read_rows(path) for uid, name in chunk]
+        hash_map.update_many(players)
+        elapsed = time.perf_counter() - start
+        report = {"rows": len(players), "rows_per_second": len(players) / elapsed, "peak_rss": ingest.peak_rss()}
+    else:
+        report = ingest.ingest(hash_map, path, expected_rows=None if mode == "stream" else rows,
+                               workers=workers if mode == "workers" else 0)
+
+    print(json.dumps(report))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--import-once", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.import_once:
+        import_once(*args.import_once, args.workers, args.rows)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_exports(directory, args.rows)
+
+        print(f"{'format':<8}{'mode':<10}{'rows/s':>12}{'peak RSS MB':>14}")
+        for file_format, path in paths.items():
+            for mode in ("list", "stream", "sized", "workers"):
+                output = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_ingest", "--workers", str(args.workers),
+                     "--rows", str(args.rows), "--import-once", path, mode],
+                    check=True, capture_output=True, text=True).stdout
+                report = json.loads(output)
+                peak = f"{report['peak_rss'] / 1e6:,.0f}" if report["peak_rss"] is not None else "n/a"
+                print(f"{file_format:<8}{mode:<10}{report['rows_per_second']:>12,.0f}{peak:>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare iterating a HashMap through its views with the nested PlayerList generators it used to iterate with, for
+chained and open addressing storage. Also reports the time and peak memory of repr and of displaying the map in full
+and with a limit, against rendering the whole map into a single string as display used to.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_iteration --players 1000000
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def nested_generators(hash_map: HashMap):
+    # How HashMap.__iter__ used to iterate, yielding from the generator of every PlayerList in turn
+    for player_list in hash_map._player_lists():
+        yield from player_list
+
+
+def one_string(hash_map: HashMap) -> str:
+    # How display used to render the map before printing it
+    return f"{hash_map.__class__.__name__}({', '.join([f'{index}: {player_list}' for index, player_list in enumerate(hash_map._player_lists())])})"
+
+
+def best_of(repeat: int, function) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(function) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def exhaust(iterator):
+    for _ in iterator:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each iteration, the best is kept")
+    parser.add_argument("--display-limit", type=int, default=100)
+    args = parser.parse_args()
+
+    players = [Player(f"ID-{i}", f"Player {i}") for i in range(args.players)]
+
+    print(f"{'storage':<18}{'iteration':<22}{'players/s':>14}")
+    for storage in (HashMap.STORAGE_CHAINED, HashMap.STORAGE_OPEN_ADDRESSING):
+        hash_map = HashMap.from_players(players, storage=storage)
+
+        cases = [("iter", lambda: exhaust(hash_map)),
+                 ("keys()", lambda: exhaust(hash_map.keys())),
+                 ("items()", lambda: exhaust(hash_map.items()))]
+        if storage == HashMap.STORAGE_CHAINED:
+            cases.insert(0, ("nested generators", lambda: exhaust(nested_generators(hash_map))))
+
+        for label, function in cases:
+            print(f"{storage:<18}{label:<22}{args.players / best_of(args.repeat, function):>14,.0f}")
+
+    hash_map = HashMap.from_players(players)
+    # Written to os.devnull, so that the peak memory is only that of rendering the output
+    devnull = open(os.devnull, "w")
+    print(f"\n{'output':<22}{'seconds':>10}{'peak MiB':>12}")
+    for label, function in [
+        ("one string", lambda: one_string(hash_map)),
+        ("display", lambda: hash_map.display(file=devnull)),
+        (f"display limit={args.display_limit}", lambda: hash_map.display(limit=args.display_limit, file=devnull)),
+        ("repr", lambda: repr(hash_map)),
+    ]:
+        seconds = best_of(1, function)
+        print(f"{label:<22}{seconds:>10.3f}{peak_memory(function) / 2 ** 20:>12.1f}")
+    devnull.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure the memory used per stored player by a HashMap, using tracemalloc.
+
+"before" stores players with a per-instance __dict__ in validating PlayerNode's, matching the layout before Player
+and PlayerNode were slotted. "after" stores slotted players in FastPlayerNode's.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory --players 200000
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+class DictPlayer(Player):
+    """
+    A Player with a per-instance __dict__, as every Player had before Player declared __slots__.
+    """
+
+
+def measure(player_class: type, debug: bool, count: int) -> tuple[float, float, float]:
+    """
+    Create <count> players and add them to a HashMap, then look every one of them up.
+
+    :return: tuple[float, float, float] - Bytes per player for the players alone, bytes per player for the players
+        and the HashMap, and lookups per second.
+    """
+    tracemalloc.start()
+    players = [player_class(f"ID-{i}", "Jane Doe") for i in range(count)]
+    player_bytes = tracemalloc.get_traced_memory()[0]
+
+    hash_map = HashMap(capacity=count, debug=debug)
+    for player in players:
+        hash_map.add(player)
+    total_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for player in players:
+        hash_map.get(player.uid)
+    lookups = count / (time.perf_counter() - start)
+
+    return player_bytes / count, total_bytes / count, lookups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000, help="Number of players to store")
+    args = parser.parse_args()
+
+    print(f"{'layout':<10}{'player bytes':>16}{'total bytes':>16}{'lookups/s':>14}")
+    for layout, player_class, debug in (("before", DictPlayer, True), ("after", Player, False)):
+        player_bytes, total_bytes, lookups = measure(player_class, debug, args.players)
+        print(f"{layout:<10}{player_bytes:>16.1f}{total_bytes:>16.1f}{lookups:>14,.0f}")
+    print("bytes are per stored player and include the uid and name strings")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Compare searching players by name with a NameIndex against scanning the whole HashMap, for exact names and for name
+prefixes. Also reports what keeping the index costs: the time to build it and the slowdown of add and put while it
+is attached.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_name_index --players 1000000 --queries 200
+"""
+import argparse
+import random
+import time
+
+from src.hash_map import HashMap
+from src.name_index import NameIndex
+from src.player import Player
+
+FIRST_NAMES = ["Alex", "Sam", "Jamie", "Robin", "Charlie", "Morgan", "Taylor", "Jordan", "Casey", "Riley"]
+LAST_NAMES = ["Smith", "Jones", "Taylor", "Brown", "Wilson", "Evans", "Thomas", "Roberts", "Walker", "Wright"]
+
+
+def random_name(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)}{rng.choice(LAST_NAMES)}{rng.randrange(10_000)}"
+
+
+def scan_exact(hash_map: HashMap, name: str) -> list[Player]:
+    return [player for player in hash_map if player.name == name]
+
+
+def scan_prefix(hash_map: HashMap, prefix: str) -> list[Player]:
+    return sorted((player for player in hash_map if player.name.startswith(prefix)), key=lambda player: player.name)
+
+
+def queries_per_second(search, target, queries: list[str]) -> tuple[float, int]:
+    found = 0
+    start = time.perf_counter()
+    for query in queries:
+        found += len(search(target, query))
+    return len(queries) / (time.perf_counter() - start), found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200, help="Number of indexed lookups of each kind")
+    parser.add_argument("--scans", type=int, default=5, help="Number of full scans of each kind, as they are slow")
+    parser.add_argument("--updates", type=int, default=100_000, help="Number of adds and puts timed with the index")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", random_name(rng)) for i in range(args.players)]
+    hash_map = HashMap.from_players(players)
+
+    start = time.perf_counter()
+    index = NameIndex(hash_map)
+    print(f"Indexed {len(index):,} players under {len(index.names()):,} names in "
+          f"{time.perf_counter() - start:.2f}s")
+
+    exact = [rng.choice(players).name for _ in range(args.queries)]
+    # e.g. "SamWalker12" matches "SamWalker12", "SamWalker120" ... "SamWalker129"
+    prefixes = [name[:-1] for name in exact]
+
+    print(f"{'search':<16}{'queries/s':>14}{'matches/query':>16}")
+    for label, search, target, queries in [
+        ("scan exact", scan_exact, hash_map, exact[:args.scans]),
+        ("index exact", NameIndex.find, index, exact),
+        ("scan prefix", scan_prefix, hash_map, prefixes[:args.scans]),
+        ("index prefix", NameIndex.find_prefix, index, prefixes),
+    ]:
+        rate, found = queries_per_second(search, target, queries)
+        print(f"{label:<16}{rate:>14,.1f}{found / len(queries):>16.1f}")
+
+    updates = [Player(f"NEW-{i}", random_name(rng)) for i in range(args.updates)]
+    renames = [(rng.choice(players).uid, random_name(rng)) for _ in range(args.updates)]
+    print(f"{'update':<16}{'without index':>16}{'with index':>14}")
+    for label in ("add", "put"):
+        rates = []
+        for attached in (False, True):
+            target = HashMap.from_players(players)
+            # Leave resizing out of it, it costs the same with or without the index
+            target.reserve(len(players) + len(updates))
+            if attached:
+                NameIndex(target)
+
+            start = time.perf_counter()
+            if label == "add":
+                for player in updates:
+                    target.add(player)
+            else:
+                for uid, name in renames:
+                    target.put(uid, name)
+            rates.append(args.updates / (time.perf_counter() - start))
+        print(f"{label:<16}{rates[0]:>14,.0f}/s{rates[1]:>12,.0f}/s")
+
+
+if __name__ == '__main__':
+    main()
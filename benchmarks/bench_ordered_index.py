@@ -0,0 +1,95 @@
+"""
+Compare an OrderedIndex against sorting the players on demand, as leaderboard and admin pages had to: listing every
+player in uid order, scanning a range of uids, and finding the smallest and largest uid. Also reports what keeping
+the index costs: building it, and add and remove with it attached.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ordered_index --players 1000000 --range 100
+"""
+import argparse
+import random
+import time
+from bisect import bisect_left
+
+from src.hash_map import HashMap
+from src.ordered_index import OrderedIndex
+from src.player import Player
+
+
+def sorted_range(hash_map: HashMap, low: str, high: str) -> list:
+    players = sorted(hash_map, key=lambda player: player.uid)
+    uids = [player.uid for player in players]
+    return players[bisect_left(uids, low):bisect_left(uids, high)]
+
+
+def per_second(function, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--range", type=int, default=100, help="Number of players in each range scanned")
+    parser.add_argument("--queries", type=int, default=1_000, help="Number of indexed range scans")
+    parser.add_argument("--sorts", type=int, default=3, help="Number of sorts on demand, as they are slow")
+    parser.add_argument("--updates", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{rng.randrange(10 ** 12):012}", "Jane Doe") for _ in range(args.players)]
+    hash_map = HashMap.from_players(players)
+
+    start = time.perf_counter()
+    index = OrderedIndex(hash_map)
+    print(f"Indexed {len(index):,} players in {time.perf_counter() - start:.2f}s")
+
+    uids = sorted(player.uid for player in hash_map)
+    ranges = [(uids[start], uids[start + args.range])
+              for start in (rng.randrange(len(uids) - args.range) for _ in range(args.queries))]
+    low, high = ranges[0]
+    assert sorted_range(hash_map, low, high) == [player for uid, player in index.items_in_range(low, high)]
+
+    results = [
+        ("ordered iteration", per_second(lambda: sorted(hash_map, key=lambda player: player.uid), args.sorts),
+         per_second(lambda: list(index), args.sorts)),
+        (f"range of {args.range}", per_second(lambda: sorted_range(hash_map, low, high), args.sorts),
+         args.queries / sum(per_second(lambda: index.items_in_range(*bounds), 1) ** -1 for bounds in ranges)),
+        ("min and max", per_second(lambda: (min(hash_map, key=lambda player: player.uid),
+                                            max(hash_map, key=lambda player: player.uid)), args.sorts),
+         per_second(lambda: (index.min(), index.max()), args.queries)),
+    ]
+
+    print(f"{'query':<20}{'on demand/s':>14}{'indexed/s':>14}{'speedup':>12}")
+    for name, on_demand, indexed in results:
+        print(f"{name:<20}{on_demand:>14,.2f}{indexed:>14,.2f}{indexed / on_demand:>11,.0f}x")
+
+    updates = [Player(f"NEW-{i}", "Jane Doe") for i in range(args.updates)]
+    print(f"{'update':<20}{'without index':>16}{'with index':>14}")
+    rates = {"add": [], "remove": []}
+    for attached in (False, True):
+        target = HashMap.from_players(players)
+        target.reserve(len(players) + len(updates))
+        if attached:
+            OrderedIndex(target)
+
+        start = time.perf_counter()
+        for player in updates:
+            target.add(player)
+        rates["add"].append(args.updates / (time.perf_counter() - start))
+
+        start = time.perf_counter()
+        for player in updates:
+            target.remove(player.uid)
+        rates["remove"].append(args.updates / (time.perf_counter() - start))
+
+    for name, (without, with_index) in rates.items():
+        print(f"{name:<20}{without:>14,.0f}/s{with_index:>12,.0f}/s")
+
+
+if __name__ == '__main__':
+    main()
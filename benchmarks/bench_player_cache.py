@@ -0,0 +1,50 @@
+"""
+Generate a Zipf-skewed read-through load against a PlayerCache and report its hit rate and throughput.
+
+Every miss loads the player from a dictionary standing in for the database and puts it in the cache.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_player_cache --players 100000 --requests 500000 --max-entries 10000
+"""
+import argparse
+import random
+import time
+
+from benchmarks.bench_self_organizing import zipf_keys
+from src.player import Player
+from src.player_cache import PlayerCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000, help="Number of players in the database")
+    parser.add_argument("--requests", type=int, default=500_000)
+    parser.add_argument("--max-entries", type=int, default=10_000)
+    parser.add_argument("--max-age", type=float, default=None, help="Seconds a player stays cached")
+    parser.add_argument("--exponent", type=float, default=1.1, help="Zipf exponent, higher is more skewed")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    database = {f"ID-{i}": Player(f"ID-{i}", "Jane Doe") for i in range(args.players)}
+    requests = zipf_keys(list(database), args.requests, args.exponent, rng)
+
+    cache = PlayerCache(max_entries=args.max_entries, max_age=args.max_age)
+
+    start = time.perf_counter()
+    for key in requests:
+        if cache.get(key) is None:
+            cache.put(database[key])
+    elapsed = time.perf_counter() - start
+
+    stats = cache.stats()
+    print(f"requests:    {len(requests):,}")
+    print(f"hit rate:    {stats['hit_rate']:.2%}")
+    print(f"evictions:   {stats['evictions']:,}")
+    print(f"expirations: {stats['expirations']:,}")
+    print(f"requests/s:  {len(requests) / elapsed:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
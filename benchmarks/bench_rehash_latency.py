@@ -0,0 +1,62 @@
+"""
+Measure the per-operation latency of HashMap.add with stop-the-world and incremental rehashing.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rehash_latency --players 200000
+"""
+import argparse
+import gc
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def measure_add_latency(players: list[Player], incremental_rehash: bool) -> list[int]:
+    """
+    Add every player to a new HashMap, timing each call to add.
+
+    :param players: The players to add.
+    :param incremental_rehash: Passed through to HashMap.
+    :return: The latency of each add in nanoseconds.
+    """
+    hash_map = HashMap(incremental_rehash=incremental_rehash)
+    latencies = []
+
+    for player in players:
+        start = time.perf_counter_ns()
+        hash_map.add(player)
+        latencies.append(time.perf_counter_ns() - start)
+
+    return latencies
+
+
+def percentile(sorted_values: list[int], fraction: float) -> int:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000, help="Number of players to add")
+    parser.add_argument("--keep-gc", action="store_true",
+                        help="Leave the cyclic garbage collector enabled. Its pauses dominate the worst case otherwise")
+    args = parser.parse_args()
+
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+
+    if not args.keep_gc:
+        gc.disable()
+
+    print(f"{'mode':<16}{'p50 (us)':>12}{'p99 (us)':>12}{'max (us)':>12}{'total (s)':>12}")
+    for mode, incremental_rehash in (("stop-the-world", False), ("incremental", True)):
+        latencies = sorted(measure_add_latency(players, incremental_rehash))
+        print(f"{mode:<16}"
+              f"{percentile(latencies, 0.50) / 1000:>12.2f}"
+              f"{percentile(latencies, 0.99) / 1000:>12.2f}"
+              f"{latencies[-1] / 1000:>12.2f}"
+              f"{sum(latencies) / 1e9:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
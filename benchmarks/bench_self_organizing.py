@@ -0,0 +1,82 @@
+"""
+Measure the average probe length (the position of the requested player in its PlayerList) and throughput of
+HashMap.get under a Zipf-skewed workload, with and without self-organizing PlayerList's.
+
+A high max_load_factor is used so that PlayerList's are long enough for their order to matter.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_self_organizing --players 100000 --lookups 500000
+"""
+import argparse
+import itertools
+import random
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def zipf_keys(keys: list[str], count: int, exponent: float, rng: random.Random) -> list[str]:
+    """
+    Draw <count> keys where the key ranked r is requested with probability proportional to 1 / r ** exponent. The
+    ranks are assigned to the keys at random.
+
+    :return: list[str]
+    """
+    ranked = keys[:]
+    rng.shuffle(ranked)
+    cum_weights = list(itertools.accumulate(1 / rank ** exponent for rank in range(1, len(ranked) + 1)))
+    return rng.choices(ranked, cum_weights=cum_weights, k=count)
+
+
+def probe_length(hash_map: HashMap, key: str) -> int:
+    """
+    Return the position (starting at 1) of <key> in its PlayerList.
+
+    :return: int
+    """
+    hash_ = Player.pearson_hash(key)
+    node = hash_map._array[hash_ % hash_map.size].head
+    probes = 1
+    while node.key != key:
+        node = node.next
+        probes += 1
+    return probes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=500_000)
+    parser.add_argument("--exponent", type=float, default=1.1, help="Zipf exponent, higher is more skewed")
+    parser.add_argument("--load-factor", type=float, default=16, help="Average number of players per PlayerList")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    lookups = zipf_keys([player.uid for player in players], args.lookups, args.exponent, rng)
+
+    print(f"{'mode':<16}{'mean probes':>14}{'gets/s':>14}")
+    for mode in (None, HashMap.TRANSPOSE, HashMap.MOVE_TO_FRONT):
+        kwargs = {"max_load_factor": args.load_factor, "self_organizing": mode}
+
+        # One map to measure probe lengths, and an identical one to time without the measuring overhead
+        measured = HashMap.from_players(players, **kwargs)
+        probes = 0
+        for key in lookups:
+            probes += probe_length(measured, key)
+            measured.get(key)
+
+        timed = HashMap.from_players(players, **kwargs)
+        start = time.perf_counter()
+        for key in lookups:
+            timed.get(key)
+        elapsed = time.perf_counter() - start
+
+        print(f"{mode or 'none':<16}{probes / len(lookups):>14.2f}{len(lookups) / elapsed:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
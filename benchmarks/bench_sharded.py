@@ -0,0 +1,56 @@
+"""
+Measure the lookup throughput of a ShardedPlayerStore with 1 to 8 worker processes, next to a single in-process
+HashMap.
+
+Lookups are sent with get_many in batches, so every shard works on its part of a batch at the same time. Pickling the
+requests and responses happens in the one client process, so expect the scaling to flatten once the client, rather
+than the shards, is the bottleneck; larger batches push that point out.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sharded --players 200000 --lookups 400000 --batch-size 10000
+"""
+import argparse
+import os
+import random
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.sharded_player_store import ShardedPlayerStore
+
+
+def lookups_per_second(get_many, batches: list[list[str]]) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        get_many(batch)
+    return sum(map(len, batches)) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=400_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    keys = [f"ID-{rng.randrange(args.players)}" for i in range(args.lookups)]
+    batches = [keys[i:i + args.batch_size] for i in range(0, len(keys), args.batch_size)]
+
+    print(f"cpus: {os.cpu_count()}")
+    baseline = lookups_per_second(HashMap.from_players(players).get_many, batches)
+    print(f"{'in-process':>12} {baseline:>14,.0f} lookups/s")
+
+    for processes in args.processes:
+        with ShardedPlayerStore(shards=processes) as store:
+            store.add_many(players)
+            throughput = lookups_per_second(store.get_many, batches)
+        print(f"{processes:>3} shards   {throughput:>14,.0f} lookups/s")
+
+
+if __name__ == '__main__':
+    main()
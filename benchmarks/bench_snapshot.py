@@ -0,0 +1,87 @@
+"""
+Compare the cold-start cost of getting a HashMap of players back from disk: rebuilding it from a CSV file,
+unpickling it, loading a binary snapshot with HashMap.load, and opening the snapshot with MappedSnapshot for lazy
+lookups.
+
+Each method is timed up to the point where a batch of lookups has been answered, along with the size of its file.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_snapshot --players 1000000 --lookups 1000
+"""
+import argparse
+import csv
+import gc
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.snapshot import MappedSnapshot
+
+
+def from_csv(path: str) -> HashMap:
+    with open(path, newline="", encoding="utf-8") as file:
+        return HashMap.from_players(Player(uid, name) for uid, name in csv.reader(file))
+
+
+def from_pickle(path: str) -> HashMap:
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=1000, help="Lookups answered after loading")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Pickling follows every PlayerList's chain of nodes recursively
+    sys.setrecursionlimit(100_000)
+
+    rng = random.Random(args.seed)
+    hash_map = HashMap.from_players(Player(f"ID-{i}", f"Player {i}") for i in range(args.players))
+    keys = [f"ID-{rng.randrange(args.players)}" for i in range(args.lookups)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {name: os.path.join(directory, name) for name in ("players.csv", "players.pickle", "players.snapshot")}
+
+        with open(paths["players.csv"], "w", newline="", encoding="utf-8") as file:
+            csv.writer(file).writerows((player.uid, player.name) for player in hash_map)
+        with open(paths["players.pickle"], "wb") as file:
+            pickle.dump(hash_map, file, protocol=pickle.HIGHEST_PROTOCOL)
+        hash_map.save(paths["players.snapshot"])
+        del hash_map
+
+        methods = [
+            ("csv rebuild", "players.csv", from_csv),
+            ("pickle", "players.pickle", from_pickle),
+            ("HashMap.load", "players.snapshot", HashMap.load),
+            ("MappedSnapshot", "players.snapshot", MappedSnapshot),
+        ]
+
+        print(f"{'method':<16}{'file MB':>10}{'load s':>10}{'lookups s':>12}")
+        for name, file_name, load in methods:
+            gc.collect()
+            start = time.perf_counter()
+            loaded = load(paths[file_name])
+            loaded_at = time.perf_counter()
+            for key in keys:
+                loaded[key]
+            end = time.perf_counter()
+
+            size = os.path.getsize(paths[file_name]) / 1e6
+            print(f"{name:<16}{size:>10.1f}{loaded_at - start:>10.3f}{end - loaded_at:>12.4f}")
+
+            if isinstance(loaded, MappedSnapshot):
+                loaded.close()
+            del loaded
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the overhead of HashMap stats: operations per second with stats disabled, which runs the same code as a map
+that never had stats, against stats enabled. Both are run alternately several times and the best of each is
+reported, as the machine's own noise is larger than the difference being measured.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_stats --players 200000
+"""
+import argparse
+import time
+
+from src.hash_map import HashMap
+from src.hash_map_stats import to_prometheus
+from src.player import Player
+
+
+def run(players: list[Player], keys: list[str], stats: bool) -> tuple[dict[str, float], dict]:
+    hash_map = HashMap(stats=stats)
+    rates = {}
+
+    start = time.perf_counter()
+    for player in players:
+        hash_map.add(player)
+    rates["add"] = len(players) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        hash_map.get(key)
+    rates["get"] = len(keys) / (time.perf_counter() - start)
+    report = hash_map.stats_report()
+
+    start = time.perf_counter()
+    for key in keys:
+        hash_map.pop(key)
+    rates["pop"] = len(keys) / (time.perf_counter() - start)
+
+    return rates, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--prometheus", action="store_true", help="Print the Prometheus export of the last run")
+    args = parser.parse_args()
+
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    keys = [player.uid for player in players]
+
+    best = {False: {}, True: {}}
+    report = {}
+    for _ in range(args.rounds):
+        for stats in (False, True):
+            rates, report = run(players, keys, stats)
+            for operation, rate in rates.items():
+                best[stats][operation] = max(best[stats].get(operation, 0.0), rate)
+
+    print(f"{'operation':<12}{'disabled ops/s':>16}{'enabled ops/s':>16}{'overhead':>10}")
+    for operation in best[False]:
+        disabled, enabled = best[False][operation], best[True][operation]
+        print(f"{operation:<12}{disabled:>16,.0f}{enabled:>16,.0f}{disabled / enabled - 1:>10.0%}")
+
+    print(f"probes per get: {report['probes_per_get']['hit']:.2f}, chain length max {report['chain_length_max']}, "
+          f"mean {report['chain_length_mean']:.2f}, resizes {report['resizes']}")
+    if args.prometheus:
+        print(to_prometheus(report))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare the chained (PlayerList) and open addressing HashMap storage engines.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_storage --players 200000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def time_operation(operation, values) -> float:
+    """
+    Call <operation> with each of <values>.
+
+    :return: float - Operations per second.
+    """
+    start = time.perf_counter()
+    for value in values:
+        operation(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def get_missing(hash_map: HashMap, key: str):
+    try:
+        hash_map.get(key)
+    except KeyError:
+        pass
+
+
+def benchmark_storage(storage: str, players: list[Player], lookups: list[str], misses: list[str]) -> dict:
+    """
+    Measure add, get (hit and miss) and remove throughput, and the memory used by the map itself.
+
+    :return: dict
+    """
+    tracemalloc.start()
+    hash_map = HashMap(storage=storage)
+    results = {"add": time_operation(hash_map.add, players)}
+    results["bytes/player"] = tracemalloc.get_traced_memory()[0] / len(players)
+    tracemalloc.stop()
+
+    results["get hit"] = time_operation(hash_map.get, lookups)
+    results["get miss"] = time_operation(lambda key: get_missing(hash_map, key), misses)
+    results["remove"] = time_operation(hash_map.remove, [player.uid for player in players])
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200_000, help="Number of players to add")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    lookups = [player.uid for player in rng.choices(players, k=args.players)]
+    misses = [f"MISSING-{i}" for i in range(args.players)]
+
+    columns = ("add", "get hit", "get miss", "remove", "bytes/player")
+    print(f"{'storage':<18}" + "".join(f"{column:>14}" for column in columns))
+    for storage in (HashMap.STORAGE_CHAINED, HashMap.STORAGE_OPEN_ADDRESSING):
+        results = benchmark_storage(storage, players, lookups, misses)
+        print(f"{storage:<18}" + "".join(f"{results[column]:>14,.0f}" for column in columns))
+    print("add, get and remove are in operations per second")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Compare the single-probe HashMap.upsert, setdefault and pop against the get-then-add patterns they replace, which
+search the same PlayerList (or probe sequence) two or three times:
+
+- insert if missing:  get, and add on KeyError        vs  setdefault
+- insert or replace:  get, remove if found, then add  vs  upsert
+- remove and return:  get, then remove                 vs  pop
+
+Each operation is run on a fresh map pre-loaded with half of the players, with uids drawn so that about half of
+them are stored.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_upsert --players 100000 --operations 200000
+"""
+import argparse
+import random
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+
+
+def get_then_add(hash_map: HashMap, players: list[Player]):
+    for player in players:
+        try:
+            hash_map.get(player.uid)
+        except KeyError:
+            hash_map.add(player)
+
+
+def setdefault(hash_map: HashMap, players: list[Player]):
+    for player in players:
+        hash_map.setdefault(player)
+
+
+def get_remove_then_add(hash_map: HashMap, players: list[Player]):
+    for player in players:
+        try:
+            hash_map.get(player.uid)
+        except KeyError:
+            pass
+        else:
+            hash_map.remove(player.uid)
+        hash_map.add(player)
+
+
+def upsert(hash_map: HashMap, players: list[Player]):
+    for player in players:
+        hash_map.upsert(player)
+
+
+def get_then_remove(hash_map: HashMap, players: list[Player]):
+    for player in players:
+        try:
+            hash_map.get(player.uid)
+        except KeyError:
+            continue
+        hash_map.remove(player.uid)
+
+
+def pop(hash_map: HashMap, players: list[Player]):
+    for player in players:
+        hash_map.pop(player.uid, None)
+
+
+PAIRS = [
+    ("insert if missing", get_then_add, setdefault),
+    ("insert or replace", get_remove_then_add, upsert),
+    ("remove and return", get_then_remove, pop),
+]
+
+
+def operations_per_second(operation, stored: list[Player], players: list[Player], storage: str,
+                          repeat: int) -> float:
+    best = 0.0
+    for _ in range(repeat):
+        hash_map = HashMap.from_players(stored, storage=storage)
+        start = time.perf_counter()
+        operation(hash_map, players)
+        best = max(best, len(players) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000, help="Number of distinct uids")
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per pattern, the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stored = [Player(f"ID-{i}", "Jane Doe") for i in range(0, args.players, 2)]
+    players = [Player(f"ID-{rng.randrange(args.players)}", "John Doe") for _ in range(args.operations)]
+
+    print(f"{'storage':<18}{'pattern':<20}{'before ops/s':>14}{'after ops/s':>14}{'speedup':>10}")
+    for storage in (HashMap.STORAGE_CHAINED, HashMap.STORAGE_OPEN_ADDRESSING):
+        for name, before, after in PAIRS:
+            old_rate = operations_per_second(before, stored, players, storage, args.repeat)
+            new_rate = operations_per_second(after, stored, players, storage, args.repeat)
+            print(f"{storage:<18}{name:<20}{old_rate:>14,.0f}{new_rate:>14,.0f}{new_rate / old_rate:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the write throughput of a HashMap with a WriteAheadLog attached, for different fsync policies: syncing every
+change, group commits every few milliseconds, and never syncing. The last row is a HashMap without a log.
+
+Every run renames players that are already stored, with the time to close (and so sync) the log included.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_write_ahead_log --players 10000 --writes 20000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.write_ahead_log import WriteAheadLog
+
+POLICIES = [
+    ("every change", 0.0),
+    ("group 1ms", 0.001),
+    ("group 10ms", 0.01),
+    ("group 100ms", 0.1),
+    ("never", None),
+]
+
+
+def run(players: list[Player], keys: list[str], log_path: str | None, sync_interval: float | None) -> tuple[float, int]:
+    hash_map = HashMap.from_players(players)
+    log = None
+    if log_path is not None:
+        log = WriteAheadLog(log_path, sync_interval)
+        hash_map.add_listener(log)
+
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        hash_map.put(key, f"Name {i}")
+    if log is not None:
+        log.close()
+    elapsed = time.perf_counter() - start
+
+    return len(keys) / elapsed, log.syncs if log is not None else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--writes", type=int, default=20_000)
+    parser.add_argument("--directory", default=None, help="Where to write the log, a temporary directory by default")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = [Player(f"ID-{i}", "Jane Doe") for i in range(args.players)]
+    keys = [f"ID-{rng.randrange(args.players)}" for i in range(args.writes)]
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        print(f"{'policy':<14}{'writes/s':>12}{'fsyncs':>8}")
+        for name, sync_interval in POLICIES:
+            log_path = os.path.join(directory, f"{name}.log")
+            throughput, syncs = run(players, keys, log_path, sync_interval)
+            print(f"{name:<14}{throughput:>12,.0f}{syncs:>8,}")
+
+        throughput, syncs = run(players, keys, None, None)
+        print(f"{'no log':<14}{throughput:>12,.0f}{syncs:>8,}")
+
+
+if __name__ == '__main__':
+    main()
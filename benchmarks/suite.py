@@ -0,0 +1,383 @@
+"""
+Benchmark suite for catching performance regressions in HashMap, PlayerList and Player hashing.
+
+Every benchmark runs against seeded, reproducible data for each uid distribution:
+
+- sequential: "ID-0", "ID-1", ... looked up in shuffled order
+- random:     random 12 character strings looked up in shuffled order
+- zipf:       random 12 character strings looked up with Zipf-skewed frequencies, a few uids taking most lookups
+
+and reports operations per second, the p50 and p99 latency of a single operation and, for benchmarks that build a
+structure, the bytes it allocates per entry (not counting the players themselves). Throughput and latency are
+measured in separate passes, so that timing every operation does not slow down the throughput pass, with the
+garbage collector disabled during both, as timeit does. Passes are repeated until both --repeat passes and
+--min-time seconds are done, so that small sizes are not at the mercy of a single scheduler hiccup: the fastest
+throughput pass is reported, and latencies are pooled over every latency pass.
+
+PlayerList benchmarks work on chains of --chain players, the length a HashMap's PlayerList's actually have, rather
+than one list holding every player.
+
+Run from the repository root, write the results to a JSON file and compare two such files:
+
+    python -m benchmarks.suite run --sizes 1k,100k --output before.json
+    python -m benchmarks.suite run --sizes 1k,100k --output after.json
+    python -m benchmarks.suite diff before.json after.json --threshold 0.1
+
+diff exits with status 1 if any benchmark lost more than --threshold of its throughput or gained more than
+--threshold on its p99 latency. Sizes go up to 10M, which needs several GB of memory.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from itertools import accumulate
+from typing import Callable
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.player_list import PlayerList
+
+DISTRIBUTIONS = ("sequential", "random", "zipf")
+ZIPF_EXPONENT = 1.1
+UID_LENGTH = 12
+
+DEFAULT_SIZES = "1k,10k,100k"
+DEFAULT_CHAIN = 8
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_MIN_TIME = 0.5
+
+# Fields a result is identified by, and fields diff compares
+RESULT_KEY = ("benchmark", "distribution", "size")
+
+
+class Workload:
+    """
+    The uids a benchmark stores and the order it looks them up and removes them in.
+    """
+
+    def __init__(self, distribution: str, size: int, seed: int):
+        rng = random.Random(f"{distribution}-{size}-{seed}")
+
+        if distribution == "sequential":
+            self.uids: list[str] = [f"ID-{i}" for i in range(size)]
+        elif distribution in ("random", "zipf"):
+            alphabet = string.ascii_letters + string.digits
+            uids = set()
+            while len(uids) < size:
+                uids.add("".join(rng.choices(alphabet, k=UID_LENGTH)))
+            self.uids = sorted(uids)
+            rng.shuffle(self.uids)
+        else:
+            raise ValueError(f"Unknown distribution {distribution!r}")
+
+        self.players: list[Player] = [Player(uid, "Jane Doe") for uid in self.uids]
+
+        self.removals: list[str] = self.uids[:]
+        rng.shuffle(self.removals)
+
+        if distribution == "zipf":
+            # The k-th most popular uid is looked up with a frequency proportional to 1 / k ** ZIPF_EXPONENT
+            weights = accumulate(1 / rank ** ZIPF_EXPONENT for rank in range(1, size + 1))
+            self.lookups: list[str] = rng.choices(self.uids, cum_weights=list(weights), k=size)
+        else:
+            self.lookups = self.removals[:]
+            rng.shuffle(self.lookups)
+
+
+def _chains(players: list[Player], chain: int) -> list[list[Player]]:
+    return [players[start:start + chain] for start in range(0, len(players), chain)]
+
+
+# Each benchmark is set up with a Workload and the chain length, and returns (state, operation, arguments): the
+# operation is called as operation(state, argument) for every argument, on state that is created afresh for each pass
+
+def _hash_map_add(workload: Workload, chain: int):
+    return HashMap, HashMap.add, workload.players
+
+
+def _hash_map_get(workload: Workload, chain: int):
+    return lambda: HashMap.from_players(workload.players), HashMap.__getitem__, workload.lookups
+
+
+def _hash_map_delete(workload: Workload, chain: int):
+    return lambda: HashMap.from_players(workload.players), HashMap.__delitem__, workload.removals
+
+
+def _player_list_append(workload: Workload, chain: int):
+    # Every chain gets its own PlayerList, the state being a function of the chain number
+    chains = _chains(workload.players, chain)
+    arguments = [(index, player) for index, players in enumerate(chains) for player in players]
+
+    def create():
+        return [PlayerList() for players in chains]
+
+    return create, lambda lists, argument: lists[argument[0]].append(argument[1]), arguments
+
+
+def _player_list_remove(workload: Workload, chain: int):
+    chains = _chains(workload.players, chain)
+    arguments = [(index, player.uid) for index, players in enumerate(chains) for player in players]
+    random.Random(len(arguments)).shuffle(arguments)
+
+    def create():
+        lists = []
+        for players in chains:
+            player_list = PlayerList()
+            player_list.extend(players)
+            lists.append(player_list)
+        return lists
+
+    return create, lambda lists, argument: lists[argument[0]].remove(argument[1]), arguments
+
+
+def _player_pearson_hash(workload: Workload, chain: int):
+    return lambda: None, lambda state, uid: Player.pearson_hash(uid), workload.uids
+
+
+BENCHMARKS: dict[str, Callable] = {
+    "hash_map.add": _hash_map_add,
+    "hash_map.get": _hash_map_get,
+    "hash_map.delete": _hash_map_delete,
+    "player_list.append": _player_list_append,
+    "player_list.remove": _player_list_remove,
+    "player.pearson_hash": _player_pearson_hash,
+}
+
+# Benchmarks whose state grows with every operation, for which the memory allocated per entry is reported
+BUILDING = ("hash_map.add", "player_list.append")
+
+
+def _throughput(create: Callable, operation: Callable, arguments: list) -> float:
+    state = create()
+    start = time.perf_counter()
+    for argument in arguments:
+        operation(state, argument)
+    return len(arguments) / (time.perf_counter() - start)
+
+
+def _latencies(create: Callable, operation: Callable, arguments: list) -> list[int]:
+    state = create()
+    clock = time.perf_counter_ns
+    latencies = [0] * len(arguments)
+    for index, argument in enumerate(arguments):
+        start = clock()
+        operation(state, argument)
+        latencies[index] = clock() - start
+    return latencies
+
+
+def _bytes_per_entry(create: Callable, operation: Callable, arguments: list) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        state = create()
+        for argument in arguments:
+            operation(state, argument)
+        return (tracemalloc.get_traced_memory()[0] - before) / len(arguments)
+    finally:
+        tracemalloc.stop()
+
+
+def _passes(measure: Callable, repeat: int, min_time: float) -> list:
+    """
+    Call <measure> until it was called at least <repeat> times and for at least <min_time> seconds.
+
+    :param measure: Callable
+    :param repeat: int
+    :param min_time: float
+    :return: list - What every call returned.
+    """
+    results = []
+    start = time.perf_counter()
+    while len(results) < repeat or time.perf_counter() - start < min_time:
+        results.append(measure())
+    return results
+
+
+def run_benchmark(name: str, workload: Workload, chain: int, repeat: int, min_time: float, memory: bool) -> dict:
+    """
+    Run the benchmark called <name> on <workload>.
+
+    :param name: A key of BENCHMARKS.
+    :param workload: Workload
+    :param chain: The length of the PlayerList's used by PlayerList benchmarks.
+    :param repeat: The minimum number of throughput and latency passes.
+    :param min_time: The minimum number of seconds spent on throughput passes, and on latency passes.
+    :param memory: Whether to measure the bytes allocated per entry, for the benchmarks in BUILDING.
+    :return: dict - The throughput, latencies and, if measured, bytes per entry.
+    """
+    create, operation, arguments = BENCHMARKS[name](workload, chain)
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        ops = max(_passes(lambda: _throughput(create, operation, arguments), repeat, min_time))
+        latencies = []
+        for pass_latencies in _passes(lambda: _latencies(create, operation, arguments), repeat, min_time):
+            latencies += pass_latencies
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    result = {
+        "ops_per_second": ops,
+        "p50_ns": quantiles[49],
+        "p99_ns": quantiles[98],
+        "bytes_per_entry": None,
+    }
+    if memory and name in BUILDING:
+        result["bytes_per_entry"] = _bytes_per_entry(create, operation, arguments)
+    return result
+
+
+def _commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a size such as "100", "10k" or "1M".
+
+    :param size: str
+    :return: int
+    """
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    size = size.strip().lower()
+    if size[-1:] in multipliers:
+        return int(float(size[:-1]) * multipliers[size[-1]])
+    return int(size)
+
+
+def run(args: argparse.Namespace) -> dict:
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    results = []
+
+    print(f"{'benchmark':<22}{'distribution':<14}{'size':>10}{'ops/s':>14}{'p50 ns':>10}{'p99 ns':>10}"
+          f"{'B/entry':>10}")
+    for size in sizes:
+        for distribution in args.distributions:
+            workload = Workload(distribution, size, args.seed)
+            for name in args.benchmarks:
+                result = {"benchmark": name, "distribution": distribution, "size": size}
+                result.update(run_benchmark(name, workload, args.chain, args.repeat, args.min_time,
+                                            not args.no_memory))
+                results.append(result)
+
+                memory = "" if result["bytes_per_entry"] is None else f"{result['bytes_per_entry']:.1f}"
+                print(f"{name:<22}{distribution:<14}{size:>10,}{result['ops_per_second']:>14,.0f}"
+                      f"{result['p50_ns']:>10,.0f}{result['p99_ns']:>10,.0f}{memory:>10}")
+
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "chain": args.chain,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    return report
+
+
+def diff(base: dict, head: dict, threshold: float) -> list[dict]:
+    """
+    Compare the results of two runs, matched by benchmark, distribution and size.
+
+    :param base: The report of the earlier run.
+    :param head: The report of the later run.
+    :param threshold: The relative loss of throughput, or gain in p99 latency, flagged as a regression.
+    :return: list[dict] - For every result in both runs, the relative change in throughput and p99 latency and
+        whether it regressed.
+    """
+    base_results = {tuple(result[field] for field in RESULT_KEY): result for result in base["results"]}
+    changes = []
+
+    for result in head["results"]:
+        key = tuple(result[field] for field in RESULT_KEY)
+        if key not in base_results:
+            continue
+
+        old = base_results[key]
+        ops_change = result["ops_per_second"] / old["ops_per_second"] - 1
+        p99_change = result["p99_ns"] / old["p99_ns"] - 1 if old["p99_ns"] else 0.0
+        changes.append({
+            **dict(zip(RESULT_KEY, key)),
+            "ops_change": ops_change,
+            "p99_change": p99_change,
+            "regressed": ops_change < -threshold or p99_change > threshold,
+        })
+
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma separated sizes, such as 1k,10k,1M")
+    run_parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    run_parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    run_parser.add_argument("--chain", type=int, default=DEFAULT_CHAIN,
+                            help="Length of the PlayerList's used by PlayerList benchmarks")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Minimum number of passes of each kind")
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                            help="Minimum seconds spent on passes of each kind")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--no-memory", action="store_true", help="Skip the (slow) tracemalloc pass")
+    run_parser.add_argument("--output", help="Write the results to this JSON file")
+
+    diff_parser = commands.add_parser("diff", help="Compare the JSON results of two runs")
+    diff_parser.add_argument("base")
+    diff_parser.add_argument("head")
+    diff_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                             help="Relative change flagged as a regression")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        run(args)
+        return
+
+    with open(args.base) as file:
+        base = json.load(file)
+    with open(args.head) as file:
+        head = json.load(file)
+
+    changes = diff(base, head, args.threshold)
+    print(f"{'benchmark':<22}{'distribution':<14}{'size':>10}{'ops/s':>10}{'p99':>10}")
+    for change in changes:
+        flag = "  REGRESSION" if change["regressed"] else ""
+        print(f"{change['benchmark']:<22}{change['distribution']:<14}{change['size']:>10,}"
+              f"{change['ops_change']:>+10.1%}{change['p99_change']:>+10.1%}{flag}")
+
+    regressions = sum(change["regressed"] for change in changes)
+    print(f"{regressions} of {len(changes)} benchmarks regressed by more than {args.threshold:.0%}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
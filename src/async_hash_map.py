@@ -0,0 +1,139 @@
+from src.hash_map import HashMap
+from src.player import Player
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable
+
+
+class AsyncHashMap:
+    """
+    An asyncio facade over a HashMap. Single-key operations run straight away, as they only touch one PlayerList. Bulk
+    operations, resizes and iteration are split into chunks of chunk_size with an asyncio.sleep(0) after each, so that
+    other tasks on the event loop keep running while they are in progress.
+
+    The HashMap is always created with incremental rehashing, so growing it while adding players one by one never
+    rehashes every player at once either.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 1000
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs):
+        """
+        :param chunk_size: The number of players, keys or PlayerList's handled between two yields to the event loop.
+        :param kwargs: Passed through to HashMap. Only chained storage is supported.
+        """
+        if chunk_size < 1:
+            raise ValueError("AsyncHashMap.chunk_size must be at least 1")
+        if kwargs.get("storage", HashMap.STORAGE_CHAINED) != HashMap.STORAGE_CHAINED:
+            raise ValueError("AsyncHashMap only supports chained storage")
+
+        kwargs["incremental_rehash"] = True
+
+        self._chunk_size: int = chunk_size
+        self._hash_map: HashMap = HashMap(**kwargs)
+
+    @property
+    def hash_map(self) -> HashMap:
+        """
+        The underlying HashMap
+
+        :return: HashMap
+        """
+        return self._hash_map
+
+    async def get(self, key: str) -> Player:
+        """
+        Return the player with uid <key>
+
+        :param key: str
+        :return: Player
+        """
+        return self._hash_map.get(key)
+
+    async def put(self, key: str, value: Any):
+        """
+        Set the name of the player with uid <key>
+
+        :param key: str
+        :param value: Any
+        """
+        self._hash_map.put(key, value)
+
+    async def add(self, player: Player):
+        """
+        Add a player to the HashMap
+
+        :param player: Player
+        """
+        self._hash_map.add(player)
+
+    async def remove(self, key: str):
+        """
+        Remove the player with uid <key>
+
+        :param key: str
+        """
+        self._hash_map.remove(key)
+
+    async def get_many(self, keys: Iterable[str], default: Any = None) -> list[Player | Any]:
+        """
+        Return the players with each of <keys>, in the same order as <keys>, see HashMap.get_many.
+
+        :param keys: Iterable[str]
+        :param default: Returned for missing keys.
+        :return: list[Player | Any]
+        """
+        keys = list(keys)
+        results = []
+
+        for start in range(0, len(keys), self._chunk_size):
+            results.extend(self._hash_map.get_many(keys[start:start + self._chunk_size], default))
+            await asyncio.sleep(0)
+
+        return results
+
+    async def update_many(self, players: Iterable[Player]):
+        """
+        Add every player in <players> to the HashMap, see HashMap.update_many. The array is grown up front with
+        reserve, after which the players are added a chunk at a time.
+
+        :param players: The players to add.
+        """
+        players = list(players)
+        await self.reserve(len(self._hash_map) + len(players))
+
+        for start in range(0, len(players), self._chunk_size):
+            self._hash_map.update_many(players[start:start + self._chunk_size])
+            await asyncio.sleep(0)
+
+    async def reserve(self, capacity: int):
+        """
+        Grow the array, if needed, so that <capacity> players can be stored without triggering a resize. The players
+        are migrated to the new array chunk_size PlayerList's at a time.
+
+        :param capacity: int
+        """
+        await self.finish_rehash()
+        self._hash_map.reserve(capacity, incremental=True)
+        await self.finish_rehash()
+
+    async def finish_rehash(self):
+        """
+        Migrate every remaining PlayerList of an in-progress incremental rehash, chunk_size PlayerList's at a time.
+        """
+        while self._hash_map.is_rehashing:
+            self._hash_map.migrate(self._chunk_size)
+            await asyncio.sleep(0)
+
+    async def __aiter__(self) -> AsyncIterator[Player]:
+        # As with HashMap, the map must not be changed while it is being iterated over
+        for count, player in enumerate(self._hash_map, 1):
+            yield player
+            if count % self._chunk_size == 0:
+                await asyncio.sleep(0)
+
+    def __len__(self) -> int:
+        return len(self._hash_map)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._hash_map!r})"
@@ -0,0 +1,296 @@
+from src.hash_map import _MISSING, HashMap
+from src.player import Player
+
+import threading
+from contextlib import contextmanager
+from math import ceil
+from operator import itemgetter
+from typing import Any, Iterable, Iterator
+
+
+class ConcurrentHashMap(HashMap):
+    """
+    A HashMap that can be shared between threads. Instead of one lock around the whole map, the PlayerList's are
+    guarded by a fixed number of lock stripes, so threads working on PlayerList's of different stripes do not wait
+    for each other.
+
+    A key's stripe is its hash modulo the number of stripes. The array size is always kept a multiple of the number
+    of stripes, so every key in a PlayerList maps to the same stripe however the array is resized. Resizing, bulk
+    loading and anything else touching the whole map takes every stripe, always in the same order. The length is
+    kept under a lock of its own.
+
+    Iterating is weakly consistent: each PlayerList is copied under its stripe's lock, so changes made to PlayerList's
+    that have not been reached yet may or may not be seen.
+
+    Listeners are called while the changed player's stripe is held, possibly from several threads at once, so they
+    have to be thread-safe themselves.
+    """
+
+    DEFAULT_STRIPES: int = 16
+
+    def __init__(self, *args, stripes: int = DEFAULT_STRIPES, **kwargs):
+        """
+        :param stripes: The number of locks guarding the PlayerList's.
+        :param args: Passed through to HashMap.
+        :param kwargs: Passed through to HashMap. Incremental rehashing and open addressing are not supported.
+        """
+        if stripes < 1:
+            raise ValueError("ConcurrentHashMap.stripes must be at least 1")
+        if kwargs.get("incremental_rehash"):
+            raise ValueError("ConcurrentHashMap does not support incremental_rehash")
+        if kwargs.get("storage", self.STORAGE_CHAINED) != self.STORAGE_CHAINED:
+            raise ValueError("ConcurrentHashMap only supports chained storage")
+
+        self._stripe_count: int = stripes
+        # Reentrant, as whole-map operations call each other while holding every stripe
+        self._locks: list[threading.RLock] = [threading.RLock() for i in range(stripes)]
+        self._length_lock: threading.Lock = threading.Lock()
+
+        super().__init__(*args, **kwargs)
+
+    @property
+    def stripes(self) -> int:
+        """
+        The number of locks guarding the PlayerList's
+
+        :return: int
+        """
+        return self._stripe_count
+
+    def _round_size(self, size: int) -> int:
+        """
+        Round <size> up to a multiple of the number of stripes.
+
+        :param size: int
+        :return: int
+        """
+        return ceil(size / self._stripe_count) * self._stripe_count
+
+    def _init_storage(self):
+        self._min_size = self._round_size(self._min_size)
+        self._size = self._round_size(self._size)
+        super()._init_storage()
+
+    def _stripe(self, hash_: int) -> threading.RLock:
+        """
+        Return the lock guarding the PlayerList that a key hashing to <hash_> belongs in.
+
+        :param hash_: int
+        :return: threading.RLock
+        """
+        return self._locks[hash_ % self._stripe_count]
+
+    @contextmanager
+    def _all_stripes(self):
+        """
+        Hold every stripe, acquired in order so that two threads doing so can not deadlock.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def resize(self, size: int):
+        """
+        Rehash every player into a new array of at least <size> PlayerList's, rounded up to a multiple of the number
+        of stripes.
+
+        :param size: int
+        """
+        with self._all_stripes():
+            super().resize(self._round_size(size))
+
+    def _grow_if_needed(self):
+        # Checked without any locks first, so that most operations never have to take every stripe
+        if self._length > self._size * self._max_load_factor:
+            with self._all_stripes():
+                super()._grow_if_needed()
+
+    def _shrink_if_needed(self):
+        if self._min_load_factor is not None and self._length < self._size * self._min_load_factor:
+            with self._all_stripes():
+                super()._shrink_if_needed()
+
+    def _find_many(self, keys: list, hashes: list[int] = None) -> Iterator[tuple[int, Player]]:
+        if hashes is None:
+            hashes = self.hash_keys(keys)
+
+        for position, (key, hash_) in enumerate(zip(keys, hashes)):
+            # The player is read under the stripe, as a removed node may be reused by a NodePool straight away
+            with self._stripe(hash_):
+                node = self._bucket(hash_).find(key, hash_)
+                player = None if node is None else node.player
+            if player is not None:
+                yield position, player
+
+    def _probe(self, key: Any, hash_: int) -> tuple[Player | None, int]:
+        with self._stripe(hash_):
+            return super()._probe(key, hash_)
+
+    def upsert(self, value: Player) -> Player | None:
+        """
+        Add a player to the HashMap, or replace the stored player with the same uid by it, see HashMap.upsert.
+
+        :param value: Player
+        :return: Player | None - The player that was replaced, or None if the uid was not stored yet.
+        """
+        hash_ = self._hash_value(value)
+        with self._stripe(hash_):
+            node, added = self._bucket(hash_).find_or_append(value, hash_)
+
+            if added:
+                for listener in self._listeners:
+                    listener.player_added(value)
+            else:
+                old = node.player
+                node.player = value
+                for listener in self._listeners:
+                    listener.player_replaced(old, value)
+                return old
+
+        with self._length_lock:
+            self._length += 1
+
+        self._grow_if_needed()
+        return None
+
+    def setdefault(self, value: Player) -> Player:
+        """
+        Return the stored player with the uid of <value>, adding <value> first if there is none, see
+        HashMap.setdefault.
+
+        :param value: Player
+        :return: Player
+        """
+        hash_ = self._hash_value(value)
+        with self._stripe(hash_):
+            node, added = self._bucket(hash_).find_or_append(value, hash_)
+            if not added:
+                return node.player
+
+            for listener in self._listeners:
+                listener.player_added(value)
+
+        with self._length_lock:
+            self._length += 1
+
+        self._grow_if_needed()
+        return value
+
+    def pop(self, key: str, default: Any = _MISSING) -> Player | Any:
+        """
+        Remove the player with uid <key> and return it, or return <default> if there is no such player, see
+        HashMap.pop.
+
+        :param key: str
+        :param default: Returned if <key> is not stored. Without it, a missing key raises a KeyError.
+        :return: Player | Any
+        """
+        hash_ = self._hash_value(key)
+        with self._stripe(hash_):
+            bucket = self._bucket(hash_)
+            node = bucket.find(key, hash_)
+
+            if node is None:
+                if default is _MISSING:
+                    raise KeyError(key)
+                return default
+
+            player = bucket.remove_node(node)
+            for listener in self._listeners:
+                listener.player_removed(player)
+
+        with self._length_lock:
+            self._length -= 1
+
+        self._shrink_if_needed()
+        return player
+
+    def update_many(self, players: Iterable[Player], hashes: list[int] = None):
+        """
+        Add every player in <players> to the HashMap, see HashMap.update_many. Holds every stripe while doing so.
+
+        :param players: The players to add.
+        """
+        with self._all_stripes(), self._length_lock:
+            super().update_many(players, hashes)
+
+    def chain_lengths(self) -> list[int]:
+        with self._all_stripes():
+            return super().chain_lengths()
+
+    def save(self, path: str):
+        with self._all_stripes():
+            super().save(path)
+
+    def __getitem__(self, key: str) -> Any:
+        hash_ = self._hash_value(key)
+        with self._stripe(hash_):
+            bucket = self._bucket(hash_)
+            node = bucket.find(key, hash_)
+
+            if node is None:
+                raise KeyError(key)
+
+            if self._self_organizing is not None:
+                if self._self_organizing == self.MOVE_TO_FRONT:
+                    bucket.move_to_front(node)
+                else:
+                    bucket.transpose(node)
+
+            return node.player
+
+    def __setitem__(self, key: str, value: Any) -> Any:
+        hash_ = self._hash_value(key)
+        with self._stripe(hash_):
+            old_name = self._bucket(hash_).update(key, value, hash_)
+
+            for listener in self._listeners:
+                listener.player_renamed(key, old_name, value)
+
+    def _entries(self) -> Iterator[tuple[Any, Player]]:
+        """
+        Yield (key, player) for every player, copying those of each PlayerList while holding its stripe. Iteration is
+        weakly consistent: it never raises because the map changed, and players added or removed while iterating may
+        or may not be yielded. The nodes themselves never leave the lock, as a removed node may be reused by a
+        NodePool straight away.
+
+        :return: Iterator[tuple[Any, Player]]
+        """
+        # A resize swaps in a new array but leaves the PlayerList's of the old one untouched, so holding on to the
+        # current array is safe
+        array = self._array
+        for index, player_list in enumerate(array):
+            entries = []
+            with self._locks[index % self._stripe_count]:
+                node = player_list.head
+                while node is not None:
+                    entries.append((node.key, node.player))
+                    node = node.next
+            yield from entries
+
+    def _display_rows(self) -> Iterator[tuple[int, list[Player]]]:
+        # Like _entries, each PlayerList is copied under its stripe and printed once the stripe is released, so
+        # writers are never kept waiting on a slow stream
+        array = self._array
+        for index, player_list in enumerate(array):
+            with self._locks[index % self._stripe_count]:
+                players = list(player_list)
+            if players:
+                yield index, players
+
+    def _iter_keys(self) -> Iterator:
+        return map(itemgetter(0), self._entries())
+
+    def _iter_values(self) -> Iterator[Player]:
+        return map(itemgetter(1), self._entries())
+
+    def _iter_items(self) -> Iterator[tuple[Any, Player]]:
+        return self._entries()
+
+    def __repr__(self):
+        with self._all_stripes():
+            return super().__repr__()
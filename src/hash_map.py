@@ -1,20 +1,267 @@
+from src import hash_map_stats, hashing, snapshot
+from src.hash_map_views import ItemsView, KeysView, ValuesView
+from src.hashing import get_hash_function, pearson_hash_many
 from src.player_list import PlayerList
-from src.player import Player
+from src.player_node import NodePool
+from src.player import PEARSON_HASH_BITS, Player
 
-from typing import Any
+import gc
+from itertools import islice
+from math import ceil
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator
 
+# The default of pop, as None is a valid default to return
+_MISSING = object()
+
+# Read the key, the player or both from a node, for the iterators of the views
+_KEY = attrgetter("key")
+_PLAYER = attrgetter("player")
+_ITEM = attrgetter("key", "player")
+
+
+def _chain(player_list: PlayerList) -> list:
+    """
+    Return the nodes of <player_list>, collected up front so that walking them is not affected by a self-organizing
+    get moving one of them, or by a rehash migrating them.
+
+    :param player_list: PlayerList
+    :return: list[PlayerNode]
+    """
+    nodes = []
+    node = player_list.head
+    while node is not None:
+        nodes.append(node)
+        node = node.next
+    return nodes
+
+
+class HashMapListener:
+    """
+    Base class for objects that are told about every change made to a HashMap, see HashMap.add_listener. Every method
+    does nothing unless overridden.
+    """
+
+    def player_added(self, player: Player):
+        """
+        Called after <player> was added.
+
+        :param player: Player
+        """
+
+    def players_added(self, players: list[Player]):
+        """
+        Called after every player in <players> was added at once, by update_many. Calls player_added for each player
+        unless overridden.
+
+        :param players: list[Player]
+        """
+        for player in players:
+            self.player_added(player)
+
+    def player_renamed(self, key: str, old_name: str, new_name: str):
+        """
+        Called after the name of the player with uid <key> was changed from <old_name> to <new_name>.
+
+        :param key: str
+        :param old_name: str
+        :param new_name: str
+        """
+
+    def player_removed(self, player: Player):
+        """
+        Called after <player> was removed.
+
+        :param player: Player
+        """
+
+    def player_replaced(self, old: Player, new: Player):
+        """
+        Called after the stored player <old> was replaced by <new>, which has the same uid, by upsert or update_many.
+        Calls player_removed and then player_added unless overridden.
+
+        :param old: Player
+        :param new: Player
+        """
+        self.player_removed(old)
+        self.player_added(new)
 
 
 class HashMap:
     # TODO: Implement Generics
 
-    def __init__(self):
+    DEFAULT_SIZE: int = 10
+    DEFAULT_MAX_LOAD_FACTOR: float = 0.75
+    DEFAULT_GROWTH_FACTOR: float = 2.0
+    DEFAULT_REHASH_STEP: int = 4
+
+    # The number of players shown by repr, the remaining ones are only counted
+    REPR_LIMIT: int = 20
+
+    STORAGE_CHAINED: str = "chained"
+    STORAGE_OPEN_ADDRESSING: str = "open_addressing"
+
+    MOVE_TO_FRONT: str = "move_to_front"
+    TRANSPOSE: str = "transpose"
+
+    def __new__(cls, *args, storage: str = STORAGE_CHAINED, **kwargs):
+        # HashMap(storage="open_addressing") creates an OpenAddressHashMap, which shares HashMap's interface
+        if cls is HashMap and storage == cls.STORAGE_OPEN_ADDRESSING:
+            from src.open_address_hash_map import OpenAddressHashMap
+            cls = OpenAddressHashMap
+
+        return super().__new__(cls)
+
+    def __init__(self, capacity: int = None, max_load_factor: float = None,
+                 growth_factor: float = DEFAULT_GROWTH_FACTOR, min_load_factor: float = None,
+                 incremental_rehash: bool = False, rehash_step: int = DEFAULT_REHASH_STEP,
+                 hash_function: str | Callable[[Any], int] = None, storage: str = STORAGE_CHAINED,
+                 debug: bool = False, self_organizing: str = None, stats: bool = False, node_pool: int = None):
+        """
+        :param capacity: The number of players the map is expected to hold. The array is pre-sized so that this many
+            players can be added without triggering a resize.
+        :param max_load_factor: Grow the array once len(self) / self.size exceeds this value. Defaults to
+            DEFAULT_MAX_LOAD_FACTOR.
+        :param growth_factor: The factor the array is grown (or shrunk) by when resizing.
+        :param min_load_factor: Shrink the array once len(self) / self.size drops below this value. None (the default)
+            disables shrinking.
+        :param incremental_rehash: Spread rehashing over the following operations instead of rehashing every player
+            at once. The old and new arrays coexist until every PlayerList of the old array has been migrated.
+        :param rehash_step: The number of old PlayerList's migrated by each operation while incrementally rehashing.
+        :param hash_function: The hash function used to place players, either a name from hashing.HASH_FUNCTIONS or a
+            callable taking a key and returning a non-negative int. Defaults to Player.pearson_hash.
+        :param storage: How players are stored. STORAGE_CHAINED (the default) chains players in PlayerList's,
+            STORAGE_OPEN_ADDRESSING stores them in flat arrays using linear probing.
+        :param debug: Create PlayerList's in debug mode, validating every link made between their nodes.
+        :param self_organizing: Reorder a PlayerList whenever one of its players is found by get, so that frequently
+            requested players end up near the head of their PlayerList. MOVE_TO_FRONT moves the player to the head,
+            TRANSPOSE swaps it with the player before it. None (the default) never reorders.
+        :param stats: Collect stats on every operation from the start, see enable_stats.
+        :param node_pool: Keep up to this many removed nodes in a NodePool shared by every PlayerList, and reuse them
+            for the players added next, which spares allocating a node for every add when players are constantly
+            added and removed. None (the default) allocates a new node for every player added.
+        """
+        if max_load_factor is None:
+            max_load_factor = self.DEFAULT_MAX_LOAD_FACTOR
+
+        if storage not in (self.STORAGE_CHAINED, self.STORAGE_OPEN_ADDRESSING):
+            raise ValueError(f"Unknown HashMap.storage {storage!r}")
+        if self_organizing not in (None, self.MOVE_TO_FRONT, self.TRANSPOSE):
+            raise ValueError(f"Unknown HashMap.self_organizing {self_organizing!r}")
+        if max_load_factor <= 0:
+            raise ValueError("HashMap.max_load_factor must be greater than 0")
+        if growth_factor <= 1:
+            raise ValueError("HashMap.growth_factor must be greater than 1")
+        if min_load_factor is not None and not 0 <= min_load_factor < max_load_factor / growth_factor:
+            raise ValueError("HashMap.min_load_factor must be between 0 and max_load_factor / growth_factor")
+        if capacity is not None and capacity < 0:
+            raise ValueError("HashMap.capacity must not be negative")
+        if rehash_step < 1:
+            raise ValueError("HashMap.rehash_step must be at least 1")
+        if node_pool is not None and debug:
+            raise ValueError("HashMap.node_pool is not supported in debug mode")
+
+        self._max_load_factor: float = max_load_factor
+        self._min_load_factor: float | None = min_load_factor
+        self._growth_factor: float = growth_factor
+        self._incremental_rehash: bool = incremental_rehash
+        self._rehash_step: int = rehash_step
+        self._debug: bool = debug
+        self._self_organizing: str | None = self_organizing
+        self._hash_function: Callable[[Any], int] | None = None
+        if hash_function is not None:
+            self._hash_function = get_hash_function(hash_function)
+
+        self._min_size: int = self.DEFAULT_SIZE
+        if capacity is not None:
+            self._min_size = max(self.DEFAULT_SIZE, ceil(capacity / max_load_factor))
 
-        self._size: int = 10
+        self._size: int = self._min_size
         self._length: int = 0
+        # Incremented whenever a player is added or removed or the array is resized, so that iterators can tell the
+        # map changed. Gets never change it, even when they reorder a PlayerList or migrate part of a rehash
+        self._version: int = 0
+        self._listeners: list[HashMapListener] = []
+        self._stats: 'hash_map_stats.HashMapStats | None' = None
+        self._node_pool: NodePool | None = NodePool(node_pool) if node_pool is not None else None
+
+        self._init_storage()
+
+        if stats:
+            self.enable_stats()
+
+    def _init_storage(self):
+        """
+        Create the empty array of PlayerList's that players are stored in.
+        """
+        self._array: list[PlayerList] = [self._new_player_list() for i in range(self._size)]
+
+        # Only populated while incrementally rehashing. PlayerList's in _old_array before _rehash_index have already
+        # been migrated into _array. PlayerList's in _array from _fill_index onwards may still be None.
+        self._old_array: list[PlayerList | None] | None = None
+        self._old_size: int = 0
+        self._rehash_index: int = 0
+        self._fill_index: int = 0
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player], **kwargs) -> 'HashMap':
+        """
+        Create a HashMap pre-sized to hold <players> and bulk load them, see update_many.
+
+        :param players: The players to add.
+        :param kwargs: Passed through to HashMap.
+        :return: HashMap
+        """
+        players = list(players)
+        kwargs.setdefault("capacity", len(players))
+
+        hash_map = cls(**kwargs)
+        hash_map.update_many(players)
+        return hash_map
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'HashMap':
+        """
+        Create a HashMap holding every player in the snapshot at <path>, written by save. The hashes stored in the
+        snapshot are reused, so no uid is hashed again. See snapshot.MappedSnapshot to look players up without
+        loading the whole snapshot.
+
+        :param path: str
+        :param kwargs: Passed through to HashMap. The hash function is the one the snapshot was saved with, so a
+            hash_function, if given, must give the same hashes. The default pearson hash and pearson32 do.
+        :return: HashMap
+        """
+        requested = kwargs.pop("hash_function", None)
+
+        with snapshot.MappedSnapshot(path) as mapped:
+            hash_function = mapped.hash_function or None
+            if requested is not None:
+                # The default pearson hash is stored without a name, but gives the same hashes as pearson32
+                saved = mapped.hash_function or "pearson32"
+                if (snapshot.hash_function_name(get_hash_function(requested)) or "pearson32") != saved:
+                    described = repr(mapped.hash_function) if mapped.hash_function else "default"
+                    raise ValueError(f"The snapshot at {path} was saved with the {described} hash function, so "
+                                     f"hash_function must be {saved!r} or None")
+            kwargs.setdefault("capacity", len(mapped))
+            hash_map = cls(hash_function=hash_function, **kwargs)
+
+            uids, names, hashes = mapped.columns()
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # With the default hash function the stored hash is also the player's own hash
+            if hash_function is None:
+                players = list(map(Player.with_hash, uids, names, hashes))
+            else:
+                players = list(map(Player, uids, names))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        hash_map._update_hashed(players, hashes)
+        return hash_map
 
-        self._array: list[PlayerList] = [PlayerList() for i in range(self._size)]
-        
     @property
     def size(self) -> int:
         """
@@ -24,28 +271,616 @@ class HashMap:
         """
         return self._size
 
-    def _hash(self, value: str|Player) -> int:
+    @property
+    def load_factor(self) -> float:
+        """
+        The average number of players stored in each PlayerList
+
+        :return: float
+        """
+        return self._length / self._size
+
+    @property
+    def is_rehashing(self) -> bool:
         """
-        Hash a player or string using pearson hash
+        True while an incremental rehash is in progress
+
+        :return: bool
+        """
+        return self._old_array is not None
+
+    def resize(self, size: int):
+        """
+        Rehash every player into a new array of <size> PlayerList's. This always rehashes every player at once,
+        finishing any incremental rehash that is in progress first.
+
+        :param size: int
+        """
+        if size < 1:
+            raise ValueError("HashMap.size must be at least 1")
+
+        self._finish_rehash()
+        old_array = self._array
+
+        self._size = size
+        self._array = [self._new_player_list() for i in range(size)]
+        self._version += 1
+
+        for player_list in old_array:
+            # Reuse the hashes cached on the nodes rather than hashing every uid again
+            node = player_list.head
+            while node is not None:
+                self._array[node.hash % size].append(node.player, node.hash)
+                node = node.next
+
+    def reserve(self, capacity: int, incremental: bool = False):
+        """
+        Grow the array, if needed, so that <capacity> players can be stored without triggering a resize.
+
+        :param capacity: int
+        :param incremental: Start an incremental rehash, for migrate to carry out, instead of rehashing every player
+            at once. Only honoured by a map created with incremental_rehash.
+        """
+        size = ceil(capacity / self._max_load_factor)
+        if size > self._size:
+            if incremental and self._incremental_rehash:
+                self._start_rehash(size)
+            else:
+                self.resize(size)
+
+    def migrate(self, count: int):
+        """
+        Migrate up to <count> PlayerList's of an in-progress incremental rehash, if any, into the new array.
+
+        :param count: int
+        """
+        if self.is_rehashing:
+            self._rehash_some(count)
+
+    def _grow_for(self, count: int):
+        """
+        Grow the array, if needed, before adding <count> players at once. Like adding them one by one, this grows by
+        at least growth_factor, so that adding many small batches does not resize for every batch.
+
+        :param count: int
+        """
+        capacity = self._length + count
+        if capacity > self._size * self._max_load_factor:
+            self.reserve(max(capacity, ceil(self._size * self._growth_factor * self._max_load_factor)))
+
+    def _start_rehash(self, size: int):
+        """
+        Swap in a new, empty array of <size> PlayerList's and keep the current one around so that its players can
+        be migrated a few PlayerList's at a time by _rehash_some. The new PlayerList's are created as they are
+        needed, so starting a rehash does not stall either.
+
+        :param size: int
+        """
+        self._finish_rehash()
+
+        self._old_array = self._array
+        self._old_size = self._size
+        self._rehash_index = 0
+        self._fill_index = 0
+
+        self._size = size
+        self._array = [None] * size
+        self._version += 1
+
+    def _new_player_list(self) -> PlayerList:
+        """
+        Create an empty PlayerList configured like every other PlayerList of the map.
+
+        :return: PlayerList
+        """
+        return PlayerList(self._debug, pool=self._node_pool)
+
+    def _new_bucket(self, index: int) -> PlayerList:
+        """
+        Return the PlayerList at <index> in the new array, creating it if an in-progress rehash has not yet.
+
+        :param index: int
+        :return: PlayerList
+        """
+        bucket = self._array[index]
+        if bucket is None:
+            bucket = self._array[index] = self._new_player_list()
+        return bucket
+
+    def _rehash_some(self, count: int):
+        """
+        Migrate up to <count> PlayerList's from the old array into the new one.
+
+        :param count: int
+        """
+        old_array = self._old_array
+        stop = min(self._rehash_index + count, self._old_size)
+
+        for index in range(self._rehash_index, stop):
+            node = old_array[index].head
+            while node is not None:
+                self._new_bucket(node.hash % self._size).append(node.player, node.hash)
+                node = node.next
+            # Release the migrated PlayerList so its nodes can be collected before the rehash finishes
+            old_array[index] = None
+
+        self._rehash_index = stop
+
+        # Create the new array's PlayerList's at the same pace as the old array is migrated
+        fill_stop = self._size
+        if stop < self._old_size:
+            fill_stop = min(self._size, ceil(stop * self._size / self._old_size))
+
+        for index in range(self._fill_index, fill_stop):
+            self._new_bucket(index)
+        self._fill_index = fill_stop
+
+        if stop == self._old_size:
+            self._old_array = None
+            self._old_size = 0
+            self._rehash_index = 0
+
+    def _finish_rehash(self):
+        """
+        Migrate every remaining PlayerList of an in-progress incremental rehash.
+        """
+        if self._old_array is not None:
+            self._rehash_some(self._old_size)
+
+    def _resize_to(self, size: int):
+        """
+        Resize using the configured rehash mode.
+
+        :param size: int
+        """
+        if self._incremental_rehash:
+            self._start_rehash(size)
+        else:
+            self.resize(size)
+
+    def _grow_if_needed(self):
+        """
+        Grow the array if the load factor exceeds max_load_factor
+        """
+        if self._length > self._size * self._max_load_factor:
+            self._resize_to(ceil(self._size * self._growth_factor))
+
+    def _shrink_if_needed(self):
+        """
+        Shrink the array if shrinking is enabled and the load factor drops below min_load_factor. The array never
+        shrinks below the size it was created with.
+        """
+        if self._min_load_factor is None or self._size <= self._min_size:
+            return
+
+        if self._length < self._size * self._min_load_factor:
+            self._resize_to(max(self._min_size, int(self._size / self._growth_factor)))
+
+    def _hash_value(self, value: str|Player) -> int:
+        """
+        Hash a player or string using the map's hash function, pearson hash by default
 
         :param value: str|Player
         :return: int
         """
+        if self._hash_function is not None:
+            return self._hash_function(value.uid if isinstance(value, Player) else value)
+
         if isinstance(value, Player):
-            return hash(value) % self._size
+            return hash(value)
+
+        return Player.pearson_hash(value)
+
+    def new_player(self, uid: str, name: str, hash_: int) -> Player:
+        """
+        Create a player for <uid>, given the hash of <uid> as returned by hash_keys. With the default hash function
+        the map's hash of a uid is also the hash of its Player, so the player is created with it already cached.
+
+        :param uid: str
+        :param name: str
+        :param hash_: int
+        :return: Player
+        """
+        if self._hash_function is None:
+            return Player.with_hash(uid, name, hash_)
+        return Player(uid, name)
+
+    def _hash_players(self, players: list[Player]) -> list[int]:
+        """
+        Hash every player in <players> using the map's hash function, see _hash_value.
+
+        :param players: list[Player]
+        :return: list[int]
+        """
+        if self._hash_function is None:
+            return list(map(hash, players))
+
+        hash_function = self._hash_function
+        return [hash_function(player.uid) for player in players]
+
+    def _hash(self, value: str|Player) -> int:
+        """
+        Return the index of the PlayerList that <value> belongs in
+
+        :param value: str|Player
+        :return: int
+        """
+        return self._hash_value(value) % self._size
+
+    def _bucket(self, hash_: int) -> PlayerList:
+        """
+        Return the PlayerList that a key hashing to <hash_> belongs in. While incrementally rehashing, this is the
+        PlayerList in the old array if it has not been migrated yet. Each call migrates rehash_step PlayerList's of an
+        in-progress rehash.
+
+        :param hash_: The hash of the key, see _hash_value.
+        :return: PlayerList
+        """
+        if self._old_array is not None:
+            self._rehash_some(self._rehash_step)
+
+        return self._route(hash_)
+
+    def _route(self, hash_: int) -> PlayerList:
+        """
+        Return the PlayerList that a key hashing to <hash_> belongs in, like _bucket but without migrating any
+        PlayerList's of an in-progress rehash.
+
+        :param hash_: The hash of the key, see _hash_value.
+        :return: PlayerList
+        """
+        if self._old_array is not None:
+            old_index = hash_ % self._old_size
+            if old_index >= self._rehash_index:
+                return self._old_array[old_index]
 
-        return Player.pearson_hash(value) % self._size
+            return self._new_bucket(hash_ % self._size)
+
+        return self._array[hash_ % self._size]
+
+    def hash_keys(self, keys: list) -> list[int]:
+        """
+        Hash every key in <keys>. With the default pearson hash and NumPy installed, the keys are hashed in a single
+        vectorised batch. The hashes can be passed on to get_many, contains_many and update_many, so that a caller
+        checking a batch of keys before adding them only hashes each once.
+
+        :param keys: list
+        :return: list[int]
+        """
+        if self._hash_function is None and hashing.numpy is not None:
+            return pearson_hash_many(keys, PEARSON_HASH_BITS).tolist()
+
+        return [self._hash_value(key) for key in keys]
+
+    def _find_many(self, keys: list, hashes: list[int] = None) -> Iterator[tuple[int, Player]]:
+        """
+        Yield (position, player) for every key in <keys> that is stored, where position is the index of the key in
+        <keys>.
+
+        :param keys: list
+        :param hashes: The hash of every key, as returned by hash_keys, if the caller already has them.
+        :return: Iterator[tuple[int, Player]]
+        """
+        if hashes is None:
+            hashes = self.hash_keys(keys)
+
+        if self._old_array is not None:
+            self._rehash_some(self._rehash_step)
+            buckets = [self._route(hash_) for hash_ in hashes]
+        else:
+            array, size = self._array, self._size
+            buckets = [array[hash_ % size] for hash_ in hashes]
+
+        for position, (key, hash_, bucket) in enumerate(zip(keys, hashes, buckets)):
+            node = bucket.find(key, hash_)
+            if node is not None:
+                yield position, node.player
+
+    def chain_lengths(self) -> list[int]:
+        """
+        Return the number of players in each PlayerList, including those of an in-progress rehash. Each length is
+        tracked by its PlayerList, so this only costs one call per PlayerList and is cheap enough to poll.
+
+        :return: list[int]
+        """
+        return [len(player_list) for player_list in self._player_lists()]
+
+    def _player_lists(self):
+        """
+        Yield every PlayerList currently holding players, including those of an in-progress rehash.
+        """
+        if self._old_array is not None:
+            yield from islice(self._old_array, self._rehash_index, None)
+            yield from (player_list for player_list in self._array if player_list is not None)
+            return
+
+        yield from self._array
+
+    def _probe(self, key: Any, hash_: int) -> tuple[Player | None, int]:
+        """
+        Search for <key> without changing anything, counting the players compared to it on the way.
+
+        :param key: Any
+        :param hash_: The hash of <key>
+        :return: tuple[Player | None, int] - The player with uid <key>, or None if there is none, and the number of
+            players compared.
+        """
+        probes = 0
+        node = self._route(hash_).head
+        while node is not None:
+            probes += 1
+            if node.hash == hash_ and node.key == key:
+                return node.player, probes
+            node = node.next
+
+        return None, probes
+
+    @property
+    def node_pool(self) -> NodePool | None:
+        """
+        The NodePool removed nodes are kept in for reuse, or None if the map does not pool nodes
+
+        :return: NodePool | None
+        """
+        return self._node_pool
+
+    @property
+    def stats(self) -> 'hash_map_stats.HashMapStats | None':
+        """
+        The counters collected since stats were enabled, or None if they are not
+
+        :return: HashMapStats | None
+        """
+        return self._stats
+
+    def enable_stats(self):
+        """
+        Start timing every operation and counting the probes of every get and every resize, see the hash_map_stats
+        module. Maps without stats enabled pay nothing for it, as the instrumented operations live in a subclass that
+        the map only switches to now.
+        """
+        if self._stats is None:
+            self._stats = hash_map_stats.HashMapStats()
+            self.__class__ = hash_map_stats.instrumented_class(self.__class__)
+
+    def disable_stats(self):
+        """
+        Stop collecting stats and discard the ones collected so far.
+        """
+        if self._stats is not None:
+            self.__class__ = self._uninstrumented_class
+            self._stats = None
+
+    def stats_report(self) -> dict:
+        """
+        Return the layout of the map, namely its length, size, load factor, the length of its longest chain and the
+        mean length of its non-empty chains, and how many chains hold each number of players. With stats enabled, the
+        counters of HashMapStats.as_dict are included as well. See hash_map_stats.to_prometheus to export it.
+
+        :return: dict
+        """
+        lengths = self.chain_lengths()
+        occupancy = {}
+        for length in lengths:
+            occupancy[length] = occupancy.get(length, 0) + 1
+        non_empty = len(lengths) - occupancy.get(0, 0)
+
+        report = {
+            "players": len(self),
+            "size": self._size,
+            "load_factor": self.load_factor,
+            "chain_length_max": max(lengths, default=0),
+            "chain_length_mean": sum(lengths) / non_empty if non_empty else 0.0,
+            "occupancy": dict(sorted(occupancy.items())),
+        }
+
+        if self._stats is not None:
+            report.update(self._stats.as_dict())
+        return report
+
+    def _hashed_players(self) -> Iterator[tuple[Player, int]]:
+        """
+        Yield (player, hash) for every player, reusing the hashes cached on the nodes.
+
+        :return: Iterator[tuple[Player, int]]
+        """
+        for player_list in self._player_lists():
+            node = player_list.head
+            while node is not None:
+                yield node.player, node.hash
+                node = node.next
+
+    def add_listener(self, listener: HashMapListener):
+        """
+        Tell <listener> about every player added, renamed or removed from now on.
+
+        :param listener: HashMapListener
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: HashMapListener):
+        """
+        Stop telling <listener> about changes.
+
+        :param listener: HashMapListener
+        """
+        self._listeners.remove(listener)
 
     def add(self, value: Player):
         """
-        Add a player to the HashMap
+        Add a player to the HashMap, replacing the stored player with the same uid if there is one, see upsert.
 
         :param value: Player
         """
-        index: int = self._hash(value)
         # TODO: Decide whether to convert the value into a Player
-        self._array[index].append(value)
-        self._length += 1
+        self.upsert(value)
+
+    def upsert(self, value: Player) -> Player | None:
+        """
+        Add a player to the HashMap, or replace the stored player with the same uid by it. The PlayerList is searched
+        only once, so this is cheaper than checking whether the uid is stored before adding or replacing the player.
+
+        :param value: Player
+        :return: Player | None - The player that was replaced, or None if the uid was not stored yet.
+        """
+        hash_ = self._hash_value(value)
+        node, added = self._bucket(hash_).find_or_append(value, hash_)
+
+        if added:
+            self._length += 1
+            self._version += 1
+            for listener in self._listeners:
+                listener.player_added(value)
+
+            self._grow_if_needed()
+            return None
+
+        old = node.player
+        node.player = value
+        for listener in self._listeners:
+            listener.player_replaced(old, value)
+        return old
+
+    def setdefault(self, value: Player) -> Player:
+        """
+        Return the stored player with the uid of <value>, adding <value> first if there is none. Like upsert, the
+        PlayerList is searched only once.
+
+        :param value: Player
+        :return: Player - The stored player, which is <value> if it was just added.
+        """
+        hash_ = self._hash_value(value)
+        node, added = self._bucket(hash_).find_or_append(value, hash_)
+
+        if added:
+            self._length += 1
+            self._version += 1
+            for listener in self._listeners:
+                listener.player_added(value)
+
+            self._grow_if_needed()
+
+        return node.player
+
+    def pop(self, key: str, default: Any = _MISSING) -> Player | Any:
+        """
+        Remove the player with uid <key> and return it, or return <default> if there is no such player.
+
+        :param key: str
+        :param default: Returned if <key> is not stored. Without it, a missing key raises a KeyError.
+        :return: Player | Any
+        """
+        hash_ = self._hash_value(key)
+        bucket = self._bucket(hash_)
+        node = bucket.find(key, hash_)
+
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        player = bucket.remove_node(node)
+        self._length -= 1
+        self._version += 1
+
+        for listener in self._listeners:
+            listener.player_removed(player)
+
+        self._shrink_if_needed()
+        return player
+
+    def update_many(self, players: Iterable[Player], hashes: list[int] = None):
+        """
+        Add every player in <players> to the HashMap, replacing stored players with the same uid like upsert. The array
+        is grown once up front and the players are hashed in a single batch, which is much faster than calling add for
+        every player.
+
+        :param players: The players to add.
+        :param hashes: The hash of every player's uid, as returned by hash_keys, if the caller already has them.
+        """
+        players = list(players)
+        self._update_hashed(players, self._hash_players(players) if hashes is None else hashes)
+
+    def _update_hashed(self, players: list[Player], hashes: Iterable[int]):
+        """
+        Add every player in <players> to the HashMap, given the hash of each, see update_many.
+
+        :param players: list[Player]
+        :param hashes: The hash of every player, in the same order as <players>.
+        """
+        # Every node allocated would otherwise count towards triggering the cyclic garbage collector, which then
+        # repeatedly traverses the (growing) map without finding anything to collect
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        added, replaced = [], []
+        try:
+            self._finish_rehash()
+            self._grow_for(len(players))
+
+            array, size = self._array, self._size
+            for player, hash_ in zip(players, hashes):
+                node, is_new = array[hash_ % size].find_or_append(player, hash_)
+                if is_new:
+                    added.append(player)
+                else:
+                    replaced.append((node.player, player))
+                    node.player = player
+
+            self._length += len(added)
+            self._version += 1
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        self._notify_bulk(added, replaced)
+
+    def _notify_bulk(self, added: list[Player], replaced: list[tuple[Player, Player]]):
+        """
+        Tell every listener about the players added and replaced by a bulk load.
+
+        :param added: list[Player]
+        :param replaced: list[tuple[Player, Player]] - Every (old, new) pair of replaced players.
+        """
+        for listener in self._listeners:
+            if added:
+                listener.players_added(added)
+            for old, new in replaced:
+                listener.player_replaced(old, new)
+
+    def get_many(self, keys: Iterable[str], default: Any = None, hashes: list[int] = None) -> list[Player | Any]:
+        """
+        Return the players with each of <keys>, in the same order as <keys>, with <default> in place of any key that
+        is not stored. Much faster than calling get for each key, see hash_keys and _find_many. Unlike get, this
+        never reorders self-organizing PlayerList's.
+
+        :param keys: Iterable[str]
+        :param default: Returned for missing keys.
+        :param hashes: The hash of every key, as returned by hash_keys, if the caller already has them.
+        :return: list[Player | Any]
+        """
+        keys = list(keys)
+        results = [default] * len(keys)
+
+        for position, player in self._find_many(keys, hashes):
+            results[position] = player
+
+        return results
+
+    def contains_many(self, keys: Iterable[str], hashes: list[int] = None) -> list[bool]:
+        """
+        Return whether each of <keys> is stored, in the same order as <keys>.
+
+        :param keys: Iterable[str]
+        :param hashes: The hash of every key, as returned by hash_keys, if the caller already has them.
+        :return: list[bool]
+        """
+        keys = list(keys)
+        results = [False] * len(keys)
+
+        for position, player in self._find_many(keys, hashes):
+            results[position] = True
+
+        return results
 
     def put(self, key: str, value: Any):
         """
@@ -74,47 +909,184 @@ class HashMap:
         """
         return self.__delitem__(key)
 
-    def display(self):
+    def save(self, path: str):
         """
-        Print the content of the HashMap
+        Write every player to a binary snapshot at <path>, see the snapshot module. It can be read back with load, or
+        opened with snapshot.MappedSnapshot. Hashes are stored in the snapshot, so the HashMap must use the default
+        hash function or one from hashing.HASH_FUNCTIONS.
+
+        :param path: str
         """
-        message = f"{self.__class__.__name__}({', '.join([f'{index}: {player_list}' for index, player_list in enumerate(self._array)])})"
-        print(message)
+        snapshot.write_snapshot(path, self._hashed_players(), snapshot.hash_function_name(self._hash_function))
+
+    def keys(self) -> KeysView:
+        """
+        Return a view of the uids stored, see the hash_map_views module.
+
+        :return: KeysView
+        """
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        """
+        Return a view of the players stored, see the hash_map_views module.
+
+        :return: ValuesView
+        """
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        """
+        Return a view of the (uid, player) pairs stored, see the hash_map_views module.
+
+        :return: ItemsView
+        """
+        return ItemsView(self)
+
+    def _nodes(self, version: int) -> Iterator:
+        """
+        Yield every node, following the links between the nodes of each PlayerList rather than copying them. Like
+        iterating a dict, adding or removing a player or resizing while iterating raises a RuntimeError. Getting
+        players while iterating is fine, even when it reorders a PlayerList or migrates part of a rehash.
+
+        :param version: The version of the map when the iteration started.
+        :return: Iterator[PlayerNode]
+        """
+        if self._version != version:
+            raise RuntimeError("HashMap changed during iteration")
+
+        array, old_array = self._array, self._old_array
+        if old_array is None and self._self_organizing is None:
+            for player_list in array:
+                node = player_list.head
+                while node is not None:
+                    yield node
+                    if self._version != version:
+                        raise RuntimeError("HashMap changed during iteration")
+                    node = node.next
+            return
+
+        # The PlayerList's left in the old array are walked first. A get may migrate some of them while iterating,
+        # copying their players into the new array, so the new array then only yields the players of those migrated
+        # before the iteration started or before it reached them
+        old_size, start = self._old_size, self._rehash_index
+        skipped = set()
+        if old_array is not None:
+            for index in range(start, old_size):
+                player_list = old_array[index]
+                if player_list is None:
+                    skipped.add(index)
+                    continue
+                for node in _chain(player_list):
+                    yield node
+                    if self._version != version:
+                        raise RuntimeError("HashMap changed during iteration")
+
+        for player_list in array:
+            if player_list is None:
+                continue
+            for node in _chain(player_list):
+                if old_array is not None:
+                    origin = node.hash % old_size
+                    if origin >= start and origin not in skipped:
+                        continue
+                yield node
+                if self._version != version:
+                    raise RuntimeError("HashMap changed during iteration")
+
+    def _iter_keys(self) -> Iterator:
+        return map(_KEY, self._nodes(self._version))
+
+    def _iter_values(self) -> Iterator[Player]:
+        return map(_PLAYER, self._nodes(self._version))
+
+    def _iter_items(self) -> Iterator[tuple[Any, Player]]:
+        return map(_ITEM, self._nodes(self._version))
+
+    def _display_rows(self) -> Iterator[tuple[int | str, list[Player]]]:
+        """
+        Yield (index, players) for every PlayerList holding players, as printed by display. While incrementally
+        rehashing, the PlayerList's left in the old array come first, their index prefixed with "old".
+
+        :return: Iterator[tuple[int | str, list[Player]]]
+        """
+        if self._old_array is not None:
+            for index in range(self._rehash_index, self._old_size):
+                player_list = self._old_array[index]
+                if player_list:
+                    yield f"old {index}", list(player_list)
+
+        for index, player_list in enumerate(self._array):
+            if player_list:
+                yield index, list(player_list)
+
+    def display(self, limit: int = None, file=None):
+        """
+        Print the content of the HashMap, one PlayerList per line. Each line is printed as soon as it is formatted,
+        so printing a large map never renders it into a single string.
+
+        :param limit: The maximum number of players to print, None to print all of them. The players left out are
+            counted instead.
+        :param file: Where to print, sys.stdout by default.
+        """
+        print(f"{self.__class__.__name__}(", file=file)
+
+        shown = 0
+        for index, players in self._display_rows():
+            if limit is not None:
+                players = players[:limit - shown]
+                if not players:
+                    break
+            print(f"  {index}: {', '.join(map(str, players))}", file=file)
+            shown += len(players)
+
+        if shown < len(self):
+            print(f"  ... {len(self) - shown} more players", file=file)
+        print(")", file=file)
 
     # Type annotations for the return values are set as any as I have not yet decided whether I want these to return anything
     def __getitem__(self, key: str) -> Any:
-        index = self._hash(key)
+        hash_ = self._hash_value(key)
+        bucket = self._bucket(hash_)
+        node = bucket.find(key, hash_)
 
-        for player in self._array[index]:
-            if player.uid == key:
-                return player
+        if node is None:
+            raise KeyError(key)
 
-        raise KeyError(key)
+        if self._self_organizing is not None:
+            if self._self_organizing == self.MOVE_TO_FRONT:
+                bucket.move_to_front(node)
+            else:
+                bucket.transpose(node)
+
+        return node.player
 
     def __setitem__(self, key: str, value: Any) -> Any:
-        index = self._hash(key)
-        self._array[index].update(key, value)
+        hash_ = self._hash_value(key)
+        old_name = self._bucket(hash_).update(key, value, hash_)
+
+        for listener in self._listeners:
+            listener.player_renamed(key, old_name, value)
 
     def __delitem__(self, key: str) -> Any:
-        index: int = self._hash(key)
-        self._array[index].remove(key)
-        self._length -= 1
+        self.pop(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self._probe(key, self._hash_value(key))[0] is not None
 
     def __len__(self) -> int:
         return self._length
 
-    def __iter__(self):
-        for linked_list in self._array:
-            for node in linked_list:
-                yield node.player
+    def __iter__(self) -> Iterator[Player]:
+        return self._iter_values()
 
     def __repr__(self):
-        key_value_map = []
-        for linked_list in self._array:
-            if not len(linked_list) == 0:
-                key_value_map.append(', '.join([f"{repr(player.uid)}: {player.name}" for player in linked_list]))
+        # Only the first REPR_LIMIT players are shown, so that the repr of a large map stays short
+        entries = [f"{key!r}: {player.name}" for key, player in islice(self._iter_items(), self.REPR_LIMIT)]
+        if len(self) > self.REPR_LIMIT:
+            entries.append(f"... {len(self) - self.REPR_LIMIT} more")
 
-        return f"{self.__class__.__name__}({', '.join(key_value_map)})"
+        return f"{self.__class__.__name__}({', '.join(entries)})"
 
 
 if __name__ == '__main__':
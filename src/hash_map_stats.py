@@ -0,0 +1,256 @@
+"""
+Opt-in instrumentation for HashMap, see HashMap.enable_stats.
+
+Maps without stats run exactly the same code as before: enabling stats swaps the map's class for an instrumented
+subclass of it, which times every operation and counts the probes of every get before handing over to the original
+class, and disabling them swaps the original class back.
+"""
+import threading
+import time
+from functools import cache
+from typing import Any, Iterable
+
+# Operations whose duration is recorded
+OPERATIONS = ("get", "put", "add", "upsert", "setdefault", "pop", "remove", "update_many")
+
+# Durations are counted in buckets of powers of two nanoseconds, the last bucket counting everything longer
+HISTOGRAM_BUCKETS = 40
+
+
+class HashMapStats:
+    """
+    The counters collected by a HashMap with stats enabled. Recording is guarded by a lock, so the same stats can be
+    updated from several threads, as a ConcurrentHashMap does.
+    """
+
+    def __init__(self):
+        self._lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Set every counter back to zero.
+        """
+        with self._lock:
+            self.gets: dict[str, int] = {"hit": 0, "miss": 0}
+            self.probes: dict[str, int] = {"hit": 0, "miss": 0}
+            self.resizes: dict[str, int] = {"grow": 0, "shrink": 0}
+            self.counts: dict[str, int] = dict.fromkeys(OPERATIONS, 0)
+            self.durations: dict[str, int] = dict.fromkeys(OPERATIONS, 0)
+            self.histograms: dict[str, list[int]] = {operation: [0] * HISTOGRAM_BUCKETS for operation in OPERATIONS}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record_get(self, hit: bool, probes: int, nanoseconds: int):
+        """
+        :param hit: Whether the key was found.
+        :param probes: The number of stored entries compared to the key.
+        :param nanoseconds: How long the get took.
+        """
+        result = "hit" if hit else "miss"
+        with self._lock:
+            self.gets[result] += 1
+            self.probes[result] += probes
+            self._record_time("get", nanoseconds)
+
+    def record_time(self, operation: str, nanoseconds: int):
+        """
+        :param operation: One of OPERATIONS.
+        :param nanoseconds: How long the operation took.
+        """
+        with self._lock:
+            self._record_time(operation, nanoseconds)
+
+    def _record_time(self, operation: str, nanoseconds: int):
+        self.counts[operation] += 1
+        self.durations[operation] += nanoseconds
+        self.histograms[operation][min(nanoseconds.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def record_resize(self, old_size: int, new_size: int):
+        """
+        :param old_size: The size of the array before resizing.
+        :param new_size: The size of the array after resizing.
+        """
+        if new_size != old_size:
+            with self._lock:
+                self.resizes["grow" if new_size > old_size else "shrink"] += 1
+
+    def as_dict(self) -> dict:
+        """
+        Return every counter, along with the average number of probes per get. Each duration histogram maps the
+        upper bound of a bucket in nanoseconds to the number of operations that took at most that long but longer
+        than the previous bound, the last bucket being unbounded (None).
+
+        :return: dict
+        """
+        with self._lock:
+            return {
+                "gets": dict(self.gets),
+                "probes": dict(self.probes),
+                "probes_per_get": {result: self.probes[result] / self.gets[result] if self.gets[result] else 0.0
+                                   for result in self.gets},
+                "resizes": dict(self.resizes),
+                "operations": {
+                    operation: {
+                        "count": self.counts[operation],
+                        "seconds": self.durations[operation] / 1e9,
+                        "histogram": {_upper_bound(bucket): count
+                                      for bucket, count in enumerate(self.histograms[operation]) if count},
+                    }
+                    for operation in OPERATIONS
+                },
+            }
+
+
+def _upper_bound(bucket: int) -> int | None:
+    """
+    Return the largest number of nanoseconds counted in <bucket>, None for the last, unbounded, bucket.
+
+    :param bucket: int
+    :return: int | None
+    """
+    return None if bucket == HISTOGRAM_BUCKETS - 1 else (1 << bucket) - 1
+
+
+class _Instrumented:
+    """
+    Mixed into the class of a HashMap with stats enabled, ahead of its own class. Each operation is timed around a
+    call to the original implementation, so nested operations, such as add calling upsert, are only counted once.
+    """
+
+    def __reduce_ex__(self, protocol):
+        # The instrumented class is created at runtime, so pickle cannot look it up by name. The map is pickled as
+        # its original class instead, and instrumented again when unpickled, its stats being part of its state
+        return _unpickle_instrumented, (self._uninstrumented_class,), self.__dict__
+
+    def _timed(self, operation: str, method, *args) -> Any:
+        start = time.perf_counter_ns()
+        try:
+            return method(*args)
+        finally:
+            self._stats.record_time(operation, time.perf_counter_ns() - start)
+
+    def __getitem__(self, key: str) -> Any:
+        start = time.perf_counter_ns()
+        player, probes = self._probe(key, self._hash_value(key))
+
+        try:
+            if player is None:
+                raise KeyError(key)
+            # Gets that reorder a PlayerList or migrate part of an incremental rehash still have to do so
+            if self._self_organizing is not None or self.is_rehashing:
+                player = super().__getitem__(key)
+            return player
+        finally:
+            self._stats.record_get(player is not None, probes, time.perf_counter_ns() - start)
+
+    def __setitem__(self, key: str, value: Any) -> Any:
+        return self._timed("put", super().__setitem__, key, value)
+
+    def __delitem__(self, key: str) -> Any:
+        self._timed("remove", super().pop, key)
+
+    def add(self, value):
+        self._timed("add", super().upsert, value)
+
+    def upsert(self, value):
+        return self._timed("upsert", super().upsert, value)
+
+    def setdefault(self, value):
+        return self._timed("setdefault", super().setdefault, value)
+
+    def pop(self, key: str, *default) -> Any:
+        return self._timed("pop", super().pop, key, *default)
+
+    def update_many(self, players: Iterable, hashes: list = None):
+        self._timed("update_many", super().update_many, players, hashes)
+
+    def resize(self, size: int):
+        old_size = self._size
+        super().resize(size)
+        self._stats.record_resize(old_size, self._size)
+
+    def _start_rehash(self, size: int):
+        old_size = self._size
+        super()._start_rehash(size)
+        self._stats.record_resize(old_size, self._size)
+
+
+@cache
+def instrumented_class(cls: type) -> type:
+    """
+    Return the instrumented subclass of the HashMap class <cls>, creating it the first time. It keeps the name of
+    <cls>, so that repr and display look the same with stats enabled.
+
+    :param cls: HashMap or a subclass of it.
+    :return: type
+    """
+    return type(cls.__name__, (_Instrumented, cls), {"_uninstrumented_class": cls, "__qualname__": cls.__qualname__})
+
+
+def _unpickle_instrumented(cls: type):
+    """
+    Create an empty instance of the instrumented subclass of <cls>, for pickle to restore the state of.
+
+    :param cls: HashMap or a subclass of it.
+    :return: HashMap
+    """
+    return object.__new__(instrumented_class(cls))
+
+
+def to_prometheus(report: dict, prefix: str = "hashmap") -> str:
+    """
+    Format a report returned by HashMap.stats_report in the Prometheus text exposition format.
+
+    :param report: dict
+    :param prefix: Prepended to the name of every metric.
+    :return: str
+    """
+    lines = []
+
+    def metric(name: str, kind: str, help_: str, samples: Iterable[tuple[str, Any]]):
+        lines.append(f"# HELP {prefix}_{name} {help_}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{prefix}_{name}{labels} {value}")
+
+    metric("players", "gauge", "Number of players stored.", [("", report["players"])])
+    metric("size", "gauge", "Number of PlayerList's or slots in the array.", [("", report["size"])])
+    metric("load_factor", "gauge", "Players per PlayerList or slot.", [("", report["load_factor"])])
+    metric("chain_length_max", "gauge", "Length of the longest chain.", [("", report["chain_length_max"])])
+    metric("chain_length_mean", "gauge", "Mean length of the non-empty chains.", [("", report["chain_length_mean"])])
+    metric("bucket_occupancy", "gauge", "Number of PlayerList's or slots by the number of players in them.",
+           [(f'{{players="{players}"}}', count) for players, count in sorted(report["occupancy"].items())])
+
+    if "gets" not in report:
+        return "\n".join(lines) + "\n"
+
+    metric("gets_total", "counter", "Number of gets, by whether the key was found.",
+           [(f'{{result="{result}"}}', count) for result, count in report["gets"].items()])
+    metric("get_probes_total", "counter", "Number of entries compared by gets, by whether the key was found.",
+           [(f'{{result="{result}"}}', count) for result, count in report["probes"].items()])
+    metric("resizes_total", "counter", "Number of times the array was resized.",
+           [(f'{{direction="{direction}"}}', count) for direction, count in report["resizes"].items()])
+
+    name = f"{prefix}_operation_duration_seconds"
+    lines.append(f"# HELP {name} Duration of HashMap operations.")
+    lines.append(f"# TYPE {name} histogram")
+    for operation, timing in report["operations"].items():
+        # Every bucket is written, including empty ones, so that the same series are exported every time
+        cumulative = 0
+        for bucket in range(HISTOGRAM_BUCKETS - 1):
+            bound = _upper_bound(bucket)
+            cumulative += timing["histogram"].get(bound, 0)
+            lines.append(f'{name}_bucket{{operation="{operation}",le="{(bound + 1) / 1e9:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{operation="{operation}",le="+Inf"}} {timing["count"]}')
+        lines.append(f'{name}_sum{{operation="{operation}"}} {timing["seconds"]}')
+        lines.append(f'{name}_count{{operation="{operation}"}} {timing["count"]}')
+
+    return "\n".join(lines) + "\n"
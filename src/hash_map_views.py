@@ -0,0 +1,93 @@
+"""
+Views over the keys, players and (key, player) pairs of a HashMap, as returned by HashMap.keys, values and items.
+
+Views hold no copy of the map: iterating one walks the map's storage directly, so it always reflects the map as it
+is, and checking membership or taking the length costs the same as it does on the map itself.
+"""
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Iterator
+
+from src.player import Player
+
+
+class HashMapView(ABC):
+    """
+    The base class of the views, sized like the HashMap they are taken from.
+    """
+
+    __slots__ = ('_hash_map',)
+
+    def __init__(self, hash_map):
+        """
+        :param hash_map: HashMap
+        """
+        self._hash_map = hash_map
+
+    def __len__(self) -> int:
+        return len(self._hash_map)
+
+    @abstractmethod
+    def __iter__(self) -> Iterator:
+        """
+        Iterate over the map's storage, see HashMap._nodes.
+        """
+
+    def __repr__(self):
+        # Only the first few entries are shown, so that the repr of a view of millions of players stays short
+        limit = self._hash_map.REPR_LIMIT
+        entries = [repr(entry) for entry in islice(self, limit)]
+        if len(self) > limit:
+            entries.append(f"... {len(self) - limit} more")
+        return f"{self.__class__.__name__}([{', '.join(entries)}])"
+
+
+class KeysView(HashMapView):
+    """
+    The uids stored in a HashMap.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator:
+        return self._hash_map._iter_keys()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._hash_map
+
+
+class ValuesView(HashMapView):
+    """
+    The players stored in a HashMap. A player is only contained if it is the very player stored under its uid.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Player]:
+        return self._hash_map._iter_values()
+
+    def __contains__(self, player: Any) -> bool:
+        if not isinstance(player, Player):
+            return False
+        hash_map = self._hash_map
+        return hash_map._probe(player.uid, hash_map._hash_value(player))[0] is player
+
+
+class ItemsView(HashMapView):
+    """
+    The (uid, player) pairs stored in a HashMap.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[tuple[Any, Player]]:
+        return self._hash_map._iter_items()
+
+    def __contains__(self, item: Any) -> bool:
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        key, player = item
+        if not isinstance(player, Player):
+            return False
+        hash_map = self._hash_map
+        return hash_map._probe(key, hash_map._hash_value(key))[0] is player
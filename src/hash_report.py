@@ -0,0 +1,128 @@
+"""
+Report how evenly a hash function spreads a set of keys across the PlayerList's of a HashMap.
+
+Run from the repository root, e.g.:
+
+    python -m src.hash_report --keys sequential --count 100000 --size 131072
+"""
+import argparse
+import random
+import string
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+from src.hashing import HASH_FUNCTIONS, get_hash_function
+
+HISTOGRAM_WIDTH = 50
+
+
+def bucket_occupancy(keys: Iterable[Any], size: int, hash_function: str | Callable[[Any], int]) -> list[int]:
+    """
+    Count the number of keys that land in each of <size> buckets.
+
+    :param keys: The keys to hash.
+    :param size: The number of buckets.
+    :param hash_function: A name from hashing.HASH_FUNCTIONS or a callable.
+    :return: list[int] - The number of keys in each bucket.
+    """
+    hash_function = get_hash_function(hash_function)
+
+    occupancy = [0] * size
+    for key in keys:
+        occupancy[hash_function(key) % size] += 1
+
+    return occupancy
+
+
+def distribution_report(keys: Iterable[Any], size: int, hash_function: str | Callable[[Any], int]) -> dict:
+    """
+    Summarise the bucket occupancy of <keys> hashed into <size> buckets.
+
+    :param keys: The keys to hash.
+    :param size: The number of buckets.
+    :param hash_function: A name from hashing.HASH_FUNCTIONS or a callable.
+    :return: dict - keys, buckets, used_buckets, collisions (keys that share a bucket with an earlier key),
+        max_chain, mean_chain (over used buckets) and histogram (chain length -> number of buckets).
+    """
+    occupancy = bucket_occupancy(keys, size, hash_function)
+
+    key_count = sum(occupancy)
+    used_buckets = sum(1 for count in occupancy if count)
+
+    return {
+        "keys": key_count,
+        "buckets": size,
+        "used_buckets": used_buckets,
+        "collisions": key_count - used_buckets,
+        "max_chain": max(occupancy, default=0),
+        "mean_chain": key_count / used_buckets if used_buckets else 0.0,
+        "histogram": dict(sorted(Counter(occupancy).items())),
+    }
+
+
+def format_report(name: str, report: dict) -> str:
+    """
+    Render a report returned by distribution_report as text, including a histogram of chain lengths.
+
+    :param name: The name of the hash function.
+    :param report: dict
+    :return: str
+    """
+    lines = [
+        f"{name}: {report['keys']} keys in {report['buckets']} buckets, {report['used_buckets']} used, "
+        f"{report['collisions']} collisions, max chain {report['max_chain']}, mean chain {report['mean_chain']:.2f}"
+    ]
+
+    largest = max(report["histogram"].values(), default=0)
+    for chain_length, buckets in report["histogram"].items():
+        bar = "#" * max(1, round(buckets / largest * HISTOGRAM_WIDTH))
+        lines.append(f"  {chain_length:>6} | {bar} {buckets}")
+
+    return "\n".join(lines)
+
+
+def generate_keys(kind: str, count: int, seed: int = 0) -> list[str]:
+    """
+    Generate <count> keys of the given kind: 'sequential' ('0', '1', ...), 'prefixed' ('ID-0', 'ID-1', ...) or
+    'random' (random 12 character strings).
+
+    :param kind: str
+    :param count: int
+    :param seed: The seed used for random keys.
+    :return: list[str]
+    """
+    if kind == "sequential":
+        return [str(i) for i in range(count)]
+    if kind == "prefixed":
+        return [f"ID-{i}" for i in range(count)]
+    if kind == "random":
+        rng = random.Random(seed)
+        alphabet = string.ascii_letters + string.digits
+        return ["".join(rng.choices(alphabet, k=12)) for _ in range(count)]
+
+    raise ValueError(f"Unknown key kind {kind!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", choices=("sequential", "prefixed", "random"), default="sequential")
+    parser.add_argument("--file", help="Read keys from this file instead, one per line")
+    parser.add_argument("--count", type=int, default=100_000, help="Number of keys to generate")
+    parser.add_argument("--size", type=int, default=131_072, help="Number of buckets")
+    parser.add_argument("--hash", dest="hash_functions", action="append", choices=sorted(HASH_FUNCTIONS),
+                        help="Hash function to report on, may be repeated. Defaults to all of them")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as file:
+            keys = [line.rstrip("\n") for line in file]
+    else:
+        keys = generate_keys(args.keys, args.count)
+
+    for name in args.hash_functions or HASH_FUNCTIONS:
+        print(format_report(name, distribution_report(keys, args.size, name)))
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+Hash functions that can be used by HashMap to turn a key into an integer.
+
+Every hash function takes a key (anything that can be converted to a string) and returns a non-negative int.
+"""
+import os
+import random
+from typing import Any, Callable, Sequence
+
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional, it is only used to hash keys in batches
+    numpy = None
+
+RANDOM_SEED = 42
+PEARSON_TABLE_COUNT = 8
+
+FNV_32_OFFSET_BASIS = 0x811c9dc5
+FNV_32_PRIME = 0x01000193
+FNV_64_OFFSET_BASIS = 0xcbf29ce484222325
+FNV_64_PRIME = 0x100000001b3
+
+MASK_32 = 0xffffffff
+MASK_64 = 0xffffffffffffffff
+
+
+def _make_pearson_table(seed: int) -> list[int]:
+    """
+    Create a permutation of the numbers 0-255. A permutation (rather than random numbers) is required for the pearson
+    hash to be well distributed.
+
+    :param seed: The seed used to shuffle the table.
+    :return: list[int]
+    """
+    table = list(range(256))
+    random.Random(seed).shuffle(table)
+    return table
+
+
+# One independent table per output byte, allowing the 8-bit pearson hash to be widened to up to 64 bits.
+pearson_tables: list[list[int]] = [_make_pearson_table(RANDOM_SEED + i) for i in range(PEARSON_TABLE_COUNT)]
+pearson_table: list[int] = pearson_tables[0]
+
+
+def key_to_bytes(key: Any) -> bytes:
+    """
+    Convert a key into the bytes that are hashed.
+
+    :param key: Any
+    :return: bytes
+    """
+    if isinstance(key, bytes):
+        return key
+    return str(key).encode("utf-8")
+
+
+def pearson_hash(key: Any, bits: int = 8) -> int:
+    """
+    Apply the pearson hash algorithm to the given key. Widths above 8 bits are produced by concatenating the
+    results of running the algorithm over the key once per byte of output, each time with a different table.
+
+    :param key: Any
+    :param bits: The width of the hash, one of 8, 16, 32 or 64.
+    :return: int
+    """
+    if bits not in (8, 16, 32, 64):
+        raise ValueError("pearson_hash bits must be one of 8, 16, 32 or 64")
+
+    key_bytes = key_to_bytes(key)
+
+    hash_ = 0
+    for table in pearson_tables[:bits // 8]:
+        byte_hash = 0
+        for byte in key_bytes:
+            byte_hash = table[byte_hash ^ byte]
+        hash_ = (hash_ << 8) | byte_hash
+
+    return hash_
+
+
+def pearson_hash_many(keys: Sequence[Any], bits: int = 8) -> 'numpy.ndarray':
+    """
+    Apply the pearson hash algorithm to every key in <keys> at once using NumPy. Returns the same hashes as calling
+    pearson_hash on each key, as an array of unsigned 64-bit ints.
+
+    The keys are packed into a zero-padded matrix with one row per key, and the table lookups are then applied to a
+    whole column (the n-th byte of every key) at a time. Keys shorter than the current column keep their hash.
+
+    :param keys: Sequence[Any]
+    :param bits: The width of the hash, one of 8, 16, 32 or 64.
+    :return: numpy.ndarray
+    """
+    if numpy is None:
+        raise ImportError("pearson_hash_many requires numpy")
+    if bits not in (8, 16, 32, 64):
+        raise ValueError("pearson_hash bits must be one of 8, 16, 32 or 64")
+
+    encoded = [key_to_bytes(key) for key in keys]
+    count = len(encoded)
+    lengths = numpy.fromiter(map(len, encoded), dtype=numpy.int64, count=count)
+    max_length = int(lengths.max()) if count else 0
+
+    flat = numpy.frombuffer(b"".join(encoded), dtype=numpy.uint8)
+    rows = numpy.repeat(numpy.arange(count), lengths)
+    columns = numpy.arange(flat.size) - numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+    matrix = numpy.zeros((count, max_length), dtype=numpy.uint8)
+    matrix[rows, columns] = flat
+
+    # Which rows still have a byte to hash at each column
+    active = [lengths > column for column in range(max_length)]
+
+    hashes = numpy.zeros(count, dtype=numpy.uint64)
+    for table in numpy.array(pearson_tables[:bits // 8], dtype=numpy.uint8):
+        byte_hashes = numpy.zeros(count, dtype=numpy.uint8)
+        for column in range(max_length):
+            byte_hashes = numpy.where(active[column], table[byte_hashes ^ matrix[:, column]], byte_hashes)
+        hashes = (hashes << numpy.uint64(8)) | byte_hashes
+
+    return hashes
+
+
+def fnv1a_hash(key: Any, bits: int = 64) -> int:
+    """
+    Apply the 32 or 64-bit FNV-1a hash algorithm to the given key.
+
+    :param key: Any
+    :param bits: The width of the hash, either 32 or 64.
+    :return: int
+    """
+    if bits == 32:
+        hash_, prime, mask = FNV_32_OFFSET_BASIS, FNV_32_PRIME, MASK_32
+    elif bits == 64:
+        hash_, prime, mask = FNV_64_OFFSET_BASIS, FNV_64_PRIME, MASK_64
+    else:
+        raise ValueError("fnv1a_hash bits must be either 32 or 64")
+
+    for byte in key_to_bytes(key):
+        hash_ = ((hash_ ^ byte) * prime) & mask
+
+    return hash_
+
+
+def _rotate_left(value: int, count: int) -> int:
+    return ((value << count) | (value >> (64 - count))) & MASK_64
+
+
+def siphash(key: Any, secret: bytes) -> int:
+    """
+    Apply SipHash-2-4 to the given key. SipHash is keyed by a secret, making it hard for anyone who does not know
+    the secret to pick keys that collide.
+
+    :param key: Any
+    :param secret: 16 bytes used to key the hash.
+    :return: A 64-bit int.
+    """
+    if len(secret) != 16:
+        raise ValueError("siphash secret must be 16 bytes long")
+
+    k0 = int.from_bytes(secret[:8], "little")
+    k1 = int.from_bytes(secret[8:], "little")
+
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def sip_round():
+        nonlocal v0, v1, v2, v3
+        v0 = (v0 + v1) & MASK_64
+        v1 = _rotate_left(v1, 13) ^ v0
+        v0 = _rotate_left(v0, 32)
+        v2 = (v2 + v3) & MASK_64
+        v3 = _rotate_left(v3, 16) ^ v2
+        v0 = (v0 + v3) & MASK_64
+        v3 = _rotate_left(v3, 21) ^ v0
+        v2 = (v2 + v1) & MASK_64
+        v1 = _rotate_left(v1, 17) ^ v2
+        v2 = _rotate_left(v2, 32)
+
+    key_bytes = key_to_bytes(key)
+    length = len(key_bytes)
+    # The final block is padded with zeros and has the message length in its last byte
+    padded = key_bytes + bytes(7 - length % 8) + bytes([length & 0xff])
+
+    for offset in range(0, len(padded), 8):
+        block = int.from_bytes(padded[offset:offset + 8], "little")
+        v3 ^= block
+        sip_round()
+        sip_round()
+        v0 ^= block
+
+    v2 ^= 0xff
+    for _ in range(4):
+        sip_round()
+
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+def make_siphash(secret: bytes = None) -> Callable[[Any], int]:
+    """
+    Create a SipHash function keyed with <secret>, or with a random secret if none is given.
+
+    :param secret: 16 bytes used to key the hash.
+    :return: Callable[[Any], int]
+    """
+    if secret is None:
+        secret = os.urandom(16)
+
+    def keyed_siphash(key: Any) -> int:
+        return siphash(key, secret)
+
+    return keyed_siphash
+
+
+HASH_FUNCTIONS: dict[str, Callable[[Any], int]] = {
+    "pearson8": lambda key: pearson_hash(key, 8),
+    "pearson16": lambda key: pearson_hash(key, 16),
+    "pearson32": lambda key: pearson_hash(key, 32),
+    "pearson64": lambda key: pearson_hash(key, 64),
+    "fnv1a32": lambda key: fnv1a_hash(key, 32),
+    "fnv1a64": lambda key: fnv1a_hash(key, 64),
+    # Keyed with a secret that is random for each process
+    "siphash": make_siphash(),
+}
+
+
+def get_hash_function(hash_function: str | Callable[[Any], int]) -> Callable[[Any], int]:
+    """
+    Look up a hash function by name, or return <hash_function> unchanged if it is already callable.
+
+    :param hash_function: One of the names in HASH_FUNCTIONS or a callable.
+    :return: Callable[[Any], int]
+    """
+    if callable(hash_function):
+        return hash_function
+
+    try:
+        return HASH_FUNCTIONS[hash_function]
+    except KeyError:
+        raise ValueError(f"Unknown hash function {hash_function!r}, expected one of {', '.join(HASH_FUNCTIONS)}")
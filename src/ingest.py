@@ -0,0 +1,240 @@
+"""
+Stream players from CSV or JSON Lines exports into a HashMap without ever holding more than one chunk of them in
+memory besides the HashMap itself.
+
+CSV files need a header row naming their columns; JSON Lines files hold one JSON object per line. Either way every
+record must fit on a single line, as files are split into chunks of lines, which can optionally be parsed by a pool
+of worker processes while the previous chunk is being added.
+"""
+import csv
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from src.hash_map import HashMap
+from src.player import Player
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+EXTENSIONS = {".csv": FORMAT_CSV, ".jsonl": FORMAT_JSONL, ".ndjson": FORMAT_JSONL}
+
+# What ingest does with a row whose uid is already stored, or appeared earlier in the file
+DUPLICATE_SKIP = "skip"
+DUPLICATE_OVERWRITE = "overwrite"
+DUPLICATE_ERROR = "error"
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def parse_csv(lines: list[str], uid_index: int, name_index: int) -> list[tuple[str, str]]:
+    """
+    Parse CSV <lines> into (uid, name) rows.
+
+    :param lines: list[str]
+    :param uid_index: The column holding the uid.
+    :param name_index: The column holding the name.
+    :return: list[tuple[str, str]]
+    """
+    return [(row[uid_index], row[name_index]) for row in csv.reader(lines) if row]
+
+
+def parse_jsonl(lines: list[str], uid_field: str, name_field: str) -> list[tuple[str, str]]:
+    """
+    Parse JSON Lines <lines> into (uid, name) rows. Uids that are not strings, such as numbers, are converted to
+    strings.
+
+    :param lines: list[str]
+    :param uid_field: The field holding the uid.
+    :param name_field: The field holding the name.
+    :return: list[tuple[str, str]]
+    """
+    rows = []
+    for line in lines:
+        if line.strip():
+            record = json.loads(line)
+            rows.append((str(record[uid_field]), record[name_field]))
+    return rows
+
+
+def _line_chunks(file: IO[str], chunk_size: int) -> Iterator[list[str]]:
+    while chunk := list(islice(file, chunk_size)):
+        yield chunk
+
+
+def read_rows(path: str, file_format: str = None, uid_field: str = "uid", name_field: str = "name",
+              chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 0) -> Iterator[list[tuple[str, str]]]:
+    """
+    Yield the (uid, name) rows of the export at <path>, in chunks of up to <chunk_size> rows and in file order.
+
+    :param path: str
+    :param file_format: FORMAT_CSV or FORMAT_JSONL. Guessed from the file extension if None.
+    :param uid_field: The column or field holding the uid.
+    :param name_field: The column or field holding the name.
+    :param chunk_size: The number of lines parsed at a time.
+    :param workers: The number of worker processes parsing chunks, 0 to parse them in this process.
+    :return: Iterator[list[tuple[str, str]]]
+    """
+    if file_format is None:
+        file_format = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if file_format is None:
+            raise ValueError(f"Can not tell the format of {path!r}, expected one of {', '.join(EXTENSIONS)}")
+    if file_format not in (FORMAT_CSV, FORMAT_JSONL):
+        raise ValueError(f"Unknown format {file_format!r}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    with open(path, newline="" if file_format == FORMAT_CSV else None, encoding="utf-8") as file:
+        if file_format == FORMAT_CSV:
+            header = next(csv.reader([file.readline()]), [])
+            try:
+                parse = partial(parse_csv, uid_index=header.index(uid_field), name_index=header.index(name_field))
+            except ValueError:
+                raise ValueError(f"{path!r} has no {uid_field!r} and {name_field!r} columns") from None
+        else:
+            parse = partial(parse_jsonl, uid_field=uid_field, name_field=name_field)
+
+        if not workers:
+            yield from map(parse, _line_chunks(file, chunk_size))
+            return
+
+        # Pool.imap would read the whole file ahead of the workers, so keep only a few chunks in flight instead
+        with multiprocessing.Pool(workers) as pool:
+            pending = deque()
+            for chunk in _line_chunks(file, chunk_size):
+                pending.append(pool.apply_async(parse, (chunk,)))
+                if len(pending) > 2 * workers:
+                    yield pending.popleft().get()
+
+            while pending:
+                yield pending.popleft().get()
+
+
+def peak_rss() -> int | None:
+    """
+    Return the peak resident set size of this process in bytes, or None where it can not be measured.
+
+    :return: int | None
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def ingest_rows(hash_map: HashMap, chunks: Iterable[list[tuple[str, str]]],
+                on_duplicate: str = DUPLICATE_ERROR, expected_rows: int = None) -> dict:
+    """
+    Add the players of every chunk of (uid, name) rows in <chunks> to <hash_map>, one chunk at a time, creating each
+    chunk's Player's only once it is reached. The uids of a chunk are hashed in a single batch, and those hashes are
+    used both to look for duplicates and, with the default hash function, as the players' own hashes.
+
+    :param hash_map: HashMap
+    :param chunks: Iterable[list[tuple[str, str]]]
+    :param on_duplicate: What to do with a row whose uid is already stored or appeared earlier: DUPLICATE_SKIP
+        keeps the first player, DUPLICATE_OVERWRITE renames it to the later row's name and DUPLICATE_ERROR raises
+        a ValueError, leaving the rows before it added.
+    :param expected_rows: The number of rows expected, if known, so that the HashMap is grown once up front instead
+        of repeatedly as the rows come in.
+    :return: dict - The number of rows read, players added, overwritten and skipped, the time taken, rows per second
+        and the peak resident set size in bytes.
+    """
+    if on_duplicate not in (DUPLICATE_SKIP, DUPLICATE_OVERWRITE, DUPLICATE_ERROR):
+        raise ValueError(f"Unknown on_duplicate policy {on_duplicate!r}")
+
+    rows = added = overwritten = skipped = 0
+    start = time.perf_counter()
+
+    if expected_rows is not None:
+        hash_map.reserve(len(hash_map) + expected_rows)
+
+    # As in HashMap.update_many, the collector would otherwise keep traversing the growing map for nothing
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for chunk in chunks:
+            rows += len(chunk)
+            chunk_added, chunk_overwritten, chunk_skipped = _ingest_chunk(hash_map, chunk, on_duplicate)
+            added += chunk_added
+            overwritten += chunk_overwritten
+            skipped += chunk_skipped
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "added": added,
+        "overwritten": overwritten,
+        "skipped": skipped,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else 0.0,
+        "peak_rss": peak_rss(),
+    }
+
+
+def _ingest_chunk(hash_map: HashMap, chunk: list[tuple[str, str]], on_duplicate: str) -> tuple[int, int, int]:
+    """
+    Add the players of a single chunk of (uid, name) rows, see ingest_rows.
+
+    :param hash_map: HashMap
+    :param chunk: list[tuple[str, str]]
+    :param on_duplicate: See ingest_rows.
+    :return: tuple[int, int, int] - The number of players added, overwritten and skipped.
+    """
+    overwritten = skipped = 0
+
+    uids = [uid for uid, name in chunk]
+    hashes = hash_map.hash_keys(uids)
+    stored = hash_map.contains_many(uids, hashes)
+
+    # Players new to the map, by uid, so that later rows of the same chunk can find them, and their hashes
+    new_players: dict[str, Player] = {}
+    new_hashes: list[int] = []
+    for (uid, name), hash_, is_stored in zip(chunk, hashes, stored):
+        if not is_stored and uid not in new_players:
+            new_players[uid] = hash_map.new_player(uid, name, hash_)
+            new_hashes.append(hash_)
+            continue
+
+        if on_duplicate == DUPLICATE_ERROR:
+            hash_map.update_many(new_players.values(), new_hashes)
+            raise ValueError(f"Duplicate uid {uid!r}")
+        elif on_duplicate == DUPLICATE_SKIP:
+            skipped += 1
+        elif uid in new_players:
+            new_players[uid].name = name
+            overwritten += 1
+        else:
+            hash_map.put(uid, name)
+            overwritten += 1
+
+    hash_map.update_many(new_players.values(), new_hashes)
+    return len(new_players), overwritten, skipped
+
+
+def ingest(hash_map: HashMap, path: str, on_duplicate: str = DUPLICATE_ERROR, expected_rows: int = None,
+           **kwargs) -> dict:
+    """
+    Stream the players of the CSV or JSON Lines export at <path> into <hash_map>, see read_rows and ingest_rows.
+
+    :param hash_map: HashMap
+    :param path: str
+    :param on_duplicate: DUPLICATE_SKIP, DUPLICATE_OVERWRITE or DUPLICATE_ERROR, see ingest_rows.
+    :param expected_rows: See ingest_rows.
+    :param kwargs: Passed through to read_rows.
+    :return: dict - See ingest_rows.
+    """
+    return ingest_rows(hash_map, read_rows(path, **kwargs), on_duplicate, expected_rows)
@@ -0,0 +1,179 @@
+"""
+A secondary index of the players in a HashMap by name, so that players can be looked up by their exact name or by a
+prefix of it without scanning the whole map.
+"""
+import threading
+from typing import Callable, Iterator
+
+from src.hash_map import HashMap, HashMapListener
+from src.player import Player
+from src.sorted_list import SortedList
+
+
+class NameIndex(HashMapListener):
+    """
+    Indexes the players of a HashMap by name, and keeps doing so as players are added, renamed and removed.
+
+    The distinct names are kept in a SortedList, searched with bisect for prefix lookups, next to a dictionary of
+    name -> {uid: player} for exact lookups. Players sharing a name are returned in the order they were indexed.
+
+    Listeners are called while a ConcurrentHashMap holds a stripe, so the index guards itself with a lock of its own.
+    """
+
+    def __init__(self, hash_map: HashMap, key: Callable[[str], str] = None):
+        """
+        Index every player already in <hash_map> and attach the index to it.
+
+        :param hash_map: HashMap
+        :param key: Applied to every name and every query before comparing them, such as str.casefold for case
+            insensitive lookups. Names are compared as they are by default.
+        """
+        self._hash_map: HashMap = hash_map
+        self._key: Callable[[str], str] | None = key
+        self._lock: threading.Lock = threading.Lock()
+
+        self._names: SortedList = SortedList()
+        self._players: dict[str, dict[object, Player]] = {}
+        self._length: int = 0
+
+        self.players_added(list(hash_map))
+        hash_map.add_listener(self)
+
+    def _normalize(self, name: str) -> str:
+        return name if self._key is None else self._key(name)
+
+    def _insert(self, player: Player) -> str | None:
+        """
+        Add <player> to the dictionary, without touching the sorted list. The lock must be held.
+
+        :param player: Player
+        :return: str | None - The player's normalized name if no other player has it yet.
+        """
+        name = self._normalize(player.name)
+        players = self._players.get(name)
+        if players is None:
+            self._players[name] = {player.uid: player}
+            self._length += 1
+            return name
+
+        if player.uid not in players:
+            self._length += 1
+        players[player.uid] = player
+        return None
+
+    def _discard(self, uid, name: str):
+        """
+        Remove the player with <uid> indexed under <name>. The lock must be held.
+
+        :param uid: The player's uid.
+        :param name: The player's name as it was indexed.
+        """
+        name = self._normalize(name)
+        players = self._players.get(name)
+        if players is None or players.pop(uid, None) is None:
+            return
+        self._length -= 1
+
+        if not players:
+            del self._players[name]
+            self._names.remove(name)
+
+    def player_added(self, player: Player):
+        with self._lock:
+            name = self._insert(player)
+            if name is not None:
+                self._names.add(name)
+
+    def players_added(self, players: list[Player]):
+        with self._lock:
+            self._names.update(name for name in map(self._insert, players) if name is not None)
+
+    def player_renamed(self, key, old_name: str, new_name: str):
+        with self._lock:
+            players = self._players.get(self._normalize(old_name))
+            player = None if players is None else players.get(key)
+            if player is None:
+                return
+
+            self._discard(key, old_name)
+            name = self._insert(player)
+            if name is not None:
+                self._names.add(name)
+
+    def player_removed(self, player: Player):
+        with self._lock:
+            self._discard(player.uid, player.name)
+
+    def player_replaced(self, old: Player, new: Player):
+        with self._lock:
+            self._discard(old.uid, old.name)
+            name = self._insert(new)
+            if name is not None:
+                self._names.add(name)
+
+    def find(self, name: str) -> list[Player]:
+        """
+        Return every player named <name>.
+
+        :param name: str
+        :return: list[Player]
+        """
+        with self._lock:
+            return list(self._players.get(self._normalize(name), {}).values())
+
+    def find_prefix(self, prefix: str, limit: int = None) -> list[Player]:
+        """
+        Return the players whose name starts with <prefix>, ordered by name.
+
+        :param prefix: str
+        :param limit: The maximum number of players to return, None for every match.
+        :return: list[Player]
+        """
+        results = []
+        with self._lock:
+            for name in self._names_from(self._normalize(prefix)):
+                for player in self._players[name].values():
+                    if limit is not None and len(results) >= limit:
+                        return results
+                    results.append(player)
+
+        return results
+
+    def names(self, prefix: str = "") -> list[str]:
+        """
+        Return every distinct indexed name starting with <prefix>, in sorted order. Names are returned as normalized
+        by key.
+
+        :param prefix: str
+        :return: list[str]
+        """
+        with self._lock:
+            return list(self._names_from(self._normalize(prefix)))
+
+    def _names_from(self, prefix: str) -> Iterator[str]:
+        """
+        Yield every distinct name starting with <prefix>. The lock must be held.
+
+        :param prefix: str
+        :return: Iterator[str]
+        """
+        for name in self._names.irange(prefix):
+            if not name.startswith(prefix):
+                return
+            yield name
+
+    def close(self):
+        """
+        Detach the index from its HashMap, after which it is no longer kept up to date.
+        """
+        self._hash_map.remove_listener(self)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return self._normalize(name) in self._players
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(names={len(self._names)})"
@@ -0,0 +1,378 @@
+from src.hash_map import _MISSING, HashMap
+from src.player import Player
+
+from itertools import compress
+from typing import Any, Iterable, Iterator
+
+
+class OpenAddressHashMap(HashMap):
+    """
+    A HashMap that stores players in flat parallel arrays of keys, hashes and players instead of chaining them in
+    PlayerList's. Collisions are resolved with linear probing, and removals shift the following entries of the probe
+    sequence back instead of leaving tombstones behind, so lookups never have to skip over removed entries.
+
+    Usually created with HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING).
+    """
+
+    # Linear probing degrades quickly as the array fills up, so grow sooner than the chained HashMap does
+    DEFAULT_MAX_LOAD_FACTOR: float = 0.6
+
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("incremental_rehash"):
+            raise ValueError("OpenAddressHashMap does not support incremental_rehash")
+        if kwargs.get("self_organizing"):
+            raise ValueError("OpenAddressHashMap does not support self_organizing")
+        if kwargs.get("node_pool") is not None:
+            raise ValueError("OpenAddressHashMap does not support node_pool, as it stores no nodes")
+
+        kwargs["storage"] = self.STORAGE_OPEN_ADDRESSING
+        super().__init__(*args, **kwargs)
+
+        if self._max_load_factor >= 1:
+            raise ValueError("OpenAddressHashMap.max_load_factor must be less than 1")
+
+    def _init_storage(self):
+        """
+        Create the empty slot arrays. A slot is empty when its hash is None.
+        """
+        self._keys: list[Any] = [None] * self._size
+        self._hashes: list[int | None] = [None] * self._size
+        self._players: list[Player | None] = [None] * self._size
+
+    @property
+    def is_rehashing(self) -> bool:
+        """
+        Always False, as players are always reinserted all at once
+
+        :return: bool
+        """
+        return False
+
+    def resize(self, size: int):
+        """
+        Reinsert every player into new arrays of <size> slots
+
+        :param size: int
+        """
+        if size <= self._length:
+            raise ValueError("OpenAddressHashMap.size must be greater than the number of players")
+
+        keys, hashes, players = self._keys, self._hashes, self._players
+
+        self._size = size
+        self._init_storage()
+        self._version += 1
+
+        for key, hash_, player in zip(keys, hashes, players):
+            if hash_ is not None:
+                self._insert(key, hash_, player)
+
+    def _find(self, key: Any, hash_: int) -> int:
+        """
+        Return the slot holding <key>, or -1 if it is not stored.
+
+        :param key: Any
+        :param hash_: The hash of <key>
+        :return: int
+        """
+        hashes, keys, size = self._hashes, self._keys, self._size
+        index = hash_ % size
+
+        while hashes[index] is not None:
+            if hashes[index] == hash_ and keys[index] == key:
+                return index
+            index = (index + 1) % size
+
+        return -1
+
+    def _find_slot(self, key: Any, hash_: int) -> tuple[int, bool]:
+        """
+        Return the slot holding <key> and True, or the empty slot that ends its probe sequence and False if it is not
+        stored, so that a missing key can be inserted without probing again.
+
+        :param key: Any
+        :param hash_: The hash of <key>
+        :return: tuple[int, bool]
+        """
+        hashes, keys, size = self._hashes, self._keys, self._size
+        index = hash_ % size
+
+        while hashes[index] is not None:
+            if hashes[index] == hash_ and keys[index] == key:
+                return index, True
+            index = (index + 1) % size
+
+        return index, False
+
+    def _probe(self, key: Any, hash_: int) -> tuple[Player | None, int]:
+        """
+        Search for <key>, counting the occupied slots compared to it on the way.
+
+        :param key: Any
+        :param hash_: The hash of <key>
+        :return: tuple[Player | None, int] - The player with uid <key>, or None if there is none, and the number of
+            slots compared.
+        """
+        hashes, keys, size = self._hashes, self._keys, self._size
+        index = hash_ % size
+        probes = 0
+
+        while hashes[index] is not None:
+            probes += 1
+            if hashes[index] == hash_ and keys[index] == key:
+                return self._players[index], probes
+            index = (index + 1) % size
+
+        return None, probes
+
+    def _insert(self, key: Any, hash_: int, player: Player):
+        """
+        Store <player> in the first empty slot of its probe sequence.
+
+        :param key: Any
+        :param hash_: The hash of <key>
+        :param player: Player
+        """
+        hashes, size = self._hashes, self._size
+        index = hash_ % size
+
+        while hashes[index] is not None:
+            index = (index + 1) % size
+
+        self._keys[index] = key
+        hashes[index] = hash_
+        self._players[index] = player
+
+    def _delete_at(self, index: int):
+        """
+        Empty the slot at <index>, shifting back any following entries that would otherwise become unreachable.
+
+        :param index: int
+        """
+        keys, hashes, players, size = self._keys, self._hashes, self._players, self._size
+
+        hole = index
+        current = index
+        while True:
+            current = (current + 1) % size
+            if hashes[current] is None:
+                break
+
+            home = hashes[current] % size
+            # The entry can stay put if its home slot lies cyclically within (hole, current]
+            if hole <= current:
+                stays = hole < home <= current
+            else:
+                stays = home > hole or home <= current
+            if stays:
+                continue
+
+            keys[hole], hashes[hole], players[hole] = keys[current], hashes[current], players[current]
+            hole = current
+
+        keys[hole] = hashes[hole] = players[hole] = None
+
+    def _store_at(self, index: int, value: Player, hash_: int):
+        """
+        Add <value> to the HashMap in the empty slot at <index>, as returned by _find_slot.
+
+        :param index: int
+        :param value: Player
+        :param hash_: The hash of the player's uid
+        """
+        self._keys[index] = value.uid
+        self._hashes[index] = hash_
+        self._players[index] = value
+        self._length += 1
+        self._version += 1
+
+        for listener in self._listeners:
+            listener.player_added(value)
+
+        self._grow_if_needed()
+
+    def upsert(self, value: Player) -> Player | None:
+        """
+        Add a player to the HashMap, or replace the stored player with the same uid by it, probing only once.
+
+        :param value: Player
+        :return: Player | None - The player that was replaced, or None if the uid was not stored yet.
+        """
+        if not isinstance(value, Player):
+            raise ValueError("HashMap can only hold instances of Player")
+
+        hash_ = self._hash_value(value)
+        index, found = self._find_slot(value.uid, hash_)
+
+        if not found:
+            self._store_at(index, value, hash_)
+            return None
+
+        old = self._players[index]
+        self._players[index] = value
+        for listener in self._listeners:
+            listener.player_replaced(old, value)
+        return old
+
+    def setdefault(self, value: Player) -> Player:
+        """
+        Return the stored player with the uid of <value>, adding <value> first if there is none, probing only once.
+
+        :param value: Player
+        :return: Player - The stored player, which is <value> if it was just added.
+        """
+        if not isinstance(value, Player):
+            raise ValueError("HashMap can only hold instances of Player")
+
+        hash_ = self._hash_value(value)
+        index, found = self._find_slot(value.uid, hash_)
+
+        if found:
+            return self._players[index]
+
+        self._store_at(index, value, hash_)
+        return value
+
+    def pop(self, key: str, default: Any = _MISSING) -> Player | Any:
+        """
+        Remove the player with uid <key> and return it, or return <default> if there is no such player.
+
+        :param key: str
+        :param default: Returned if <key> is not stored. Without it, a missing key raises a KeyError.
+        :return: Player | Any
+        """
+        index = self._find(key, self._hash_value(key))
+        if index == -1:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        player = self._players[index]
+        self._delete_at(index)
+        self._length -= 1
+        self._version += 1
+
+        for listener in self._listeners:
+            listener.player_removed(player)
+
+        self._shrink_if_needed()
+        return player
+
+    def _update_hashed(self, players: list[Player], hashes: Iterable[int]):
+        """
+        Add every player in <players> to the HashMap given the hash of each, replacing stored players with the same
+        uid, and growing the arrays once up front. Unlike add, the players are not checked to be instances of Player.
+
+        :param players: list[Player]
+        :param hashes: The hash of every player, in the same order as <players>.
+        """
+        self._grow_for(len(players))
+
+        keys, slot_hashes, slot_players = self._keys, self._hashes, self._players
+        added, replaced = [], []
+        for player, hash_ in zip(players, hashes):
+            index, found = self._find_slot(player.uid, hash_)
+            if found:
+                replaced.append((slot_players[index], player))
+            else:
+                keys[index] = player.uid
+                slot_hashes[index] = hash_
+                added.append(player)
+            slot_players[index] = player
+
+        self._length += len(added)
+        self._version += 1
+        self._notify_bulk(added, replaced)
+
+    def _hashed_players(self) -> Iterator[tuple[Player, int]]:
+        for hash_, player in zip(self._hashes, self._players):
+            if hash_ is not None:
+                yield player, hash_
+
+    def _find_many(self, keys: list, hashes: list[int] = None) -> Iterator[tuple[int, Player]]:
+        """
+        Yield (position, player) for every key in <keys> that is stored, where position is the index of the key in
+        <keys>.
+
+        :param keys: list
+        :param hashes: The hash of every key, as returned by hash_keys, if the caller already has them.
+        :return: Iterator[tuple[int, Player]]
+        """
+        if hashes is None:
+            hashes = self.hash_keys(keys)
+
+        for position, (key, hash_) in enumerate(zip(keys, hashes)):
+            index = self._find(key, hash_)
+            if index != -1:
+                yield position, self._players[index]
+
+    def chain_lengths(self) -> list[int]:
+        """
+        Return the number of players whose probe sequence starts at each slot, the open addressing equivalent of the
+        length of each PlayerList in a chained HashMap.
+
+        :return: list[int]
+        """
+        lengths = [0] * self._size
+        for hash_ in self._hashes:
+            if hash_ is not None:
+                lengths[hash_ % self._size] += 1
+        return lengths
+
+    def _occupied(self, values: Iterable) -> Iterator:
+        """
+        Return an iterator over the entries of <values>, one of the slot arrays or a combination of them, that are in
+        occupied slots. The empty slots are skipped by itertools.compress, as players are always true and empty slots
+        None, and a RuntimeError is raised if a player is added or removed, or the arrays are resized, while iterating.
+
+        :param values: Any iterable with one entry per slot.
+        :return: Iterator
+        """
+        return self._checked(compress(values, self._players), self._version)
+
+    def _checked(self, iterator: Iterator, version: int) -> Iterator:
+        """
+        Yield from <iterator> as long as the map is still at <version>.
+
+        :param iterator: Iterator
+        :param version: The version of the map when the iteration started.
+        :return: Iterator
+        """
+        if self._version != version:
+            raise RuntimeError("HashMap changed during iteration")
+        for value in iterator:
+            yield value
+            if self._version != version:
+                raise RuntimeError("HashMap changed during iteration")
+
+    def _iter_keys(self) -> Iterator:
+        return self._occupied(self._keys)
+
+    def _iter_values(self) -> Iterator[Player]:
+        return self._occupied(self._players)
+
+    def _iter_items(self) -> Iterator[tuple[Any, Player]]:
+        return self._occupied(zip(self._keys, self._players))
+
+    def _display_rows(self) -> Iterator[tuple[int, list[Player]]]:
+        for index, player in self._occupied(enumerate(self._players)):
+            yield index, [player]
+
+    def __getitem__(self, key: str) -> Any:
+        index = self._find(key, self._hash_value(key))
+        if index == -1:
+            raise KeyError(key)
+
+        return self._players[index]
+
+    def __setitem__(self, key: str, value: Any) -> Any:
+        index = self._find(key, self._hash_value(key))
+        if index == -1:
+            raise KeyError(key)
+
+        player = self._players[index]
+        old_name = player.name
+        player.name = value
+
+        for listener in self._listeners:
+            listener.player_renamed(key, old_name, value)
@@ -0,0 +1,118 @@
+"""
+An index of the players in a HashMap ordered by uid, for listing players in uid order and scanning ranges of uids
+without sorting the whole map every time.
+"""
+import threading
+from typing import Iterator
+
+from src.hash_map import HashMap, HashMapListener
+from src.player import Player
+from src.sorted_list import SortedList
+
+
+class OrderedIndex(HashMapListener):
+    """
+    Keeps the uids of the players in a HashMap in sorted order as players are added and removed. The uids are kept in
+    a SortedList, so finding the start of a range takes O(log n) and every player in it O(1) after that. Uids have to
+    be comparable with each other, such as all strings or all ints.
+
+    Listeners are called while a ConcurrentHashMap holds a stripe, so the index guards itself with a lock of its own.
+    """
+
+    def __init__(self, hash_map: HashMap):
+        """
+        Index every player already in <hash_map> and attach the index to it.
+
+        :param hash_map: HashMap
+        """
+        self._hash_map: HashMap = hash_map
+        self._lock: threading.Lock = threading.Lock()
+
+        self._uids: SortedList = SortedList()
+        self._players: dict[object, Player] = {}
+
+        self.players_added(list(hash_map))
+        hash_map.add_listener(self)
+
+    def player_added(self, player: Player):
+        with self._lock:
+            if player.uid not in self._players:
+                self._uids.add(player.uid)
+            self._players[player.uid] = player
+
+    def players_added(self, players: list[Player]):
+        uids = [player.uid for player in players]
+        with self._lock:
+            known = self._players
+            # Duplicates within <players> only appear once in the map, so only once in the index too
+            self._uids.update(dict.fromkeys(uid for uid in uids if uid not in known))
+            known.update(zip(uids, players))
+
+    def player_removed(self, player: Player):
+        with self._lock:
+            if self._players.pop(player.uid, None) is not None:
+                self._uids.remove(player.uid)
+
+    def player_replaced(self, old: Player, new: Player):
+        with self._lock:
+            self._players[new.uid] = new
+
+    def items_in_range(self, low=None, high=None) -> list[tuple[object, Player]]:
+        """
+        Return (uid, player) for every player whose uid is at least <low> and less than <high>, in uid order.
+
+        :param low: The smallest uid included, None to start from the smallest uid.
+        :param high: The uid the range stops before, None to continue until the largest uid.
+        :return: list[tuple[object, Player]]
+        """
+        with self._lock:
+            players = self._players
+            return [(uid, players[uid]) for uid in self._uids.irange(low, high, inclusive=(True, False))]
+
+    def min(self) -> Player:
+        """
+        Return the player with the smallest uid.
+
+        :return: Player
+        """
+        with self._lock:
+            if not self._uids:
+                raise ValueError("OrderedIndex.min of an empty index")
+            return self._players[self._uids[0]]
+
+    def max(self) -> Player:
+        """
+        Return the player with the largest uid.
+
+        :return: Player
+        """
+        with self._lock:
+            if not self._uids:
+                raise ValueError("OrderedIndex.max of an empty index")
+            return self._players[self._uids[-1]]
+
+    def close(self):
+        """
+        Detach the index from its HashMap, after which it is no longer kept up to date.
+        """
+        self._hash_map.remove_listener(self)
+
+    def __contains__(self, uid) -> bool:
+        return uid in self._players
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __iter__(self) -> Iterator[Player]:
+        """
+        Yield every player in uid order. The index must not change while iterating, see items_in_range otherwise.
+
+        :return: Iterator[Player]
+        """
+        return map(self._players.__getitem__, self._uids)
+
+    def __reversed__(self) -> Iterator[Player]:
+        return map(self._players.__getitem__, reversed(self._uids))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(players={len(self._players)})"
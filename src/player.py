@@ -1,10 +1,8 @@
-import random
+from src import hashing
+from src.hashing import RANDOM_SEED, pearson_table
 
-RANDOM_SEED = 42
-
-random.seed(RANDOM_SEED)
-pearson_table = list(range(256))
-random.shuffle(pearson_table)
+# Wide enough to spread millions of players, narrow enough that hash() never truncates it
+PEARSON_HASH_BITS = 32
 
 
 class Player:
@@ -13,9 +11,31 @@ class Player:
 
     """
 
+    # Slots avoid a per-instance __dict__, which matters when storing millions of players
+    __slots__ = ('__uid', '__name', '__hash')
+
     def __init__(self, uid: str, name: str):
         self.__uid = uid
         self.__name = name
+        # uid is read-only, so the hash only ever has to be computed once
+        self.__hash = self.pearson_hash(uid)
+
+    @classmethod
+    def with_hash(cls, uid: str, name: str, hash_: int) -> 'Player':
+        """
+        Create a player whose hash is already known, such as one read back from a snapshot, without hashing its uid
+        again. <hash_> must equal Player.pearson_hash(uid).
+
+        :param uid: str
+        :param name: str
+        :param hash_: int
+        :return: Player
+        """
+        player = cls.__new__(cls)
+        player.__uid = uid
+        player.__name = name
+        player.__hash = hash_
+        return player
 
     @property
     def uid(self):
@@ -32,20 +52,17 @@ class Player:
         self.__name = value
 
     @staticmethod
-    def pearson_hash(key):
+    def pearson_hash(key, bits: int = PEARSON_HASH_BITS):
         """
         Apply the pearson hash algorithm to the given key.
 
+        :param key: The key to hash.
+        :param bits: The width of the hash, one of 8, 16, 32 or 64.
         """
-        key_bytes = bytes(str(key), encoding="utf-8")
-
-        hash_ = 0
-        hash_ = sum([pearson_table[hash_ ^ byte] for byte in key_bytes])
-
-        return hash_
+        return hashing.pearson_hash(key, bits)
 
     def __hash__(self):
-        return self.pearson_hash(self.__uid)
+        return self.__hash
 
     def __str__(self):
         return f"Player(uuid={repr(self.uid)}, name={repr(self.name)})"
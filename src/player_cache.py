@@ -0,0 +1,172 @@
+from src.hash_map import HashMap
+from src.player import Player
+from src.player_list import PlayerList
+
+import time
+from typing import Any, Callable
+
+
+class _CacheEntry(Player):
+    """
+    What the HashMap of a PlayerCache stores for a cached player: the player's node in the recency PlayerList and
+    when the player expires. An entry has the uid and hash of its player, so the HashMap places it like the player.
+    """
+
+    __slots__ = ('node', 'expires_at')
+
+
+class PlayerCache:
+    """
+    A cache of recently seen players with least-recently-used and max-age eviction.
+
+    Players are looked up through a HashMap, while a PlayerList keeps them in order of use: the most recently used
+    player is at the head and the least recently used at the tail, which is where players are evicted from once
+    max_entries is exceeded. The HashMap stores each player's node in the PlayerList along with its expiry time, so a
+    hit is a single lookup followed by moving the node to the head. A player is also evicted once max_age seconds have
+    passed since it was put in the cache.
+    """
+
+    def __init__(self, max_entries: int = None, max_age: float = None, clock: Callable[[], float] = time.monotonic):
+        """
+        :param max_entries: The maximum number of players kept. None for no limit.
+        :param max_age: The number of seconds a player is kept after being put in the cache. None for no limit.
+        :param clock: Returns the current time in seconds, used to age players.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("PlayerCache.max_entries must be at least 1")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("PlayerCache.max_age must be greater than 0")
+
+        self._max_entries: int | None = max_entries
+        self._max_age: float | None = max_age
+        self._clock: Callable[[], float] = clock
+
+        self._entries: HashMap = HashMap(capacity=max_entries)
+        self._recency: PlayerList = PlayerList()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of calls to get that found a player, 0.0 if get has not been called.
+
+        :return: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """
+        Return the cache's counters.
+
+        :return: dict
+        """
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def get(self, key: str, default: Any = None) -> Player | Any:
+        """
+        Return the player with uid <key> and mark it as the most recently used, or <default> if it is not cached or
+        has expired.
+
+        :param key: str
+        :param default: Returned on a miss.
+        :return: Player | Any
+        """
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        if self._is_expired(entry):
+            self._discard(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._recency.move_to_front(entry.node)
+        self.hits += 1
+        return entry.node.player
+
+    def put(self, player: Player):
+        """
+        Cache <player>, replacing any cached player with the same uid, and evict the least recently used players if
+        max_entries is exceeded.
+
+        :param player: Player
+        """
+        replaced = self._entries.pop(player.uid, None)
+        if replaced is not None:
+            self._recency.remove_node(replaced.node)
+
+        entry = _CacheEntry.with_hash(player.uid, player.name, hash(player))
+        entry.node = self._recency.prepend(player)
+        entry.expires_at = None if self._max_age is None else self._clock() + self._max_age
+        self._entries.add(entry)
+
+        if self._max_entries is not None:
+            while len(self._recency) > self._max_entries:
+                key = self._recency.tail.key
+                self._recency.remove_at_tail()
+                self._entries.remove(key)
+                self.evictions += 1
+
+    def remove(self, key: str):
+        """
+        Remove the player with uid <key> from the cache.
+
+        :param key: str
+        """
+        if key not in self._entries:
+            raise KeyError(key)
+
+        self._discard(key)
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired player. Expired players are otherwise only removed when they are requested.
+
+        :return: int - The number of players removed.
+        """
+        now = self._clock()
+        expired = [entry.uid for entry in self._entries if entry.expires_at is not None and entry.expires_at <= now]
+
+        for key in expired:
+            self._discard(key)
+
+        self.expirations += len(expired)
+        return len(expired)
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+    def _discard(self, key: str):
+        """
+        Remove the player with uid <key> from every structure of the cache.
+
+        :param key: str
+        """
+        self._recency.remove_node(self._entries.pop(key).node)
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            return not self._is_expired(self._entries[key])
+        except KeyError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._recency)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(repr(player.uid) for player in self._recency)})"
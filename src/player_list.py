@@ -1,5 +1,7 @@
 from src.player import Player
-from src.player_node import PlayerNode
+
+from typing import Iterable
+from src.player_node import FastPlayerNode, NodePool, PlayerNode
 
 
 class PlayerList:
@@ -9,9 +11,30 @@ class PlayerList:
     # TODO (optional): Add a random access to make using the list more convenient. Not required by assessment.
     """
 
-    def __init__(self):
+    __slots__ = ('__head', '__tail', '__length', '__new_node', '__pool', '__index')
+
+    def __init__(self, debug: bool = False, indexed: bool = False, pool: NodePool = None):
+        """
+        :param debug: Store players in PlayerNode's, which validate every link made between nodes. By default the
+            faster, unvalidated FastPlayerNode is used.
+        :param indexed: Keep a dictionary of key -> node, so that finding, updating and removing a player by its key
+            no longer has to search the list. Keys must be unique within an indexed list.
+        :param pool: Take new nodes from this NodePool and hand unlinked nodes back to it. Nodes returned by append,
+            prepend or find must then no longer be used once they are removed. Not supported in debug mode.
+        """
+        if debug and pool is not None:
+            raise ValueError("PlayerList does not support a NodePool in debug mode")
+
         self.__head = None
         self.__tail = None
+        # Maintained by every method that links or unlinks a node, so len() never has to walk the list
+        self.__length = 0
+        self.__pool = pool
+        if pool is not None:
+            self.__new_node = pool.acquire
+        else:
+            self.__new_node = PlayerNode if debug else FastPlayerNode
+        self.__index: dict | None = {} if indexed else None
 
     @property
     def head(self):
@@ -31,6 +54,15 @@ class PlayerList:
         """
         return self.__tail
 
+    @property
+    def is_indexed(self):
+        """
+        True if the list keeps an index of key -> node.
+
+        :return:
+        """
+        return self.__index is not None
+
     @property
     def is_empty(self):
         """
@@ -40,63 +72,110 @@ class PlayerList:
         """
         return self.__tail is None and self.__head is None
 
-    def append(self, player: Player):
+    def append(self, player: Player, hash_: int = None):
         """
         Add a player to the end of the list.
 
         :param player:
-        :return:
+        :param hash_: The hash of the player's uid to cache on its node. Defaults to hash(player).
+        :return: The node holding the player, which can be passed to remove_node.
         """
         if not isinstance(player, Player):
             print(isinstance(player, Player))
             print(type(player))
             raise ValueError("PlayerList can only hold instances of Player")
 
-        node = PlayerNode(player)
+        node = self.__new_node(player, hash_=hash_)
+        if self.__index is not None:
+            self.__add_to_index(node)
+        self.__length += 1
 
-        if self.is_empty:
+        if self.__tail is None:
             self.__head = node
             self.__tail = node
-            return
-
-        if self.__tail is self.__head:
-            self.__tail = node
-            self.__head.next = self.__tail
-            self.__tail.last = self.__head
-            return
+            return node
 
         node.last = self.__tail
         self.__tail.next = node
         self.__tail = node
+        return node
 
-    def prepend(self, player: Player):
+    def extend(self, players: Iterable[Player], hashes: Iterable[int] = None):
+        """
+        Add every player in <players> to the end of the list, linking the nodes in a single pass. Unlike append, the
+        players are not checked to be instances of Player.
+
+        :param players: The players to add.
+        :param hashes: The hashes to cache on each player's node, in the same order as <players>. Defaults to
+            hash(player).
+        :return:
+        """
+        new_node = self.__new_node
+        tail = self.__tail
+        length = self.__length
+        index = self.__index
+
+        if index is not None:
+            # Every key is checked before any node is taken or linked, so a duplicate leaves the list as it was
+            players = list(players)
+            keys = set()
+            for player in players:
+                if player.uid in index or player.uid in keys:
+                    raise ValueError(f"Key '{player.uid}' is already in the list")
+                keys.add(player.uid)
+
+        if hashes is None:
+            nodes = (new_node(player) for player in players)
+        else:
+            nodes = (new_node(player, hash_=hash_) for player, hash_ in zip(players, hashes))
+
+        for node in nodes:
+            if index is not None:
+                index[node.key] = node
+            if tail is None:
+                self.__head = node
+            else:
+                tail.next = node
+                node.last = tail
+            tail = node
+            length += 1
+
+        self.__tail = tail
+        self.__length = length
+
+    def prepend(self, player: Player, hash_: int = None):
         """
         Add a player to the start of the list.
         .
 
         :param player:
-        :return:
+        :param hash_: The hash of the player's uid to cache on its node. Defaults to hash(player).
+        :return: The node holding the player, which can be passed to remove_node.
         """
         if not isinstance(player, Player):
             raise ValueError("PlayerList can only hold instances of PlayerNode")
 
-        node = PlayerNode(player=player)
+        node = self.__new_node(player, hash_=hash_)
+        if self.__index is not None:
+            self.__add_to_index(node)
+        self.__length += 1
 
         if self.is_empty:
             self.__tail = node
             self.__head = node
-            return
+            return node
 
         if self.__tail is self.__head:
             self.__tail = self.__head
             self.__tail.last = node
             self.__head = node
             self.__head.next = self.__tail
-            return
+            return node
 
         node.next = self.__head
         self.__head.last = node
         self.__head = node
+        return node
 
     def remove_at_head(self):
         """
@@ -104,13 +183,21 @@ class PlayerList:
 
         :return:
         """
-        if not self.__head.next:
+        head = self.__head
+        if self.__index is not None:
+            del self.__index[head.key]
+
+        if not head.next:
             self.__head = None
             self.__tail = None
-            return
+            self.__length = 0
+        else:
+            self.__head = head.next
+            self.__head.last = None
+            self.__length -= 1
 
-        self.__head = self.__head.next
-        self.__head.last = None
+        if self.__pool is not None:
+            self.__pool.release(head)
 
     def remove_at_tail(self):
         """
@@ -118,50 +205,201 @@ class PlayerList:
 
         :return:
         """
-        if not self.__tail.last:
+        tail = self.__tail
+        if self.__index is not None:
+            del self.__index[tail.key]
+
+        if not tail.last:
             self.__head = None
             self.__tail = None
-            return
+            self.__length = 0
+        else:
+            self.__tail = tail.last
+            self.__tail.next = None
+            self.__length -= 1
+
+        if self.__pool is not None:
+            self.__pool.release(tail)
+
+    def find(self, key: str, hash_: int = None):
+        """
+        Return the node holding the player whose uid is <key>, or None if there is no such player. Indexed lists look
+        the key up in their index. Otherwise the list is searched from its head and, when <hash_> is given, the hash
+        cached on each node is compared before its key, skipping the (potentially slower) key comparison for almost
+        every other node.
+
+        :param key: The key to search for.
+        :param hash_: The hash of <key>, as cached on the nodes of this list.
+        :return: PlayerNode | None
+        """
+        if self.__index is not None:
+            return self.__index.get(key)
+
+        current = self.__head
+
+        if hash_ is None:
+            while current is not None:
+                if current.key == key:
+                    return current
+                current = current.next
+            return None
+
+        while current is not None:
+            if current.hash == hash_ and current.key == key:
+                return current
+            current = current.next
 
-        self.__tail = self.__tail.last
-        self.__tail.next = None
+        return None
 
-    def remove(self, key: str) -> Player:
+    def find_or_append(self, player: Player, hash_: int = None):
+        """
+        Return the node holding the player whose uid is the uid of <player>, or append <player> if there is no such
+        player, searching the list only once. See find.
+
+        :param player: The player to append if its uid is not in the list yet.
+        :param hash_: The hash of the player's uid, see append.
+        :return: tuple[PlayerNode, bool] - The node and whether <player> was appended.
+        """
+        if not isinstance(player, Player):
+            raise ValueError("PlayerList can only hold instances of Player")
+
+        if hash_ is None:
+            hash_ = hash(player)
+
+        key = player.uid
+        if self.__index is not None:
+            node = self.__index.get(key)
+        else:
+            node = self.__head
+            while node is not None:
+                if node.hash == hash_ and node.key == key:
+                    break
+                node = node.next
+
+        if node is not None:
+            return node, False
+
+        return self.append(player, hash_), True
+
+    def remove(self, key: str, hash_: int = None) -> Player:
         """
         Remove a player from the list by its key. This key matches the uid of the node's player.
 
         :param key: The key to remove.
+        :param hash_: The hash of <key>, see find.
         :return:
         """
-        # TODO (optional): Add an algorithm to make the key-search look from both __head and __tail if it is more
-        #  efficient to do so, or add an argument to toggle this.
+        node = self.find(key, hash_)
 
-        if self.is_empty:
+        if node is None:
             raise KeyError(f"Key '{key}' not found")
 
-        current = self.__head
-
-        while current.next:
-            if current.key == key:
-                if current == self.head:
-                    self.remove_at_head()
-                    return current.player
+        return self.remove_node(node)
 
-                current.last.next = current.next
-                current.next.last = current.last
-                return current.player
+    def remove_node(self, node) -> Player:
+        """
+        Unlink <node> from the list without searching for it. <node> must be a node of this list, as returned by
+        append, prepend or find.
 
-            current = current.next
+        :param node: The node to remove.
+        :return: The player held by the node.
+        """
+        # Read before unlinking, as the node is cleared if it goes back to a NodePool
+        player = node.player
 
-        # Extra check since the loop will exit before checking self.__tail
-        if self.__tail.key == key:
+        if node is self.__head:
+            self.remove_at_head()
+        elif node is self.__tail:
             self.remove_at_tail()
-            return current.player
+        else:
+            node.last.next = node.next
+            node.next.last = node.last
+            self.__length -= 1
+            if self.__index is not None:
+                del self.__index[node.key]
+            if self.__pool is not None:
+                self.__pool.release(node)
+
+        return player
+
+    def move_to_front(self, node):
+        """
+        Move <node>, which must be a node of this list, to the head of the list.
+
+        :param node: The node to move.
+        :return:
+        """
+        if node is self.__head:
+            return
 
-        raise KeyError(f"Key '{key}' not found")
+        node.last.next = node.next
+        if node is self.__tail:
+            self.__tail = node.last
+        else:
+            node.next.last = node.last
 
-    def update(self, key: str, value: str):
-        self.__setitem__(key, value)
+        node.last = None
+        node.next = self.__head
+        self.__head.last = node
+        self.__head = node
+
+    def transpose(self, node):
+        """
+        Swap <node>, which must be a node of this list, with the node before it.
+
+        :param node: The node to move one step towards the head.
+        :return:
+        """
+        previous = node.last
+        if previous is None:
+            return
+
+        before = previous.last
+        after = node.next
+
+        if before is None:
+            self.__head = node
+        else:
+            before.next = node
+        node.last = before
+
+        node.next = previous
+        previous.last = node
+
+        previous.next = after
+        if after is None:
+            self.__tail = previous
+        else:
+            after.last = previous
+
+    def __add_to_index(self, node):
+        """
+        Add <node> to the index, refusing duplicate keys.
+
+        :param node: The node to index.
+        :return:
+        """
+        if node.key in self.__index:
+            raise ValueError(f"Key '{node.key}' is already in the list")
+        self.__index[node.key] = node
+
+    def update(self, key: str, value: str, hash_: int = None):
+        """
+        Update the name of the player whose uid is <key> to <value>.
+
+        :param key: The key to update.
+        :param value: The new name.
+        :param hash_: The hash of <key>, see find.
+        :return: The player's previous name.
+        """
+        node = self.find(key, hash_)
+
+        if node is None:
+            raise KeyError(key)
+
+        old_name = node.player.name
+        node.player.name = value
+        return old_name
 
     def display(self, forward: bool = True):
         """
@@ -188,7 +426,7 @@ class PlayerList:
         raise NotImplementedError("This method has not been implemented.")
 
     def __len__(self):
-        return len([i for i in self])
+        return self.__length
 
     def __iter__(self):
         if self.is_empty:
@@ -207,11 +445,7 @@ class PlayerList:
         return False
 
     def __setitem__(self, key, value):
-        for player in self:
-            if player.uid == key:
-                player.name = value
-                return
-        raise KeyError(key)
+        self.update(key, value)
 
     def __repr__(self):
         nodes = [str(node) for node in self]
@@ -1,5 +1,7 @@
 from src.player import Player
 
+import threading
+
 
 class PlayerNode:
     """
@@ -12,10 +14,17 @@ class PlayerNode:
     have to know about PlayerNode to work with its items.
     """
 
-    def __init__(self, player: 'Player' = None, last: 'PlayerNode' = None, next: 'PlayerNode' = None):
+    __slots__ = ('__player', '__last', '__next', '__hash')
+
+    def __init__(self, player: 'Player' = None, last: 'PlayerNode' = None, next: 'PlayerNode' = None,
+                 hash_: int = None):
+        """
+        :param hash_: The hash of the player's uid as computed by the list's owner. Defaults to hash(player).
+        """
         self.__player = player
         self.__last = last
         self.__next = next
+        self.__hash = hash(player) if hash_ is None and player is not None else hash_
 
     @property
     def next(self):
@@ -56,6 +65,12 @@ class PlayerNode:
         """
         return self.__player
 
+    @player.setter
+    def player(self, value):
+        if not isinstance(value, Player):
+            raise ValueError("PlayerNode.player must be an instance of Player.")
+        self.__player = value
+
     @property
     def key(self):
         """
@@ -65,6 +80,15 @@ class PlayerNode:
         """
         return self.player.uid
 
+    @property
+    def hash(self):
+        """
+        The cached hash of the stored player's uid.
+
+        :return:
+        """
+        return self.__hash
+
     def __hash__(self):
         return hash(self.player)
 
@@ -72,3 +96,122 @@ class PlayerNode:
         next = self.next.player if self.next else None
         last = self.last.player if self.last else None
         return f"PlayerNode(\n next={next},\n last={last},\n player={self.player}\n)"
+
+
+class FastPlayerNode:
+    """
+    A node within a PlayerList with the same interface as PlayerNode, but stored in plain slots instead of behind
+    properties. Nothing is validated when linking nodes, which makes it considerably faster to traverse and smaller to
+    store than PlayerNode. PlayerList uses it unless created with debug=True.
+
+    The uid of the player is copied into key and its hash into hash, so searching a list does not go through Player.
+    """
+
+    __slots__ = ('player', 'key', 'hash', 'last', 'next')
+
+    def __init__(self, player: 'Player' = None, last: 'FastPlayerNode' = None, next: 'FastPlayerNode' = None,
+                 hash_: int = None):
+        """
+        :param hash_: The hash of the player's uid as computed by the list's owner. Defaults to hash(player).
+        """
+        self.player = player
+        self.key = player.uid if player is not None else None
+        self.hash = hash(player) if hash_ is None and player is not None else hash_
+        self.last = last
+        self.next = next
+
+    def __hash__(self):
+        return hash(self.player)
+
+    def __str__(self):
+        next = self.next.player if self.next else None
+        last = self.last.player if self.last else None
+        return f"FastPlayerNode(\n next={next},\n last={last},\n player={self.player}\n)"
+
+
+class NodePool:
+    """
+    A bounded free list of unlinked FastPlayerNode's. PlayerList's sharing a pool hand every node they unlink back to
+    it and take nodes from it before allocating new ones, so that players constantly being added and removed reuse
+    the same nodes instead of allocating (and triggering the garbage collector for) a new node every time.
+
+    Taking and returning a node are guarded by a lock, so a pool can be shared between threads, as the PlayerList's
+    of a ConcurrentHashMap do.
+    """
+
+    __slots__ = ('__free', '__capacity', '__lock')
+
+    DEFAULT_CAPACITY: int = 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        :param capacity: The maximum number of unlinked nodes kept for reuse. Nodes returned to a full pool are left
+            to be collected.
+        """
+        if capacity < 1:
+            raise ValueError("NodePool.capacity must be at least 1")
+
+        self.__free: list[FastPlayerNode] = []
+        self.__capacity = capacity
+        self.__lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """
+        The maximum number of unlinked nodes kept for reuse.
+
+        :return: int
+        """
+        return self.__capacity
+
+    def __getstate__(self) -> dict:
+        # The lock cannot be pickled, and the unlinked nodes kept for reuse hold nothing worth pickling
+        return {"capacity": self.__capacity}
+
+    def __setstate__(self, state: dict):
+        self.__free = []
+        self.__capacity = state["capacity"]
+        self.__lock = threading.Lock()
+
+    def acquire(self, player: 'Player', hash_: int = None) -> FastPlayerNode:
+        """
+        Return an unlinked node holding <player>, reusing a node from the pool if there is one.
+
+        :param player: Player
+        :param hash_: The hash of the player's uid, see FastPlayerNode.
+        :return: FastPlayerNode
+        """
+        with self.__lock:
+            node = self.__free.pop() if self.__free else None
+        if node is None:
+            return FastPlayerNode(player, hash_=hash_)
+
+        node.player = player
+        node.key = player.uid
+        node.hash = hash(player) if hash_ is None else hash_
+        return node
+
+    def release(self, node: FastPlayerNode):
+        """
+        Return <node>, which must no longer be linked into any list, to the pool. Its player is cleared so that the
+        pool does not keep removed players alive.
+
+        :param node: FastPlayerNode
+        """
+        node.player = node.key = node.last = node.next = None
+        with self.__lock:
+            if len(self.__free) < self.__capacity:
+                self.__free.append(node)
+
+    def clear(self):
+        """
+        Drop every node kept for reuse.
+        """
+        with self.__lock:
+            self.__free.clear()
+
+    def __len__(self) -> int:
+        return len(self.__free)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)}/{self.__capacity})"
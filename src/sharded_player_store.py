@@ -0,0 +1,235 @@
+from src import hashing
+from src.hash_map import HashMap
+from src.player import Player
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Iterable
+
+
+def _serve(connection: Connection):
+    """
+    The loop run by each shard's process: receive (method, args) requests, call the method on the shard's HashMap and
+    send back (True, result), or (False, exception) if it raised. Stops when it receives None.
+
+    :param connection: The shard's end of the pipe.
+    """
+    hash_map = HashMap()
+
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+
+        method, args = request
+        try:
+            response = (True, getattr(hash_map, method)(*args))
+        except Exception as e:
+            response = (False, e)
+        connection.send(response)
+
+    connection.close()
+
+
+class ShardedPlayerStore:
+    """
+    A player store partitioned over several worker processes, each holding its own HashMap, so that lookups are not
+    limited to the one core a single HashMap can use.
+
+    A player lives on the shard picked by the first byte of its pearson hash (the top byte of Player.pearson_hash),
+    which leaves the lower bytes the shard's HashMap uses to pick a PlayerList evenly spread. Requests travel over a
+    pipe per shard; get_many and add_many send one batch to every shard involved before waiting for any of them, so
+    the shards work in parallel.
+
+    Players are pickled on their way to and from the shards, so get returns a copy rather than the player that was
+    added. Call close, or use the store as a context manager, to stop the processes.
+    """
+
+    DEFAULT_SHARDS: int = 4
+
+    def __init__(self, shards: int = DEFAULT_SHARDS, context: multiprocessing.context.BaseContext = None):
+        """
+        :param shards: The number of worker processes.
+        :param context: The multiprocessing context used to start them, the default context if None.
+        """
+        if shards < 1:
+            raise ValueError("ShardedPlayerStore.shards must be at least 1")
+
+        context = context or multiprocessing.get_context()
+
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+
+        for i in range(shards):
+            connection, child_connection = context.Pipe()
+            process = context.Process(target=_serve, args=(child_connection,), daemon=True)
+            process.start()
+            child_connection.close()
+
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    @property
+    def shards(self) -> int:
+        """
+        The number of worker processes
+
+        :return: int
+        """
+        return len(self._processes)
+
+    def _shard(self, key: str) -> int:
+        """
+        Return the shard holding the player with uid <key>.
+
+        :param key: str
+        :return: int
+        """
+        return hashing.pearson_hash(key) % len(self._connections)
+
+    def _shards(self, keys: list) -> list[int]:
+        """
+        Return the shard of every key in <keys>, hashed in a single batch if NumPy is installed.
+
+        :param keys: list
+        :return: list[int]
+        """
+        if hashing.numpy is not None and keys:
+            return (hashing.pearson_hash_many(keys) % len(self._connections)).tolist()
+
+        return [self._shard(key) for key in keys]
+
+    def _call(self, shard: int, method: str, *args) -> Any:
+        """
+        Call <method> with <args> on the HashMap of <shard> and return its result, re-raising anything it raised.
+
+        :param shard: int
+        :param method: The name of a HashMap method.
+        :return: Any
+        """
+        return self._call_many({shard: (method, args)})[shard]
+
+    def _call_many(self, requests: dict[int, tuple[str, tuple]]) -> dict[int, Any]:
+        """
+        Send every (method, args) request in <requests> to its shard, then collect the results. Every response is
+        received before the first exception, if any, is re-raised, so the pipes stay in step.
+
+        :param requests: dict[int, tuple[str, tuple]] - Requests by shard.
+        :return: dict[int, Any] - Results by shard.
+        """
+        for shard, request in requests.items():
+            self._connections[shard].send(request)
+
+        results = {}
+        error = None
+        for shard in requests:
+            ok, result = self._connections[shard].recv()
+            if ok:
+                results[shard] = result
+            elif error is None:
+                error = result
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def add(self, player: Player):
+        """
+        Add a player to the store
+
+        :param player: Player
+        """
+        self._call(self._shard(player.uid), "add", player)
+
+    def add_many(self, players: Iterable[Player]):
+        """
+        Add every player in <players>, sending each shard its players in one batch.
+
+        :param players: Iterable[Player]
+        """
+        players = list(players)
+        batches = [[] for i in range(self.shards)]
+
+        for player, shard in zip(players, self._shards([player.uid for player in players])):
+            batches[shard].append(player)
+
+        self._call_many({shard: ("update_many", (batch,)) for shard, batch in enumerate(batches) if batch})
+
+    def get(self, key: str) -> Player:
+        """
+        Return the player with uid <key>
+
+        :param key: str
+        :return: Player
+        """
+        return self._call(self._shard(key), "get", key)
+
+    def get_many(self, keys: Iterable[str], default: Any = None) -> list[Player | Any]:
+        """
+        Return the players with each of <keys>, in the same order as <keys>, with <default> in place of any key that
+        is not stored. Each shard is sent its keys in one batch.
+
+        :param keys: Iterable[str]
+        :param default: Returned for missing keys.
+        :return: list[Player | Any]
+        """
+        keys = list(keys)
+        shards = self._shards(keys)
+        batches = [[] for i in range(self.shards)]
+
+        for key, shard in zip(keys, shards):
+            batches[shard].append(key)
+
+        responses = self._call_many({shard: ("get_many", (batch, default)) for shard, batch in enumerate(batches)
+                                     if batch})
+
+        # Each shard answers in the order its keys were sent, which is the order they appear in <keys>
+        answers = {shard: iter(players) for shard, players in responses.items()}
+        return [next(answers[shard]) for shard in shards]
+
+    def put(self, key: str, value: Any):
+        """
+        Set the name of the player with uid <key>
+
+        :param key: str
+        :param value: Any
+        """
+        self._call(self._shard(key), "put", key, value)
+
+    def remove(self, key: str):
+        """
+        Remove the player with uid <key>
+
+        :param key: str
+        """
+        self._call(self._shard(key), "remove", key)
+
+    def close(self):
+        """
+        Stop the worker processes
+        """
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+
+        for process in self._processes:
+            process.join()
+
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self) -> 'ShardedPlayerStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(self._call_many({shard: ("__len__", ()) for shard in range(self.shards)}).values())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(shards={self.shards}, players={len(self)})"
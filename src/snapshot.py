@@ -0,0 +1,325 @@
+"""
+A compact binary snapshot of a HashMap's players, written by HashMap.save and read back either in full by
+HashMap.load or lazily, straight from a memory map of the file, by MappedSnapshot.
+
+Every number is a little-endian unsigned 64-bit int and every section starts on an 8-byte boundary:
+
+    header          magic, version, length of the hash function name, number of players, number of buckets,
+                    sizes of the uid and name tables
+    hash function   the name in hashing.HASH_FUNCTIONS the hashes were made with, empty for the default pearson hash
+    bucket offsets  buckets + 1 offsets into the player entries. The players of bucket i are the entries from
+                    offsets[i] up to offsets[i + 1]
+    hashes          the stored hash of every player, ordered by bucket
+    uid offsets     players + 1 offsets into the uid table, uid i is uid_table[offsets[i]:offsets[i + 1]]
+    name offsets    players + 1 offsets into the name table
+    uid table       every uid encoded as UTF-8, back to back
+    name table      every name encoded as UTF-8, back to back
+
+A player's bucket is its hash modulo the number of buckets, which is independent of the size the HashMap had.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from src.hashing import HASH_FUNCTIONS
+from src.player import Player
+
+MAGIC = b"PHMS"
+VERSION = 1
+
+# magic, version, hash function name length, players, buckets, uid table size, name table size
+HEADER = struct.Struct("<4sHH4Q")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _words(values: Iterable[int]) -> array:
+    """
+    Pack <values> as little-endian unsigned 64-bit ints.
+
+    :param values: Iterable[int]
+    :return: array
+    """
+    words = array("Q", values)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words
+
+
+def _offsets(strings: list[bytes]) -> array:
+    """
+    Return the offset of every string in <strings> once they are concatenated, followed by the total size.
+
+    :param strings: list[bytes]
+    :return: array
+    """
+    offsets = [0] * (len(strings) + 1)
+    total = 0
+    for i, string in enumerate(strings):
+        total += len(string)
+        offsets[i + 1] = total
+    return _words(offsets)
+
+
+def hash_function_name(hash_function: Callable[[Any], int] | None) -> str:
+    """
+    Return the name of <hash_function> in hashing.HASH_FUNCTIONS, or an empty string for the default pearson hash
+    (None). Hashes are stored in snapshots, so only hash functions that can be looked up again by name, and that give
+    the same hashes in every process, are supported.
+
+    :param hash_function: Callable[[Any], int] | None
+    :return: str
+    """
+    if hash_function is None:
+        return ""
+
+    for name, function in HASH_FUNCTIONS.items():
+        if function is hash_function:
+            if name == "siphash":
+                raise ValueError("siphash is keyed with a secret that is random for each process, so its hashes "
+                                 "can not be stored in a snapshot")
+            return name
+
+    raise ValueError("Only the hash functions in hashing.HASH_FUNCTIONS can be stored in a snapshot")
+
+
+def write_snapshot(path: str, entries: Iterable[tuple[Player, int]], hash_function: str = ""):
+    """
+    Write a snapshot of every (player, hash) in <entries> to <path>.
+
+    :param path: str
+    :param entries: Iterable[tuple[Player, int]] - Every player along with its hash.
+    :param hash_function: The name of the hash function the hashes were made with, empty for the default.
+    """
+    entries = list(entries)
+    buckets = max(1, len(entries))
+
+    # Group the players by bucket, keeping the relative order they were stored in
+    entries.sort(key=lambda entry: entry[1] % buckets)
+
+    counts = [0] * (buckets + 1)
+    for player, hash_ in entries:
+        counts[hash_ % buckets + 1] += 1
+    for i in range(buckets):
+        counts[i + 1] += counts[i]
+
+    uids, names = [], []
+    for player, hash_ in entries:
+        if not isinstance(player.uid, str) or not isinstance(player.name, str):
+            raise ValueError("Only players whose uid and name are strings can be stored in a snapshot")
+        uids.append(player.uid.encode("utf-8"))
+        names.append(player.name.encode("utf-8"))
+
+    uid_table, name_table = b"".join(uids), b"".join(names)
+    name = hash_function.encode("ascii")
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(name), len(entries), buckets, len(uid_table), len(name_table)))
+        file.write(name.ljust(_align(len(name)), b"\0"))
+        _words(counts).tofile(file)
+        _words(hash_ for player, hash_ in entries).tofile(file)
+        _offsets(uids).tofile(file)
+        _offsets(names).tofile(file)
+        file.write(uid_table.ljust(_align(len(uid_table)), b"\0"))
+        file.write(name_table)
+
+
+def _strings(table: memoryview, offsets: list[int]) -> list[str]:
+    """
+    Return every string of a string table, given its offsets.
+
+    :param table: memoryview
+    :param offsets: list[int]
+    :return: list[str]
+    """
+    encoded = bytes(table)
+    decoded = encoded.decode("utf-8")
+
+    # When every string is ASCII, byte offsets are also character offsets and the decoded table can be sliced directly
+    if len(decoded) == len(encoded):
+        return [decoded[start:stop] for start, stop in zip(offsets, islice(offsets, 1, None))]
+
+    return [encoded[start:stop].decode("utf-8") for start, stop in zip(offsets, islice(offsets, 1, None))]
+
+
+class MappedSnapshot:
+    """
+    A read-only view of a snapshot that looks players up directly in a memory map of the file. Nothing is read up
+    front besides the header, and a Player is only created for each player that is actually looked up, so opening
+    even a very large snapshot is immediate.
+
+    Use HashMap.load instead to read every player back into a HashMap that can be changed.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The path of a snapshot written by HashMap.save.
+        """
+        with open(path, "rb") as file:
+            self._mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._open()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _open(self):
+        """
+        Parse the header and lay out a memoryview over every section of the file.
+        """
+        if len(self._mmap) < HEADER.size:
+            raise ValueError("Not a player snapshot: the file is too short")
+
+        magic, version, name_length, length, buckets, uid_size, name_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("Not a player snapshot: bad magic number")
+        if version != VERSION:
+            raise ValueError(f"Unsupported player snapshot version {version}")
+        if sys.byteorder != "little":
+            raise ValueError("Memory-mapped snapshots can only be read on little-endian machines")
+
+        size = (HEADER.size + _align(name_length) + 8 * (buckets + 1 + length + 2 * (length + 1))
+                + _align(uid_size) + name_size)
+        if len(self._mmap) < size:
+            raise ValueError("Truncated player snapshot")
+
+        self._view: memoryview = memoryview(self._mmap)
+        view = self._view
+        offset = HEADER.size
+
+        name = bytes(view[offset:offset + name_length]).decode("ascii")
+        offset += _align(name_length)
+
+        def words(count: int) -> memoryview:
+            nonlocal offset
+            section = view[offset:offset + count * 8].cast("Q")
+            offset += count * 8
+            return section
+
+        self._hash_function_name: str = name
+        self._hash_function: Callable[[Any], int] = HASH_FUNCTIONS[name] if name else Player.pearson_hash
+        self._length: int = length
+        self._buckets: int = buckets
+        self._bucket_offsets: memoryview = words(buckets + 1)
+        self._hashes: memoryview = words(length)
+        self._uid_offsets: memoryview = words(length + 1)
+        self._name_offsets: memoryview = words(length + 1)
+        self._uid_table: memoryview = view[offset:offset + uid_size]
+        offset += _align(uid_size)
+        self._name_table: memoryview = view[offset:offset + name_size]
+
+    @property
+    def hash_function(self) -> str:
+        """
+        The name of the hash function the snapshot's hashes were made with, empty for the default pearson hash
+
+        :return: str
+        """
+        return self._hash_function_name
+
+    def _find(self, key: str) -> int:
+        """
+        Return the entry of the player with uid <key>, or -1 if it is not in the snapshot.
+
+        :param key: str
+        :return: int
+        """
+        # Uids are stored as UTF-8 strings, so no other key can be in the snapshot
+        if not isinstance(key, str):
+            return -1
+
+        hash_ = self._hash_function(key)
+        bucket = hash_ % self._buckets
+        encoded = None
+
+        for entry in range(self._bucket_offsets[bucket], self._bucket_offsets[bucket + 1]):
+            if self._hashes[entry] != hash_:
+                continue
+
+            if encoded is None:
+                encoded = key.encode("utf-8")
+            if self._uid_table[self._uid_offsets[entry]:self._uid_offsets[entry + 1]] == encoded:
+                return entry
+
+        return -1
+
+    def _player(self, entry: int) -> Player:
+        """
+        Create the Player stored at <entry>.
+
+        :param entry: int
+        :return: Player
+        """
+        uid = str(self._uid_table[self._uid_offsets[entry]:self._uid_offsets[entry + 1]], "utf-8")
+        name = str(self._name_table[self._name_offsets[entry]:self._name_offsets[entry + 1]], "utf-8")
+
+        # With the default hash function the stored hash is the player's own hash, so the uid is not hashed again
+        if not self._hash_function_name:
+            return Player.with_hash(uid, name, self._hashes[entry])
+        return Player(uid, name)
+
+    def columns(self) -> tuple[list[str], list[str], list[int]]:
+        """
+        Return the uids, names and hashes of every player as three lists, without creating any Player's.
+
+        :return: tuple[list[str], list[str], list[int]]
+        """
+        # Reading every entry, so copy the sections out in bulk rather than indexing the memory map one at a time
+        return (_strings(self._uid_table, self._uid_offsets.tolist()),
+                _strings(self._name_table, self._name_offsets.tolist()),
+                self._hashes.tolist())
+
+    def get(self, key: str, default: Any = None) -> Player | Any:
+        """
+        Return the player with uid <key>, or <default> if it is not in the snapshot.
+
+        :param key: str
+        :param default: Returned if <key> is not in the snapshot.
+        :return: Player | Any
+        """
+        entry = self._find(key)
+        if entry == -1:
+            return default
+
+        return self._player(entry)
+
+    def close(self):
+        """
+        Release the memory map. Players already returned stay valid.
+        """
+        for section in (self._bucket_offsets, self._hashes, self._uid_offsets, self._name_offsets,
+                        self._uid_table, self._name_table, self._view):
+            section.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'MappedSnapshot':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getitem__(self, key: str) -> Player:
+        entry = self._find(key)
+        if entry == -1:
+            raise KeyError(key)
+
+        return self._player(entry)
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) != -1
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Player]:
+        for entry in range(self._length):
+            yield self._player(entry)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(players={self._length}, buckets={self._buckets})"
@@ -0,0 +1,194 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator
+
+
+class SortedList:
+    """
+    A list of mutually comparable values that is always kept sorted, such as names or uids.
+
+    Values are stored in sorted blocks of up to twice the load, along with the largest value of each block. Adding or
+    removing a value bisects the block maxima and then the block itself, so it only ever shifts a single block instead
+    of the whole list, which keeps both O(log n) plus a small constant even with millions of values.
+    """
+
+    __slots__ = ('__blocks', '__maxes', '__length', '__load')
+
+    DEFAULT_LOAD: int = 512
+
+    def __init__(self, values: Iterable = (), load: int = DEFAULT_LOAD):
+        """
+        :param values: The initial values, in any order.
+        :param load: The number of values blocks are split into, a block being split once it holds twice as many.
+        """
+        if load < 2:
+            raise ValueError("SortedList.load must be at least 2")
+
+        self.__load = load
+        self.__blocks: list[list] = []
+        self.__maxes: list = []
+        self.__length = 0
+        self.update(values)
+
+    def add(self, value: Any):
+        """
+        Insert <value> in sorted order, after any equal values.
+
+        :param value: Any
+        """
+        blocks, maxes = self.__blocks, self.__maxes
+        self.__length += 1
+
+        if not maxes:
+            blocks.append([value])
+            maxes.append(value)
+            return
+
+        index = bisect_right(maxes, value)
+        if index == len(maxes):
+            index -= 1
+            blocks[index].append(value)
+            maxes[index] = value
+        else:
+            insort(blocks[index], value)
+
+        if len(blocks[index]) > 2 * self.__load:
+            block = blocks[index]
+            blocks[index:index + 1] = [block[:self.__load], block[self.__load:]]
+            maxes[index:index + 1] = [block[self.__load - 1], block[-1]]
+
+    def update(self, values: Iterable):
+        """
+        Insert every value in <values>. Many values are merged in with a single sort rather than added one by one.
+
+        :param values: Iterable
+        """
+        values = list(values)
+        if len(values) < self.__load:
+            for value in values:
+                self.add(value)
+            return
+
+        # Sorting the new values first leaves two sorted runs, which the sort then merges in linear time
+        values.sort()
+        merged = list(chain.from_iterable(self.__blocks))
+        merged += values
+        merged.sort()
+
+        load = self.__load
+        self.__blocks = [merged[start:start + load] for start in range(0, len(merged), load)]
+        self.__maxes = [block[-1] for block in self.__blocks]
+        self.__length = len(merged)
+
+    def remove(self, value: Any):
+        """
+        Remove one value equal to <value>.
+
+        :param value: Any
+        """
+        blocks, maxes = self.__blocks, self.__maxes
+
+        index = bisect_left(maxes, value)
+        if index == len(maxes):
+            raise ValueError(f"{value!r} is not in the list")
+
+        block = blocks[index]
+        position = bisect_left(block, value)
+        if block[position] != value:
+            raise ValueError(f"{value!r} is not in the list")
+
+        del block[position]
+        self.__length -= 1
+
+        if not block:
+            del blocks[index]
+            del maxes[index]
+            return
+
+        maxes[index] = block[-1]
+
+        # Merge blocks that have shrunk to a fraction of the load into their neighbour, splitting them again if needed
+        if len(block) < self.__load // 2 and len(blocks) > 1:
+            if index == len(blocks) - 1:
+                index -= 1
+            block = blocks[index] + blocks[index + 1]
+            if len(block) > 2 * self.__load:
+                middle = len(block) // 2
+                blocks[index:index + 2] = [block[:middle], block[middle:]]
+                maxes[index:index + 2] = [block[middle - 1], block[-1]]
+            else:
+                blocks[index:index + 2] = [block]
+                maxes[index:index + 2] = [block[-1]]
+
+    def discard(self, value: Any):
+        """
+        Remove one value equal to <value>, if there is one.
+
+        :param value: Any
+        """
+        if value in self:
+            self.remove(value)
+
+    def irange(self, minimum: Any = None, maximum: Any = None,
+               inclusive: tuple[bool, bool] = (True, True)) -> Iterator:
+        """
+        Yield the values from <minimum> up to <maximum> in sorted order, finding the first one with two bisections.
+
+        :param minimum: The smallest value to yield, None to start from the smallest value in the list.
+        :param maximum: The largest value to yield, None to continue until the largest value in the list.
+        :param inclusive: Whether values equal to <minimum> and to <maximum> are yielded.
+        :return: Iterator
+        """
+        blocks, maxes = self.__blocks, self.__maxes
+
+        if minimum is None:
+            index, position = 0, 0
+        elif inclusive[0]:
+            index = bisect_left(maxes, minimum)
+            position = bisect_left(blocks[index], minimum) if index < len(blocks) else 0
+        else:
+            index = bisect_right(maxes, minimum)
+            position = bisect_right(blocks[index], minimum) if index < len(blocks) else 0
+
+        for block in islice(blocks, index, None):
+            for value in islice(block, position, None):
+                if maximum is not None and (value > maximum or not inclusive[1] and value == maximum):
+                    return
+                yield value
+            position = 0
+
+    def __getitem__(self, index: int) -> Any:
+        if not -self.__length <= index < self.__length:
+            raise IndexError("SortedList index out of range")
+
+        # Walk the blocks from whichever end is given, so that the first and last values are found immediately
+        if index < 0:
+            for block in reversed(self.__blocks):
+                if -index <= len(block):
+                    return block[index]
+                index += len(block)
+
+        for block in self.__blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+
+    def __contains__(self, value: Any) -> bool:
+        index = bisect_left(self.__maxes, value)
+        if index == len(self.__maxes):
+            return False
+
+        block = self.__blocks[index]
+        return block[bisect_left(block, value)] == value
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self.__blocks)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(map(reversed, reversed(self.__blocks)))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
@@ -0,0 +1,308 @@
+"""
+An append-only write-ahead log of the changes made to a HashMap, so that they survive a crash without snapshotting
+the whole map after every change.
+
+Each record is a 13-byte header followed by the UTF-8 encoded uid and name of the player:
+
+    crc32        u32, of everything after it in the record
+    operation    u8, OP_ADD, OP_RENAME or OP_REMOVE
+    uid length   u32
+    name length  u32, 0 for OP_REMOVE
+
+Every number is little-endian. A crash in the middle of writing a record leaves a torn record at the end of the log,
+which fails its checksum and is discarded, along with everything after it, when the log is replayed.
+
+Typical use is recover on startup, which loads the latest snapshot, replays the log on top of it and attaches a
+fresh WriteAheadLog to the map, followed by calling compact from time to time to fold the log into a new snapshot.
+"""
+import os
+import struct
+import threading
+import zlib
+from typing import Iterator
+
+from src.hash_map import HashMap, HashMapListener
+from src.player import Player
+
+OP_ADD = 1
+OP_RENAME = 2
+OP_REMOVE = 3
+
+# crc32, operation, uid length, name length
+RECORD = struct.Struct("<IBII")
+
+
+def encode_record(operation: int, uid: str, name: str = "") -> bytes:
+    """
+    Encode a single log record.
+
+    :param operation: OP_ADD, OP_RENAME or OP_REMOVE
+    :param uid: str
+    :param name: The player's name, empty for OP_REMOVE.
+    :return: bytes
+    """
+    if not isinstance(uid, str) or not isinstance(name, str):
+        raise ValueError("Only players whose uid and name are strings can be logged")
+
+    uid_bytes, name_bytes = uid.encode("utf-8"), name.encode("utf-8")
+    body = RECORD.pack(0, operation, len(uid_bytes), len(name_bytes))[4:] + uid_bytes + name_bytes
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+def read_records(path: str) -> Iterator[tuple[int, str, str, int]]:
+    """
+    Yield (operation, uid, name, end) for every intact record of the log at <path>, where end is the offset just past
+    the record. Stops at the first torn or corrupt record.
+
+    :param path: str
+    :return: Iterator[tuple[int, str, str, int]]
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    offset = 0
+    while offset + RECORD.size <= len(data):
+        crc, operation, uid_length, name_length = RECORD.unpack_from(data, offset)
+        end = offset + RECORD.size + uid_length + name_length
+
+        if end > len(data) or zlib.crc32(data[offset + 4:end]) != crc:
+            return
+
+        uid_start = offset + RECORD.size
+        uid = data[uid_start:uid_start + uid_length].decode("utf-8")
+        name = data[uid_start + uid_length:end].decode("utf-8")
+        yield operation, uid, name, end
+
+        offset = end
+
+
+def replay(path: str, hash_map: HashMap) -> int:
+    """
+    Apply every intact record of the log at <path> to <hash_map> and return the offset just past the last one.
+
+    Records are applied so that replaying them again has no further effect, as the snapshot a log is replayed on top
+    of may already contain some of them if a crash happened halfway through compacting: an added player that is
+    already stored is renamed instead, and renaming or removing a player that is not stored is ignored.
+
+    :param path: str
+    :param hash_map: HashMap
+    :return: int
+    """
+    end = 0
+
+    for operation, uid, name, end in read_records(path):
+        try:
+            if operation == OP_REMOVE:
+                hash_map.remove(uid)
+            else:
+                hash_map.put(uid, name)
+        except KeyError:
+            if operation == OP_ADD:
+                hash_map.add(Player(uid, name))
+
+    return end
+
+
+class WriteAheadLog(HashMapListener):
+    """
+    Appends a record to a log file for every player added to, renamed in or removed from the HashMap it is attached
+    to with HashMap.add_listener.
+
+    How often the log is flushed to disk with fsync is set by sync_interval:
+
+    - 0 (the default): after every change, so no acknowledged change is ever lost.
+    - A number of seconds: records are collected in memory and written and synced together at most that often by a
+      background thread (group commit). A crash loses at most the last sync_interval seconds of changes.
+    - None: records are written straight away but never synced, leaving it up to the operating system. Changes
+      survive the process crashing but not the machine.
+    """
+
+    def __init__(self, path: str, sync_interval: float | None = 0.0):
+        """
+        :param path: The log file, created if it does not exist and appended to otherwise.
+        :param sync_interval: Seconds between syncs, 0 to sync every change and None to never sync.
+        """
+        if sync_interval is not None and sync_interval < 0:
+            raise ValueError("WriteAheadLog.sync_interval must not be negative")
+
+        self._path: str = path
+        self._sync_interval: float | None = sync_interval
+        self._file = open(path, "ab")
+        self._buffer: bytearray = bytearray()
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: threading.Event = threading.Event()
+
+        self.records: int = 0
+        self.syncs: int = 0
+
+        self._flusher: threading.Thread | None = None
+        if sync_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    @property
+    def path(self) -> str:
+        """
+        The log file
+
+        :return: str
+        """
+        return self._path
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self._sync_interval):
+            with self._lock:
+                if self._buffer and not self._closed.is_set():
+                    self._commit()
+
+    def _append(self, records: bytes, count: int):
+        """
+        Append <records> to the log, writing and syncing them now unless they are left for the next group commit.
+
+        :param records: The encoded records.
+        :param count: The number of records.
+        """
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError("WriteAheadLog is closed")
+
+            self.records += count
+            if self._sync_interval:
+                self._buffer += records
+                return
+
+            self._file.write(records)
+            self._file.flush()
+            if self._sync_interval is not None:
+                os.fsync(self._file.fileno())
+                self.syncs += 1
+
+    def _commit(self):
+        """
+        Write and sync every buffered record. The lock must be held.
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.syncs += 1
+
+    def sync(self):
+        """
+        Write and sync every record appended so far.
+        """
+        with self._lock:
+            if not self._closed.is_set():
+                self._commit()
+
+    def player_added(self, player: Player):
+        self._append(encode_record(OP_ADD, player.uid, player.name), 1)
+
+    def players_added(self, players: list[Player]):
+        self._append(b"".join(encode_record(OP_ADD, player.uid, player.name) for player in players), len(players))
+
+    def player_renamed(self, key: str, old_name: str, new_name: str):
+        self._append(encode_record(OP_RENAME, key, new_name), 1)
+
+    def player_removed(self, player: Player):
+        self._append(encode_record(OP_REMOVE, player.uid), 1)
+
+    def player_replaced(self, old: Player, new: Player):
+        # Replaying an OP_ADD of a stored uid already overwrites it, so one record does instead of a remove and an add
+        self._append(encode_record(OP_ADD, new.uid, new.name), 1)
+
+    def compact(self, hash_map: HashMap, snapshot_path: str):
+        """
+        Save <hash_map> as the new snapshot at <snapshot_path> and empty the log, whose changes the snapshot now
+        contains. The snapshot is written to a temporary file first and then renamed over the old one, so a crash
+        leaves either the old snapshot and the full log or the new snapshot. The map must not be changed while it is
+        being compacted.
+
+        :param hash_map: The HashMap this log is attached to.
+        :param snapshot_path: str
+        """
+        with self._lock:
+            self._commit()
+
+            temporary_path = f"{snapshot_path}.tmp"
+            hash_map.save(temporary_path)
+            with open(temporary_path, "rb+") as file:
+                os.fsync(file.fileno())
+            os.replace(temporary_path, snapshot_path)
+            _sync_directory(snapshot_path)
+
+            self._file.truncate(0)
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """
+        Write and sync every remaining record and close the log. Detach it from its HashMap first.
+        """
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._commit()
+            self._closed.set()
+            self._file.close()
+
+        if self._flusher is not None:
+            self._flusher.join()
+
+    def __enter__(self) -> 'WriteAheadLog':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._path!r}, sync_interval={self._sync_interval})"
+
+
+def _sync_directory(path: str):
+    """
+    Sync the directory holding <path>, so that a file renamed into it survives a crash. Not possible on every
+    platform, in which case it is skipped.
+
+    :param path: str
+    """
+    try:
+        descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def recover(snapshot_path: str, log_path: str, sync_interval: float | None = 0.0,
+            **kwargs) -> tuple[HashMap, WriteAheadLog]:
+    """
+    Rebuild a HashMap from the snapshot at <snapshot_path>, if there is one, and the log at <log_path>, if there is
+    one, then attach a WriteAheadLog appending to the same log to it. Any torn record at the end of the log is cut off
+    first.
+
+    :param snapshot_path: str
+    :param log_path: str
+    :param sync_interval: See WriteAheadLog.
+    :param kwargs: Passed through to HashMap.
+    :return: tuple[HashMap, WriteAheadLog]
+    """
+    if os.path.exists(snapshot_path):
+        hash_map = HashMap.load(snapshot_path, **kwargs)
+    else:
+        hash_map = HashMap(**kwargs)
+
+    if os.path.exists(log_path):
+        end = replay(log_path, hash_map)
+        if end < os.path.getsize(log_path):
+            os.truncate(log_path, end)
+
+    log = WriteAheadLog(log_path, sync_interval)
+    hash_map.add_listener(log)
+    return hash_map, log
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+
+from src.async_hash_map import AsyncHashMap
+from src.hash_map import HashMap
+from src.player import Player
+
+
+class TestAsyncHashMap(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.hash_map = AsyncHashMap(chunk_size=10)
+
+    async def test_add_get_put_remove(self):
+        await self.hash_map.add(Player("ID-1", "Jane Doe"))
+        await self.hash_map.put("ID-1", "John Doe")
+        self.assertEqual((await self.hash_map.get("ID-1")).name, "John Doe")
+
+        await self.hash_map.remove("ID-1")
+        with self.assertRaises(KeyError):
+            await self.hash_map.get("ID-1")
+
+    async def test_update_many_and_get_many(self):
+        players = [Player(f"ID-{i}", "Jane Doe") for i in range(500)]
+        await self.hash_map.update_many(players)
+
+        self.assertEqual(len(self.hash_map), 500)
+        self.assertFalse(self.hash_map.hash_map.is_rehashing)
+        self.assertEqual(await self.hash_map.get_many(["ID-3", "ID-999", "ID-499"]),
+                         [players[3], None, players[499]])
+
+    async def test_async_iteration(self):
+        players = [Player(f"ID-{i}", "Jane Doe") for i in range(50)]
+        await self.hash_map.update_many(players)
+
+        self.assertCountEqual([player async for player in self.hash_map], players)
+
+    async def test_async_iteration_while_other_tasks_get_players(self):
+        hash_map = AsyncHashMap(chunk_size=10, rehash_step=1)
+        for i in range(200):
+            await hash_map.add(Player(f"ID-{i}", "Jane Doe"))
+        self.assertTrue(hash_map.hash_map.is_rehashing)
+
+        async def get_every_player():
+            for i in range(200):
+                await hash_map.get(f"ID-{i}")
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(get_every_player())
+        seen = [player.uid async for player in hash_map]
+        await task
+
+        self.assertCountEqual(seen, [f"ID-{i}" for i in range(200)])
+
+    async def test_bulk_load_yields_to_other_tasks(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await self.hash_map.update_many(Player(f"ID-{i}", "Jane Doe") for i in range(1000))
+        task.cancel()
+
+        # At least one tick per chunk of the bulk load
+        self.assertGreaterEqual(ticks, 100)
+
+    async def test_reserve_migrates_cooperatively(self):
+        await self.hash_map.update_many(Player(f"ID-{i}", "Jane Doe") for i in range(100))
+        await self.hash_map.reserve(10_000)
+
+        self.assertGreaterEqual(self.hash_map.hash_map.size, 10_000 / HashMap.DEFAULT_MAX_LOAD_FACTOR)
+        self.assertFalse(self.hash_map.hash_map.is_rehashing)
+        self.assertNotIn(None, await self.hash_map.get_many([f"ID-{i}" for i in range(100)]))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AsyncHashMap(chunk_size=0)
+        with self.assertRaises(ValueError):
+            AsyncHashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+import io
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+from src.concurrent_hash_map import ConcurrentHashMap
+from src.player import Player
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestConcurrentHashMap(unittest.TestCase):
+
+    def test_size_is_multiple_of_stripes(self):
+        hash_map = ConcurrentHashMap(stripes=4)
+        self.assertEqual(hash_map.size % 4, 0)
+
+        hash_map.resize(13)
+        self.assertEqual(hash_map.size, 16)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ConcurrentHashMap(stripes=0)
+        with self.assertRaises(ValueError):
+            ConcurrentHashMap(incremental_rehash=True)
+        with self.assertRaises(ValueError):
+            ConcurrentHashMap(storage=ConcurrentHashMap.STORAGE_OPEN_ADDRESSING)
+
+    def test_behaves_like_hash_map(self):
+        hash_map = ConcurrentHashMap(stripes=4, min_load_factor=0.1)
+        for i in range(100):
+            hash_map.add(Player(f"ID-{i}", "Jane Doe"))
+
+        hash_map.put("ID-5", "John Doe")
+        hash_map.remove("ID-6")
+
+        self.assertEqual(hash_map.get("ID-5").name, "John Doe")
+        self.assertIsNone(hash_map.get_many(["ID-6"])[0])
+        self.assertEqual(len(hash_map), 99)
+        self.assertEqual(len(list(hash_map)), 99)
+        self.assertEqual(sum(hash_map.chain_lengths()), 99)
+
+    def test_iterating_is_weakly_consistent(self):
+        hash_map = ConcurrentHashMap(stripes=4)
+        for i in range(100):
+            hash_map.add(Player(f"ID-{i}", "Jane Doe"))
+
+        # Changing the map while iterating never raises, and players that are neither added nor removed are yielded
+        seen = []
+        for i, (key, player) in enumerate(hash_map.items()):
+            seen.append(key)
+            hash_map.add(Player(f"NEW-{i}", "Jane Doe"))
+        self.assertTrue({f"ID-{i}" for i in range(100)} <= set(seen))
+        self.assertIn("NEW-0", hash_map.keys())
+
+    def test_display_is_bounded_and_leaves_stripes_free(self):
+        hash_map = ConcurrentHashMap(stripes=4)
+        for i in range(100):
+            hash_map.add(Player(f"ID-{i}", "Jane Doe"))
+
+        held = []
+
+        class Output(io.StringIO):
+            def write(self, text):
+                # Every stripe must be free while printing, so that other threads can add players. The stripes are
+                # reentrant, so whether they are held has to be checked from another thread
+                def check(i):
+                    for lock in hash_map._locks:
+                        if not lock.acquire(blocking=False):
+                            held.append(lock)
+                        else:
+                            lock.release()
+
+                run_threads(check, 1)
+                return super().write(text)
+
+        output = Output()
+        hash_map.display(limit=5, file=output)
+        self.assertEqual(held, [])
+        self.assertEqual(output.getvalue().count("Jane Doe"), 5)
+        self.assertIn("... 95 more players", output.getvalue())
+
+    def test_concurrent_setdefault_adds_each_key_once(self):
+        hash_map = ConcurrentHashMap(stripes=8)
+        stored = [[] for i in range(8)]
+
+        def work(thread):
+            for i in range(200):
+                stored[thread].append(hash_map.setdefault(Player(f"ID-{i}", f"Thread {thread}")))
+
+        run_threads(work, 8)
+
+        self.assertEqual(len(hash_map), 200)
+        for players in stored:
+            self.assertEqual([player.uid for player in players], [f"ID-{i}" for i in range(200)])
+            self.assertTrue(all(player is hash_map.get(player.uid) for player in players))
+        self.assertIsNone(hash_map.pop("ID-200", None))
+        self.assertEqual(hash_map.pop("ID-0").uid, "ID-0")
+        self.assertEqual(len(hash_map), 199)
+
+    def test_concurrent_add_get_remove(self):
+        hash_map = ConcurrentHashMap(stripes=8, min_load_factor=0.1)
+        per_thread = 500
+        errors = []
+
+        def work(thread):
+            try:
+                keys = [f"T{thread}-{i}" for i in range(per_thread)]
+                for key in keys:
+                    hash_map.add(Player(key, "Jane Doe"))
+                for key in keys:
+                    if hash_map.get(key).uid != key:
+                        errors.append(key)
+                for key in keys[::2]:
+                    hash_map.remove(key)
+            except Exception as e:
+                errors.append(e)
+
+        run_threads(work, 16)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(hash_map), 16 * per_thread // 2)
+        self.assertEqual(sum(hash_map.chain_lengths()), len(hash_map))
+        for thread in range(16):
+            self.assertEqual(hash_map.get(f"T{thread}-1").uid, f"T{thread}-1")
+            self.assertIsNone(hash_map.get_many([f"T{thread}-0"])[0])
+
+    def test_concurrent_churn_with_node_pool(self):
+        hash_map = ConcurrentHashMap(stripes=8, node_pool=64)
+        errors = []
+
+        def work(thread):
+            try:
+                for i in range(300):
+                    key = f"T{thread}-{i % 20}"
+                    player = Player(key, "Jane Doe")
+                    hash_map.add(player)
+                    if hash_map.get(key) is not player or hash_map.pop(key) is not player:
+                        errors.append(key)
+                hash_map.add(Player(f"T{thread}", "Jane Doe"))
+            except Exception as e:
+                errors.append(e)
+
+        run_threads(work, 8)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(hash_map.keys()), sorted(f"T{thread}" for thread in range(8)))
+        self.assertLessEqual(len(hash_map.node_pool), 64)
+
+    def test_get_many_reads_players_under_the_stripe(self):
+        hash_map = ConcurrentHashMap(stripes=1, node_pool=4)
+        player = Player("ID-1", "Jane Doe")
+        hash_map.add(player)
+        stripe, raced = hash_map._stripe, []
+
+        @contextmanager
+        def racing_stripe(hash_):
+            with stripe(hash_):
+                yield
+            # Another thread removes the player as soon as the stripe is released, its node being reused at once
+            if not raced:
+                raced.append(True)
+                hash_map.pop("ID-1")
+                hash_map.add(Player("ID-2", "John Doe"))
+
+        with mock.patch.object(hash_map, "_stripe", racing_stripe):
+            self.assertEqual(hash_map.get_many(["ID-1"]), [player])
+
+    def test_readers_see_every_key_during_resizes(self):
+        hash_map = ConcurrentHashMap(stripes=4)
+        stable = [Player(f"ID-{i}", "Jane Doe") for i in range(200)]
+        hash_map.update_many(stable)
+        missing = []
+
+        def work(thread):
+            if thread == 0:
+                # Keeps the array growing while the other threads read
+                for i in range(2000):
+                    hash_map.add(Player(f"NEW-{i}", "Jane Doe"))
+            else:
+                for i in range(2000):
+                    key = f"ID-{i % 200}"
+                    try:
+                        hash_map.get(key)
+                    except KeyError:
+                        missing.append(key)
+
+        run_threads(work, 4)
+
+        self.assertEqual(missing, [])
+        self.assertEqual(len(hash_map), 2200)
+        self.assertEqual(len(list(hash_map)), 2200)
+
+
+if __name__ == '__main__':
+    unittest.main()
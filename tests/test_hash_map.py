@@ -1,7 +1,13 @@
+from src import hashing
 from src.hash_map import HashMap
+from src.hash_map_views import HashMapView
+from src.hashing import HASH_FUNCTIONS
 from src.player import Player
 
+import io
+import pickle
 import unittest
+from unittest import mock
 
 
 class TestHashMap(unittest.TestCase):
@@ -103,3 +109,467 @@ class TestHashMap(unittest.TestCase):
 
         self.assertEqual(self.hash_map.get(self.players[0].uid).name, "Jane Doe")
         self.assertEqual(self.hash_map.get(self.players[1].uid).name, "Jane Doe")
+
+    def test_add_beyond_max_load_factor_grows_array(self):
+        for i in range(8):
+            self.hash_map.add(Player(f"ID-{i}", self.test_player_name))
+
+        self.assertGreater(self.hash_map.size, HashMap.DEFAULT_SIZE)
+        self.assertLessEqual(self.hash_map.load_factor, HashMap.DEFAULT_MAX_LOAD_FACTOR)
+
+    def test_resize_keeps_every_player_retrievable(self):
+        players = [Player(f"ID-{i}", self.test_player_name) for i in range(500)]
+        for player in players:
+            self.hash_map.add(player)
+
+        self.assertEqual(len(self.hash_map), 500)
+        for player in players:
+            self.assertIs(self.hash_map.get(player.uid), player)
+
+    def test_capacity_pre_sizes_array_without_resizing(self):
+        hash_map = HashMap(capacity=1000)
+        size = hash_map.size
+
+        for i in range(1000):
+            hash_map.add(Player(f"ID-{i}", self.test_player_name))
+
+        self.assertEqual(hash_map.size, size)
+
+    def test_remove_below_min_load_factor_shrinks_array(self):
+        hash_map = HashMap(min_load_factor=0.25)
+        for i in range(100):
+            hash_map.add(Player(f"ID-{i}", self.test_player_name))
+        grown_size = hash_map.size
+
+        for i in range(95):
+            hash_map.remove(f"ID-{i}")
+
+        self.assertLess(hash_map.size, grown_size)
+        self.assertGreaterEqual(hash_map.size, HashMap.DEFAULT_SIZE)
+        for i in range(95, 100):
+            self.assertEqual(hash_map.get(f"ID-{i}").uid, f"ID-{i}")
+
+    def test_invalid_resize_settings_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            HashMap(max_load_factor=0)
+
+        with self.assertRaises(ValueError):
+            HashMap(growth_factor=1)
+
+        with self.assertRaises(ValueError):
+            HashMap(min_load_factor=0.5)
+
+    def test_iter_yields_every_player(self):
+        for player in self.players:
+            self.hash_map.add(player)
+
+        self.assertCountEqual(list(self.hash_map), self.players)
+
+    def test_incremental_rehash_spreads_migration_over_operations(self):
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        for i in range(8):
+            hash_map.add(Player(f"ID-{i}", self.test_player_name))
+
+        self.assertTrue(hash_map.is_rehashing)
+
+        for i in range(HashMap.DEFAULT_SIZE):
+            hash_map.get("ID-0")
+
+        self.assertFalse(hash_map.is_rehashing)
+
+    def test_incremental_rehash_get_len_and_iter_correct_during_migration(self):
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        players = [Player(f"ID-{i}", self.test_player_name) for i in range(200)]
+
+        for count, player in enumerate(players, start=1):
+            hash_map.add(player)
+
+            self.assertEqual(len(hash_map), count)
+            self.assertIs(hash_map.get(players[count // 2].uid), players[count // 2])
+
+        self.assertCountEqual(list(hash_map), players)
+        for player in players:
+            self.assertIs(hash_map.get(player.uid), player)
+
+    def test_incremental_rehash_remove_and_put_during_migration(self):
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        for i in range(8):
+            hash_map.add(Player(f"ID-{i}", self.test_player_name))
+
+        self.assertTrue(hash_map.is_rehashing)
+
+        hash_map.remove("ID-7")
+        hash_map.put("ID-6", "Hello, World!")
+
+        self.assertEqual(len(hash_map), 7)
+        self.assertEqual(hash_map.get("ID-6").name, "Hello, World!")
+        with self.assertRaises(KeyError):
+            hash_map.get("ID-7")
+
+    def test_resize_reuses_cached_hashes(self):
+        calls = []
+
+        def counting_hash(key):
+            calls.append(key)
+            return HASH_FUNCTIONS["fnv1a64"](key)
+
+        hash_map = HashMap(hash_function=counting_hash)
+        for i in range(100):
+            hash_map.add(Player(f"ID-{i}", self.test_player_name))
+
+        self.assertGreater(hash_map.size, HashMap.DEFAULT_SIZE)
+        self.assertEqual(len(calls), 100)
+
+    def test_hash_function_option_places_players_with_that_function(self):
+        for name in ("pearson16", "fnv1a64", "siphash"):
+            hash_map = HashMap(hash_function=name)
+            for player in self.players:
+                hash_map.add(player)
+
+            index = HASH_FUNCTIONS[name](self.players[0].uid) % hash_map.size
+            self.assertIn(self.players[0], hash_map._array[index])
+            for player in self.players:
+                self.assertIs(hash_map.get(player.uid), player)
+
+    def test_from_players_pre_sizes_and_adds_every_player(self):
+        players = [Player(f"ID-{i}", self.test_player_name) for i in range(1000)]
+        hash_map = HashMap.from_players(iter(players))
+
+        self.assertEqual(len(hash_map), 1000)
+        self.assertLessEqual(hash_map.load_factor, HashMap.DEFAULT_MAX_LOAD_FACTOR)
+        for player in players:
+            self.assertIs(hash_map.get(player.uid), player)
+
+    def test_from_players_open_addressing_storage(self):
+        hash_map = HashMap.from_players(self.players, storage=HashMap.STORAGE_OPEN_ADDRESSING)
+
+        self.assertEqual(len(hash_map), 10)
+        for player in self.players:
+            self.assertIs(hash_map.get(player.uid), player)
+
+    def test_update_many_grows_existing_map(self):
+        self.hash_map.add(self.players[0])
+        players = [Player(f"NEW-{i}", self.test_player_name) for i in range(100)]
+
+        self.hash_map.update_many(players)
+
+        self.assertEqual(len(self.hash_map), 101)
+        self.assertIs(self.hash_map.get(self.players[0].uid), self.players[0])
+        for player in players:
+            self.assertIs(self.hash_map.get(player.uid), player)
+
+    def test_update_many_small_batches_grow_geometrically(self):
+        with mock.patch.object(HashMap, "resize", autospec=True, side_effect=HashMap.resize) as resize:
+            for i in range(100):
+                self.hash_map.update_many([Player(f"NEW-{i}-{j}", self.test_player_name) for j in range(10)])
+
+        self.assertEqual(len(self.hash_map), 1000)
+        self.assertLessEqual(resize.call_count, 8)
+        self.assertLessEqual(self.hash_map.load_factor, HashMap.DEFAULT_MAX_LOAD_FACTOR)
+
+    def test_update_many_during_incremental_rehash(self):
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        for player in self.players[:8]:
+            hash_map.add(player)
+        self.assertTrue(hash_map.is_rehashing)
+
+        hash_map.update_many(self.players[8:])
+
+        self.assertCountEqual(list(hash_map), self.players)
+
+    def test_bulk_operations_with_precomputed_hashes(self):
+        hash_map = HashMap(hash_function="fnv1a64")
+        hash_map.add(self.players[0])
+        uids = [player.uid for player in self.players]
+        hashes = hash_map.hash_keys(uids)
+
+        self.assertEqual(hash_map.contains_many(uids, hashes), [True] + [False] * 9)
+        players = [hash_map.new_player(uid, self.test_player_name, hash_) for uid, hash_ in zip(uids[1:], hashes[1:])]
+        hash_map.update_many(players, hashes[1:])
+
+        self.assertEqual(hash_map.get_many(uids, hashes=hashes), [self.players[0]] + players)
+        self.assertEqual(hash(players[0]), Player.pearson_hash(uids[1]))
+
+    def test_reserve_incremental_is_migrated_in_steps(self):
+        hash_map = HashMap.from_players(self.players, incremental_rehash=True)
+
+        hash_map.reserve(1000, incremental=True)
+        self.assertTrue(hash_map.is_rehashing)
+        while hash_map.is_rehashing:
+            hash_map.migrate(1)
+
+        self.assertGreaterEqual(hash_map.size, 1000 / HashMap.DEFAULT_MAX_LOAD_FACTOR)
+        self.assertCountEqual(list(hash_map), self.players)
+
+        # Without incremental_rehash the map is resized at once
+        self.hash_map.reserve(1000, incremental=True)
+        self.assertFalse(self.hash_map.is_rehashing)
+
+    def test_chain_lengths_match_player_lists(self):
+        for player in self.players:
+            self.hash_map.add(player)
+
+        chain_lengths = self.hash_map.chain_lengths()
+
+        self.assertEqual(len(chain_lengths), self.hash_map.size)
+        self.assertEqual(sum(chain_lengths), len(self.hash_map))
+        self.assertEqual(chain_lengths, [len(list(player_list)) for player_list in self.hash_map._array])
+
+    def test_self_organizing_reorders_player_list_on_get(self):
+        for self_organizing, expected_position in ((HashMap.MOVE_TO_FRONT, 0), (HashMap.TRANSPOSE, 8)):
+            hash_map = HashMap(hash_function=lambda key: 0, capacity=10, self_organizing=self_organizing)
+            for player in self.players:
+                hash_map.add(player)
+
+            self.assertIs(hash_map.get(self.players[-1].uid), self.players[-1])
+
+            self.assertEqual(list(hash_map._array[0]).index(self.players[-1]), expected_position)
+            self.assertEqual(len(hash_map._array[0]), 10)
+
+    def test_unknown_self_organizing_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            HashMap(self_organizing="sort")
+
+    def test_get_many_returns_players_in_input_order(self):
+        for player in self.players:
+            self.hash_map.add(player)
+        keys = ["ID-3", "MISSING", "ID-0", "ID-3", "ID-9"]
+
+        self.assertEqual(self.hash_map.get_many(keys),
+                         [self.players[3], None, self.players[0], self.players[3], self.players[9]])
+        self.assertEqual(self.hash_map.get_many(["MISSING"], default="default"), ["default"])
+        self.assertEqual(self.hash_map.contains_many(keys), [True, False, True, True, True])
+
+    def test_get_many_without_numpy_matches_get(self):
+        for player in self.players:
+            self.hash_map.add(player)
+        keys = [player.uid for player in self.players] + ["MISSING"]
+
+        with mock.patch.object(hashing, "numpy", None):
+            results = self.hash_map.get_many(keys)
+
+        self.assertEqual(results, self.players + [None])
+
+    def test_get_many_with_colliding_keys(self):
+        hash_map = HashMap(hash_function=lambda key: 0, capacity=10)
+        for player in self.players:
+            hash_map.add(player)
+
+        keys = ["ID-9", "ID-1", "MISSING", "ID-1"]
+        self.assertEqual(hash_map.get_many(keys), [self.players[9], self.players[1], None, self.players[1]])
+
+    def test_add_existing_uid_replaces_player_and_keeps_length(self):
+        self.hash_map.add(self.players[0])
+        replacement = Player(self.players[0].uid, "John Doe")
+        self.hash_map.add(replacement)
+
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertIs(self.hash_map.get(self.players[0].uid), replacement)
+        self.assertEqual(list(self.hash_map), [replacement])
+
+    def test_upsert_returns_replaced_player(self):
+        self.assertIsNone(self.hash_map.upsert(self.players[0]))
+        replacement = Player(self.players[0].uid, "John Doe")
+
+        self.assertIs(self.hash_map.upsert(replacement), self.players[0])
+        self.assertIs(self.hash_map.get(self.players[0].uid), replacement)
+        self.assertEqual(len(self.hash_map), 1)
+
+    def test_setdefault_only_adds_missing_player(self):
+        self.assertIs(self.hash_map.setdefault(self.players[0]), self.players[0])
+        self.assertIs(self.hash_map.setdefault(Player(self.players[0].uid, "John Doe")), self.players[0])
+
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertEqual(self.hash_map.get(self.players[0].uid).name, self.test_player_name)
+
+    def test_pop_returns_player_or_default(self):
+        self.hash_map.add(self.players[0])
+
+        self.assertIs(self.hash_map.pop(self.players[0].uid), self.players[0])
+        self.assertEqual(len(self.hash_map), 0)
+        self.assertIsNone(self.hash_map.pop(self.players[0].uid, None))
+        with self.assertRaises(KeyError):
+            self.hash_map.pop(self.players[0].uid)
+
+    def test_update_many_replaces_duplicates_and_counts_them_once(self):
+        self.hash_map.update_many(self.players[:5])
+        replacements = [Player(player.uid, "John Doe") for player in self.players[3:8]]
+        self.hash_map.update_many(replacements + [Player("ID-7", "Jack Doe")])
+
+        self.assertEqual(len(self.hash_map), 8)
+        self.assertEqual(len(list(self.hash_map)), 8)
+        self.assertEqual(self.hash_map.get("ID-3").name, "John Doe")
+        self.assertEqual(self.hash_map.get("ID-7").name, "Jack Doe")
+
+    def test_upsert_family_during_incremental_rehash(self):
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        for player in self.players[:8]:
+            hash_map.add(player)
+        self.assertTrue(hash_map.is_rehashing)
+
+        for player in self.players:
+            hash_map.upsert(Player(player.uid, "John Doe"))
+        self.assertEqual(hash_map.setdefault(self.players[0]).name, "John Doe")
+        hash_map.pop("ID-9")
+
+        self.assertEqual(len(hash_map), 9)
+        self.assertEqual(sorted(player.uid for player in hash_map), sorted(f"ID-{i}" for i in range(9)))
+
+    def test_get_many_during_incremental_rehash_and_open_addressing(self):
+        for hash_map in (HashMap(incremental_rehash=True, rehash_step=1),
+                         HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING)):
+            for player in self.players[:8]:
+                hash_map.add(player)
+
+            keys = [player.uid for player in self.players]
+            self.assertEqual(hash_map.get_many(keys), self.players[:8] + [None, None])
+            self.assertEqual(hash_map.contains_many(keys), [True] * 8 + [False, False])
+
+    def test_views_iterate_size_and_check_membership(self):
+        for player in self.players:
+            self.hash_map.add(player)
+
+        keys, values, items = self.hash_map.keys(), self.hash_map.values(), self.hash_map.items()
+        self.assertEqual(len(keys), 10)
+        self.assertCountEqual(list(keys), [player.uid for player in self.players])
+        self.assertCountEqual(list(values), self.players)
+        self.assertCountEqual(list(items), [(player.uid, player) for player in self.players])
+        self.assertCountEqual(list(self.hash_map), self.players)
+
+        self.assertIn("ID-3", keys)
+        self.assertIn("ID-3", self.hash_map)
+        self.assertNotIn("ID-10", keys)
+        self.assertIn(self.players[3], values)
+        self.assertNotIn(Player("ID-3", self.test_player_name), values)
+        self.assertIn(("ID-3", self.players[3]), items)
+        self.assertNotIn(("ID-3", self.players[4]), items)
+
+        # Views reflect later changes
+        self.hash_map.remove("ID-3")
+        self.assertEqual(len(values), 9)
+        self.assertNotIn("ID-3", keys)
+
+    def test_changing_map_while_iterating_raises_runtime_error(self):
+        for player in self.players:
+            self.hash_map.add(player)
+
+        for change in (lambda: self.hash_map.add(Player("ID-10", self.test_player_name)),
+                       lambda: self.hash_map.remove("ID-0"),
+                       lambda: self.hash_map.resize(50)):
+            iterator = iter(self.hash_map.items())
+            next(iterator)
+            change()
+            with self.assertRaises(RuntimeError):
+                next(iterator)
+
+        # Renaming or replacing players does not change the layout of the map
+        iterator = iter(self.hash_map)
+        next(iterator)
+        self.hash_map.put("ID-1", "John Doe")
+        self.hash_map.add(Player("ID-2", "John Doe"))
+        self.assertEqual(len(list(iterator)), len(self.hash_map) - 1)
+
+    def test_getting_players_while_iterating_yields_every_player_once(self):
+        players = [Player(f"ID-{i}", self.test_player_name) for i in range(200)]
+        for hash_map in (HashMap(incremental_rehash=True, rehash_step=1),
+                         HashMap(self_organizing=HashMap.MOVE_TO_FRONT, max_load_factor=10),
+                         HashMap(self_organizing=HashMap.TRANSPOSE, incremental_rehash=True)):
+            for player in players:
+                hash_map.add(player)
+
+            for getting in (lambda player: hash_map.get(player.uid), lambda player: hash_map.get("ID-0")):
+                # Every get reorders a PlayerList or migrates part of the rehash
+                seen = []
+                for player in hash_map.values():
+                    seen.append(player.uid)
+                    getting(player)
+                self.assertCountEqual(seen, [player.uid for player in players])
+
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        for player in players:
+            hash_map.add(player)
+        self.assertTrue(hash_map.is_rehashing)
+        iterator = iter(hash_map)
+        next(iterator)
+        hash_map.add(Player("ID-200", self.test_player_name))
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
+    def test_display_during_incremental_rehash_shows_bucket_indices(self):
+        hash_map = HashMap(incremental_rehash=True, rehash_step=1)
+        for player in self.players[:8]:
+            hash_map.add(player)
+        self.assertTrue(hash_map.is_rehashing)
+
+        output = io.StringIO()
+        hash_map.display(file=output)
+        for player in self.players[:8]:
+            hash_ = Player.pearson_hash(player.uid)
+            if hash_ % hash_map._old_size >= hash_map._rehash_index:
+                line = f"  old {hash_ % hash_map._old_size}: "
+            else:
+                line = f"  {hash_ % hash_map.size}: "
+            self.assertIn(line, output.getvalue())
+            self.assertIn(str(player), output.getvalue().split(line)[1].splitlines()[0])
+
+    def test_repr_and_display_are_bounded(self):
+        hash_map = HashMap.from_players(Player(f"ID-{i}", self.test_player_name) for i in range(100))
+
+        self.assertTrue(repr(hash_map).endswith(f", ... {100 - HashMap.REPR_LIMIT} more)"))
+        self.assertEqual(repr(hash_map).count(self.test_player_name), HashMap.REPR_LIMIT)
+        self.assertTrue(repr(hash_map.keys()).startswith("KeysView(['ID-"))
+
+        output = io.StringIO()
+        hash_map.display(limit=5, file=output)
+        self.assertEqual(output.getvalue().count(self.test_player_name), 5)
+        self.assertIn("... 95 more players", output.getvalue())
+
+        output = io.StringIO()
+        hash_map.display(file=output)
+        self.assertEqual(output.getvalue().count(self.test_player_name), 100)
+        self.assertNotIn("more players", output.getvalue())
+
+    def test_node_pool_reuses_removed_nodes(self):
+        hash_map = HashMap(node_pool=4)
+        for player in self.players:
+            hash_map.add(player)
+
+        for player in self.players[:6]:
+            hash_map.remove(player.uid)
+        self.assertEqual(len(hash_map.node_pool), 4)
+
+        for player in self.players[:6]:
+            hash_map.add(player)
+        self.assertEqual(len(hash_map.node_pool), 0)
+        self.assertEqual(len(hash_map), 10)
+        for player in self.players:
+            self.assertIs(hash_map.get(player.uid), player)
+
+        self.assertIsNone(HashMap().node_pool)
+        with self.assertRaises(ValueError):
+            HashMap(node_pool=4, debug=True)
+        with self.assertRaises(ValueError):
+            HashMap(node_pool=4, storage=HashMap.STORAGE_OPEN_ADDRESSING)
+
+    def test_map_with_node_pool_can_be_pickled(self):
+        hash_map = HashMap(node_pool=4)
+        for player in self.players:
+            hash_map.add(player)
+        hash_map.remove(self.players[0].uid)
+
+        copy = pickle.loads(pickle.dumps(hash_map))
+
+        self.assertEqual(copy.node_pool.capacity, 4)
+        self.assertEqual(len(copy.node_pool), 0)
+        self.assertEqual(sorted(player.uid for player in copy), sorted(player.uid for player in self.players[1:]))
+
+        # Every PlayerList of the copy still returns its nodes to the copy's pool
+        for player in self.players[1:7]:
+            copy.remove(player.uid)
+        self.assertEqual(len(copy.node_pool), 4)
+        copy.add(self.players[0])
+        self.assertEqual(len(copy.node_pool), 3)
+
+    def test_hash_map_view_is_abstract(self):
+        with self.assertRaises(TypeError):
+            HashMapView(self.hash_map)
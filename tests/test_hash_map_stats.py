@@ -0,0 +1,130 @@
+import pickle
+import unittest
+
+from src.concurrent_hash_map import ConcurrentHashMap
+from src.hash_map import HashMap
+from src.hash_map_stats import to_prometheus
+from src.open_address_hash_map import OpenAddressHashMap
+from src.player import Player
+
+
+class TestHashMapStats(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [Player(f"ID-{i}", "Jane Doe") for i in range(20)]
+
+    def test_disabled_by_default(self):
+        hash_map = HashMap()
+
+        self.assertIsNone(hash_map.stats)
+        self.assertIs(type(hash_map), HashMap)
+        self.assertNotIn("gets", hash_map.stats_report())
+
+    def test_counts_operations_probes_and_resizes(self):
+        hash_map = HashMap(stats=True)
+        for player in self.players:
+            hash_map.add(player)
+        hash_map.get("ID-1")
+        with self.assertRaises(KeyError):
+            hash_map.get("missing")
+        hash_map.put("ID-2", "John Doe")
+        hash_map.remove("ID-3")
+        hash_map.pop("missing", None)
+
+        report = hash_map.stats_report()
+        self.assertEqual(report["gets"], {"hit": 1, "miss": 1})
+        self.assertGreaterEqual(report["probes_per_get"]["hit"], 1)
+        self.assertEqual(report["resizes"], {"grow": 2, "shrink": 0})
+        self.assertEqual(report["operations"]["add"]["count"], 20)
+        self.assertEqual(report["operations"]["upsert"]["count"], 0)
+        self.assertEqual(report["operations"]["get"]["count"], 2)
+        self.assertEqual(report["operations"]["put"]["count"], 1)
+        self.assertEqual(report["operations"]["remove"]["count"], 1)
+        self.assertEqual(report["operations"]["pop"]["count"], 1)
+        self.assertEqual(sum(report["operations"]["add"]["histogram"].values()), 20)
+
+    def test_probes_match_chain_positions(self):
+        hash_map = HashMap(stats=True, max_load_factor=10)
+        hash_map.resize(1)
+        for player in self.players[:3]:
+            hash_map.add(player)
+        hash_map.resize(100)
+        hash_map.resize(1)
+
+        hash_map.get("ID-2")
+        hash_map.get_many(["ID-0"])
+        with self.assertRaises(KeyError):
+            hash_map.get("missing")
+
+        self.assertEqual(hash_map.stats.probes, {"hit": 3, "miss": 3})
+        self.assertEqual(hash_map.stats.resizes, {"grow": 1, "shrink": 2})
+
+    def test_layout_report(self):
+        hash_map = HashMap.from_players(self.players)
+        report = hash_map.stats_report()
+
+        self.assertEqual(report["players"], 20)
+        self.assertEqual(report["size"], hash_map.size)
+        self.assertEqual(sum(report["occupancy"].values()), hash_map.size)
+        self.assertEqual(sum(length * count for length, count in report["occupancy"].items()), 20)
+        self.assertEqual(report["chain_length_max"], max(hash_map.chain_lengths()))
+
+    def test_enable_and_disable_keep_class_and_players(self):
+        for hash_map in (HashMap(), HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING), ConcurrentHashMap()):
+            cls = type(hash_map)
+            hash_map.update_many(self.players)
+            hash_map.enable_stats()
+
+            self.assertIsInstance(hash_map, cls)
+            self.assertEqual(type(hash_map).__name__, cls.__name__)
+            self.assertIs(hash_map.get("ID-5"), self.players[5])
+            self.assertEqual(hash_map.stats.gets["hit"], 1)
+
+            hash_map.disable_stats()
+            self.assertIs(type(hash_map), cls)
+            self.assertIsNone(hash_map.stats)
+            self.assertEqual(len(hash_map), 20)
+
+    def test_open_addressing_probes(self):
+        hash_map = OpenAddressHashMap(stats=True)
+        hash_map.update_many(self.players)
+        for player in self.players:
+            hash_map.get(player.uid)
+
+        self.assertEqual(hash_map.stats.gets["hit"], 20)
+        self.assertGreaterEqual(hash_map.stats.probes["hit"], 20)
+        self.assertEqual(hash_map.stats_report()["operations"]["update_many"]["count"], 1)
+
+    def test_prometheus_export(self):
+        hash_map = HashMap(stats=True)
+        hash_map.update_many(self.players)
+        hash_map.get("ID-1")
+        text = to_prometheus(hash_map.stats_report())
+
+        self.assertIn("hashmap_players 20\n", text)
+        self.assertIn('hashmap_gets_total{result="hit"} 1\n', text)
+        self.assertIn("# TYPE hashmap_operation_duration_seconds histogram", text)
+        self.assertIn('hashmap_operation_duration_seconds_count{operation="get"} 1\n', text)
+        self.assertIn('hashmap_operation_duration_seconds_bucket{operation="get",le="+Inf"} 1\n', text)
+        self.assertNotIn("hashmap_gets_total", to_prometheus(HashMap().stats_report()))
+
+    def test_stats_enabled_map_can_be_pickled(self):
+        for hash_map in (HashMap(stats=True), HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING, stats=True)):
+            for player in self.players:
+                hash_map.add(player)
+            hash_map.get(self.players[0].uid)
+
+            copy = pickle.loads(pickle.dumps(hash_map))
+
+            self.assertIs(type(copy), type(hash_map))
+            self.assertEqual(copy.stats.as_dict(), hash_map.stats.as_dict())
+            self.assertEqual(copy.get(self.players[1].uid).uid, self.players[1].uid)
+            self.assertEqual(copy.stats.gets["hit"], 2)
+
+            copy.disable_stats()
+            self.assertIs(type(copy), type(hash_map)._uninstrumented_class)
+            self.assertEqual(len(pickle.loads(pickle.dumps(copy))), len(self.players))
+
+
+if __name__ == '__main__':
+    unittest.main()
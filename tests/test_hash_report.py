@@ -0,0 +1,29 @@
+import unittest
+
+from src.hash_report import bucket_occupancy, distribution_report, format_report, generate_keys
+
+
+class TestHashReport(unittest.TestCase):
+
+    def test_bucket_occupancy_counts_every_key(self):
+        occupancy = bucket_occupancy(range(100), 10, lambda key: key)
+        self.assertEqual(occupancy, [10] * 10)
+
+    def test_distribution_report_counts_collisions(self):
+        report = distribution_report(["a", "b", "c", "d"], 4, lambda key: 0)
+
+        self.assertEqual(report["used_buckets"], 1)
+        self.assertEqual(report["collisions"], 3)
+        self.assertEqual(report["max_chain"], 4)
+        self.assertEqual(report["histogram"], {0: 3, 4: 1})
+
+    def test_format_report_includes_histogram_rows(self):
+        report = distribution_report(generate_keys("sequential", 100), 16, "fnv1a64")
+        text = format_report("fnv1a64", report)
+
+        self.assertTrue(text.startswith("fnv1a64: 100 keys in 16 buckets"))
+        self.assertEqual(len(text.splitlines()), len(report["histogram"]) + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
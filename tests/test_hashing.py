@@ -0,0 +1,58 @@
+import unittest
+
+from src import hashing
+from src.hashing import fnv1a_hash, get_hash_function, make_siphash, pearson_hash, pearson_hash_many, siphash, \
+    HASH_FUNCTIONS
+
+
+class TestHashing(unittest.TestCase):
+
+    def test_pearson_hash_anagrams_hash_differently(self):
+        self.assertNotEqual(pearson_hash("ab"), pearson_hash("ba"))
+        self.assertNotEqual(pearson_hash("ab", 32), pearson_hash("ba", 32))
+
+    def test_pearson_hash_fits_in_requested_width(self):
+        for bits in (8, 16, 32, 64):
+            for key in ("", "a", "ID-1234", "a much longer key than the others"):
+                self.assertLess(pearson_hash(key, bits), 2 ** bits)
+
+    def test_pearson_hash_widened_starts_with_8_bit_hash(self):
+        self.assertEqual(pearson_hash("ID-1234", 32) >> 24, pearson_hash("ID-1234", 8))
+
+    def test_pearson_hash_invalid_width_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            pearson_hash("key", 12)
+
+    @unittest.skipIf(hashing.numpy is None, "numpy is not installed")
+    def test_pearson_hash_many_matches_pearson_hash(self):
+        keys = ["", "a", "ab", "ba", "ID-1234", "héllo wörld", 1234, "a much longer key than the others"]
+
+        for bits in (8, 16, 32, 64):
+            self.assertEqual(pearson_hash_many(keys, bits).tolist(), [pearson_hash(key, bits) for key in keys])
+
+        self.assertEqual(pearson_hash_many([], 32).tolist(), [])
+
+    def test_fnv1a_hash_matches_reference_values(self):
+        self.assertEqual(fnv1a_hash("", 32), 0x811c9dc5)
+        self.assertEqual(fnv1a_hash("a", 32), 0xe40c292c)
+        self.assertEqual(fnv1a_hash("a", 64), 0xaf63dc4c8601ec8c)
+        self.assertEqual(fnv1a_hash("foobar", 64), 0x85944171f73967e8)
+
+    def test_siphash_matches_reference_value(self):
+        # Test vector from the SipHash paper: a 15 byte message 00..0e keyed with 00..0f
+        secret = bytes(range(16))
+        self.assertEqual(siphash(bytes(range(15)), secret), 0xa129ca6149be45e5)
+
+    def test_siphash_secret_changes_hash(self):
+        self.assertNotEqual(make_siphash(bytes(16))("ID-1"), make_siphash(bytes(range(16)))("ID-1"))
+
+    def test_get_hash_function_by_name_and_callable(self):
+        self.assertIs(get_hash_function("fnv1a64"), HASH_FUNCTIONS["fnv1a64"])
+        self.assertIs(get_hash_function(len), len)
+
+        with self.assertRaises(ValueError):
+            get_hash_function("md5")
+
+
+if __name__ == '__main__':
+    unittest.main()
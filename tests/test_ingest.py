@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import ingest
+from src.concurrent_hash_map import ConcurrentHashMap
+from src.hash_map import HashMap
+from src.player import Player
+
+
+class TestIngest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.hash_map = HashMap()
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(content)
+        return path
+
+    def test_read_csv_in_chunks(self):
+        path = self.write("players.csv", "name,uid\nJane Doe,ID-1\n\"Doe, John\",ID-2\nJäne,ID-3\n")
+
+        chunks = list(ingest.read_rows(path, chunk_size=2))
+
+        self.assertEqual(chunks, [[("ID-1", "Jane Doe"), ("ID-2", "Doe, John")], [("ID-3", "Jäne")]])
+
+    def test_read_jsonl(self):
+        lines = [{"uid": 1, "name": "Jane Doe"}, {"uid": "ID-2", "name": "John Doe"}]
+        path = self.write("players.jsonl", "\n".join(json.dumps(line) for line in lines) + "\n\n")
+
+        self.assertEqual(list(ingest.read_rows(path)), [[("1", "Jane Doe"), ("ID-2", "John Doe")]])
+
+    def test_read_with_workers_keeps_order(self):
+        path = self.write("players.csv", "uid,name\n" + "".join(f"ID-{i},Jane Doe\n" for i in range(100)))
+
+        rows = [row for chunk in ingest.read_rows(path, chunk_size=7, workers=2) for row in chunk]
+
+        self.assertEqual([uid for uid, name in rows], [f"ID-{i}" for i in range(100)])
+
+    def test_unknown_format_and_columns(self):
+        with self.assertRaises(ValueError):
+            list(ingest.read_rows(self.write("players.txt", "")))
+        with self.assertRaises(ValueError):
+            list(ingest.read_rows(self.write("players.csv", "id,name\nID-1,Jane Doe\n")))
+
+    def test_ingest_reports_counts(self):
+        path = self.write("players.csv", "uid,name\n" + "".join(f"ID-{i},Jane Doe\n" for i in range(25)))
+
+        report = ingest.ingest(self.hash_map, path, chunk_size=10)
+
+        self.assertEqual(len(self.hash_map), 25)
+        self.assertEqual((report["rows"], report["added"], report["overwritten"], report["skipped"]), (25, 25, 0, 0))
+        self.assertGreater(report["rows_per_second"], 0)
+        self.assertEqual(hash(self.hash_map.get("ID-3")), Player.pearson_hash("ID-3"))
+
+    def test_expected_rows_grows_map_once(self):
+        ingest.ingest_rows(self.hash_map, [], expected_rows=1000)
+
+        self.assertGreaterEqual(self.hash_map.size, 1000 / HashMap.DEFAULT_MAX_LOAD_FACTOR)
+
+    def test_custom_hash_function(self):
+        hash_map = HashMap(hash_function="fnv1a64")
+        ingest.ingest_rows(hash_map, [[("ID-1", "Jane Doe"), ("ID-1", "John Doe")]], ingest.DUPLICATE_OVERWRITE)
+
+        self.assertEqual(hash_map.get("ID-1").name, "John Doe")
+        self.assertEqual(hash(hash_map.get("ID-1")), Player.pearson_hash("ID-1"))
+
+    def test_ingest_goes_through_subclass_overrides(self):
+        hash_map = ConcurrentHashMap()
+
+        with mock.patch.object(ConcurrentHashMap, "update_many", autospec=True,
+                               side_effect=ConcurrentHashMap.update_many) as update_many:
+            ingest.ingest_rows(hash_map, [[(f"ID-{i}", "Jane Doe") for i in range(10)]])
+
+        update_many.assert_called_once()
+        self.assertEqual(len(hash_map), 10)
+
+    def test_duplicate_policies(self):
+        self.hash_map.add(Player("ID-1", "Stored"))
+        chunks = [[("ID-1", "First"), ("ID-2", "First")], [("ID-2", "Second"), ("ID-3", "First")]]
+
+        skipping = HashMap.from_players([Player("ID-1", "Stored")])
+        report = ingest.ingest_rows(skipping, chunks, ingest.DUPLICATE_SKIP)
+        self.assertEqual((report["added"], report["skipped"]), (2, 2))
+        self.assertEqual([skipping.get(f"ID-{i}").name for i in (1, 2, 3)], ["Stored", "First", "First"])
+
+        report = ingest.ingest_rows(self.hash_map, chunks, ingest.DUPLICATE_OVERWRITE)
+        self.assertEqual((report["added"], report["overwritten"]), (2, 2))
+        self.assertEqual(len(self.hash_map), 3)
+        self.assertEqual([self.hash_map.get(f"ID-{i}").name for i in (1, 2, 3)], ["First", "Second", "First"])
+
+    def test_duplicate_within_chunk_is_overwritten(self):
+        ingest.ingest_rows(self.hash_map, [[("ID-1", "First"), ("ID-1", "Second")]], ingest.DUPLICATE_OVERWRITE)
+
+        self.assertEqual(len(self.hash_map), 1)
+        self.assertEqual(self.hash_map.get("ID-1").name, "Second")
+
+    def test_duplicate_error(self):
+        with self.assertRaises(ValueError):
+            ingest.ingest_rows(self.hash_map, [[("ID-1", "First"), ("ID-2", "First"), ("ID-1", "Second")]])
+
+        # The rows before the duplicate were added
+        self.assertEqual(len(self.hash_map), 2)
+
+        with self.assertRaises(ValueError):
+            ingest.ingest_rows(self.hash_map, [], "ignore")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from src.concurrent_hash_map import ConcurrentHashMap
+from src.hash_map import HashMap
+from src.name_index import NameIndex
+from src.player import Player
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.hash_map = HashMap()
+        self.players = [Player("ID-1", "Jane Doe"), Player("ID-2", "John Doe"), Player("ID-3", "Jane Doe"),
+                        Player("ID-4", "Jack Smith")]
+        for player in self.players[:2]:
+            self.hash_map.add(player)
+        self.index = NameIndex(self.hash_map)
+
+    def test_indexes_existing_and_added_players(self):
+        self.hash_map.add(self.players[2])
+        self.hash_map.update_many([self.players[3]])
+
+        self.assertEqual(self.index.find("Jane Doe"), [self.players[0], self.players[2]])
+        self.assertEqual(self.index.find("Jack Smith"), [self.players[3]])
+        self.assertEqual(self.index.find("Nobody"), [])
+        self.assertEqual(len(self.index), 4)
+
+    def test_find_prefix_orders_by_name(self):
+        for player in self.players[2:]:
+            self.hash_map.add(player)
+
+        self.assertEqual(self.index.find_prefix("Ja"), [self.players[3], self.players[0], self.players[2]])
+        self.assertEqual(self.index.find_prefix("Ja", limit=2), [self.players[3], self.players[0]])
+        self.assertEqual(self.index.find_prefix("Jo"), [self.players[1]])
+        self.assertEqual(self.index.find_prefix("K"), [])
+        self.assertEqual(self.index.names("J"), ["Jack Smith", "Jane Doe", "John Doe"])
+
+    def test_put_moves_player_to_new_name(self):
+        self.hash_map.put("ID-1", "Jill Doe")
+
+        self.assertEqual(self.index.find("Jane Doe"), [])
+        self.assertNotIn("Jane Doe", self.index)
+        self.assertEqual(self.index.find("Jill Doe"), [self.players[0]])
+        self.assertEqual(self.index.names(), ["Jill Doe", "John Doe"])
+
+    def test_remove_and_replace_update_index(self):
+        self.hash_map.remove("ID-2")
+        replacement = Player("ID-1", "Janet Doe")
+        self.hash_map.upsert(replacement)
+
+        self.assertEqual(self.index.names(), ["Janet Doe"])
+        self.assertEqual(self.index.find("Janet Doe"), [replacement])
+        self.assertEqual(len(self.index), 1)
+
+    def test_bulk_load_many_names(self):
+        players = [Player(f"P-{i}", f"Player {i:04}") for i in range(1000)]
+        self.hash_map.update_many(players)
+
+        self.assertEqual(len(self.index), 1002)
+        self.assertEqual(self.index.names("Player 000"), [f"Player {i:04}" for i in range(10)])
+        self.assertEqual(self.index.find("Player 0500"), [players[500]])
+
+    def test_key_makes_lookups_case_insensitive(self):
+        index = NameIndex(self.hash_map, key=str.casefold)
+
+        self.assertEqual(index.find("JANE DOE"), [self.players[0]])
+        self.assertEqual(index.find_prefix("jo"), [self.players[1]])
+
+    def test_close_stops_updates(self):
+        self.index.close()
+        self.hash_map.add(self.players[3])
+
+        self.assertEqual(self.index.find("Jack Smith"), [])
+
+    def test_works_with_other_storages(self):
+        for hash_map in (HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING), ConcurrentHashMap()):
+            index = NameIndex(hash_map)
+            for player in self.players:
+                hash_map.add(player)
+            hash_map.put("ID-4", "Jane Smith")
+            hash_map.remove("ID-1")
+
+            self.assertEqual(index.find_prefix("Jane"), [self.players[2], self.players[3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import random
+import unittest
+
+from src.hash_map import HashMap
+from src.open_address_hash_map import OpenAddressHashMap
+from src.player import Player
+
+
+class TestOpenAddressHashMap(unittest.TestCase):
+
+    def setUp(self):
+        self.hash_map = HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING)
+        self.test_player_name = "Jane Doe"
+
+        self.players = [Player(f"ID-{i}", self.test_player_name) for i in range(10)]
+
+    def test_storage_option_creates_open_address_hash_map(self):
+        self.assertIsInstance(self.hash_map, OpenAddressHashMap)
+        self.assertIsInstance(HashMap(), HashMap)
+        self.assertNotIsInstance(HashMap(), OpenAddressHashMap)
+
+    def test_unknown_storage_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            HashMap(storage="cuckoo")
+
+    def test_incremental_rehash_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING, incremental_rehash=True)
+
+    def test_add_and_get_returns_correct_player(self):
+        for player in self.players:
+            self.hash_map.add(player)
+
+        self.assertEqual(len(self.hash_map), 10)
+        for player in self.players:
+            self.assertIs(self.hash_map.get(player.uid), player)
+
+    def test_add_not_player_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.hash_map.add("ID-1")
+
+    def test_get_invalid_key_raises_key_error(self):
+        self.hash_map.add(self.players[0])
+
+        with self.assertRaises(KeyError):
+            self.hash_map.get("ID-11")
+
+    def test_put_updates_player_name_and_invalid_key_raises_key_error(self):
+        self.hash_map.add(self.players[0])
+
+        self.hash_map.put(self.players[0].uid, "Hello, World!")
+        self.assertEqual(self.hash_map.get(self.players[0].uid).name, "Hello, World!")
+
+        with self.assertRaises(KeyError):
+            self.hash_map.put("Hello", "World!")
+
+    def test_remove_colliding_players_keeps_rest_reachable(self):
+        # Every player hashes to the same slot, so each removal has to shift the rest of the probe sequence back
+        hash_map = HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING, hash_function=lambda key: 0, capacity=10)
+        for player in self.players:
+            hash_map.add(player)
+
+        for player in self.players[::2]:
+            hash_map.remove(player.uid)
+
+        self.assertEqual(len(hash_map), 5)
+        for player in self.players[1::2]:
+            self.assertIs(hash_map.get(player.uid), player)
+        for player in self.players[::2]:
+            with self.assertRaises(KeyError):
+                hash_map.get(player.uid)
+
+    def test_chain_lengths_count_players_by_home_slot(self):
+        hash_map = HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING, hash_function=lambda key: 3, capacity=10)
+        for player in self.players[:4]:
+            hash_map.add(player)
+
+        chain_lengths = hash_map.chain_lengths()
+
+        self.assertEqual(chain_lengths[3], 4)
+        self.assertEqual(sum(chain_lengths), 4)
+
+    def test_upsert_setdefault_and_pop(self):
+        self.assertIsNone(self.hash_map.upsert(self.players[0]))
+        replacement = Player(self.players[0].uid, "John Doe")
+        self.assertIs(self.hash_map.upsert(replacement), self.players[0])
+        self.assertIs(self.hash_map.setdefault(self.players[0]), replacement)
+        self.assertIs(self.hash_map.setdefault(self.players[1]), self.players[1])
+        self.assertEqual(len(self.hash_map), 2)
+
+        self.assertIs(self.hash_map.pop(self.players[0].uid), replacement)
+        self.assertEqual(self.hash_map.pop(self.players[0].uid, "missing"), "missing")
+        with self.assertRaises(KeyError):
+            self.hash_map.pop(self.players[0].uid)
+        self.assertEqual(len(self.hash_map), 1)
+
+    def test_update_many_replaces_duplicates(self):
+        self.hash_map.update_many(self.players[:6])
+        self.hash_map.update_many([Player(player.uid, "John Doe") for player in self.players[4:]])
+
+        self.assertEqual(len(self.hash_map), 10)
+        self.assertEqual(sorted(player.name for player in self.hash_map).count("John Doe"), 6)
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(0)
+        hash_map = HashMap(storage=HashMap.STORAGE_OPEN_ADDRESSING, min_load_factor=0.1)
+        expected = {}
+
+        for _ in range(5000):
+            uid = f"ID-{rng.randrange(500)}"
+            if uid in expected:
+                hash_map.remove(uid)
+                del expected[uid]
+            else:
+                player = Player(uid, self.test_player_name)
+                hash_map.add(player)
+                expected[uid] = player
+
+        self.assertEqual(len(hash_map), len(expected))
+        self.assertCountEqual(list(hash_map), list(expected.values()))
+        for uid, player in expected.items():
+            self.assertIs(hash_map.get(uid), player)
+
+    def test_views_and_changing_map_while_iterating(self):
+        for player in self.players:
+            self.hash_map.add(player)
+
+        self.assertCountEqual(list(self.hash_map.keys()), [player.uid for player in self.players])
+        self.assertCountEqual(list(self.hash_map.items()), [(player.uid, player) for player in self.players])
+        self.assertIn(self.players[0].uid, self.hash_map)
+        self.assertIn(self.players[0], self.hash_map.values())
+        self.assertEqual(repr(self.hash_map).count(self.test_player_name), len(self.players))
+
+        iterator = iter(self.hash_map.keys())
+        next(iterator)
+        self.hash_map.remove(self.players[0].uid)
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
+
+if __name__ == '__main__':
+    unittest.main()
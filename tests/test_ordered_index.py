@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from src.hash_map import HashMap
+from src.ordered_index import OrderedIndex
+from src.player import Player
+
+
+class TestOrderedIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [Player(f"ID-{i:03}", "Jane Doe") for i in range(100)]
+        shuffled = self.players[:]
+        random.Random(0).shuffle(shuffled)
+
+        self.hash_map = HashMap()
+        self.hash_map.update_many(shuffled[:50])
+        self.index = OrderedIndex(self.hash_map)
+        for player in shuffled[50:]:
+            self.hash_map.add(player)
+
+    def test_iterates_in_uid_order(self):
+        self.assertEqual(list(self.index), self.players)
+        self.assertEqual(list(reversed(self.index)), self.players[::-1])
+        self.assertEqual(len(self.index), 100)
+
+    def test_min_and_max(self):
+        self.assertIs(self.index.min(), self.players[0])
+        self.assertIs(self.index.max(), self.players[-1])
+
+        empty = OrderedIndex(HashMap())
+        with self.assertRaises(ValueError):
+            empty.min()
+        with self.assertRaises(ValueError):
+            empty.max()
+
+    def test_items_in_range(self):
+        self.assertEqual(self.index.items_in_range("ID-010", "ID-013"),
+                         [(player.uid, player) for player in self.players[10:13]])
+        self.assertEqual([uid for uid, player in self.index.items_in_range("ID-0975")], ["ID-098", "ID-099"])
+        self.assertEqual(len(self.index.items_in_range(high="ID-005")), 5)
+        self.assertEqual(self.index.items_in_range("ID-5", "ID-6"), [])
+
+    def test_follows_removals_and_replacements(self):
+        self.hash_map.remove("ID-000")
+        self.hash_map.pop("ID-099")
+        replacement = Player("ID-050", "John Doe")
+        self.hash_map.upsert(replacement)
+        self.hash_map.update_many([Player("ID-100", "Jane Doe"), Player("ID-100", "John Doe")])
+
+        self.assertEqual(self.index.min().uid, "ID-001")
+        self.assertEqual(self.index.max().name, "John Doe")
+        self.assertIs(self.index.items_in_range("ID-050", "ID-051")[0][1], replacement)
+        self.assertNotIn("ID-000", self.index)
+        self.assertEqual(len(self.index), 99)
+        self.assertEqual([player.uid for player in self.index], sorted(player.uid for player in self.hash_map))
+
+    def test_close_stops_updates(self):
+        self.index.close()
+        self.hash_map.remove("ID-000")
+
+        self.assertEqual(self.index.min().uid, "ID-000")
+
+
+if __name__ == '__main__':
+    unittest.main()
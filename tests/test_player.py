@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from src.player import Player
 
@@ -22,6 +23,31 @@ class TestPlayer(unittest.TestCase):
         self.player.name = "John Doe"
         self.assertEqual(self.player.name, "John Doe")
 
+    def test_player_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.player, "__dict__"))
+
+    def test_pearson_hash_anagram_uids_hash_differently(self):
+        self.assertNotEqual(Player.pearson_hash("1234"), Player.pearson_hash("4321"))
+
+    def test_hash_matches_pearson_hash_of_uid(self):
+        self.assertEqual(hash(self.player), Player.pearson_hash(self.player.uid))
+
+    def test_hash_is_cached(self):
+        with mock.patch.object(Player, "pearson_hash") as pearson_hash:
+            hash(self.player)
+            hash(self.player)
+
+        pearson_hash.assert_not_called()
+
+    def test_with_hash_does_not_hash_uid(self):
+        with mock.patch.object(Player, "pearson_hash") as pearson_hash:
+            player = Player.with_hash("1234", "Jane Doe", hash(self.player))
+
+        pearson_hash.assert_not_called()
+        self.assertEqual(player.uid, "1234")
+        self.assertEqual(player.name, "Jane Doe")
+        self.assertEqual(hash(player), hash(self.player))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.player_cache import PlayerCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPlayerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = PlayerCache(max_entries=3, max_age=10, clock=self.clock)
+        self.players = [Player(f"ID-{i}", "Jane Doe") for i in range(5)]
+
+    def test_get_cached_player_counts_hit(self):
+        self.cache.put(self.players[0])
+
+        self.assertIs(self.cache.get("ID-0"), self.players[0])
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_get_missing_player_returns_default_and_counts_miss(self):
+        self.assertIsNone(self.cache.get("ID-0"))
+        self.assertEqual(self.cache.get("ID-0", "default"), "default")
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hit_rate, 0.0)
+
+    def test_put_beyond_max_entries_evicts_least_recently_used(self):
+        for player in self.players[:3]:
+            self.cache.put(player)
+
+        self.cache.get("ID-0")
+        self.cache.put(self.players[3])
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertNotIn("ID-1", self.cache)
+        self.assertIn("ID-0", self.cache)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_put_existing_uid_replaces_player(self):
+        self.cache.put(self.players[0])
+        replacement = Player("ID-0", "John Doe")
+
+        self.cache.put(replacement)
+
+        self.assertEqual(len(self.cache), 1)
+        self.assertIs(self.cache.get("ID-0"), replacement)
+
+    def test_get_after_max_age_expires_player(self):
+        self.cache.put(self.players[0])
+        self.clock.now = 10
+
+        self.assertIsNone(self.cache.get("ID-0"))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.expirations, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_purge_expired_removes_only_expired_players(self):
+        self.cache.put(self.players[0])
+        self.clock.now = 5
+        self.cache.put(self.players[1])
+        self.clock.now = 12
+
+        self.assertEqual(self.cache.purge_expired(), 1)
+        self.assertEqual(len(self.cache), 1)
+        self.assertIn("ID-1", self.cache)
+
+    def test_remove_and_stats(self):
+        self.cache.put(self.players[0])
+        self.cache.remove("ID-0")
+
+        with self.assertRaises(KeyError):
+            self.cache.remove("ID-0")
+
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_players_are_looked_up_through_a_hash_map(self):
+        for player in self.players[:3]:
+            self.cache.put(player)
+
+        with mock.patch.object(HashMap, "__getitem__", autospec=True, side_effect=HashMap.__getitem__) as getitem:
+            self.assertIs(self.cache.get("ID-1"), self.players[1])
+            self.assertIsNone(self.cache.get("ID-4"))
+
+        self.assertEqual([call.args[1] for call in getitem.call_args_list], ["ID-1", "ID-4"])
+        # The map hands out the player's node, which is moved to the front of the recency order
+        self.cache.put(self.players[3])
+        self.assertNotIn("ID-0", self.cache)
+        self.assertIn("ID-1", self.cache)
+
+    def test_invalid_limits_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            PlayerCache(max_entries=0)
+
+        with self.assertRaises(ValueError):
+            PlayerCache(max_age=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 
 from src.player import Player
-from src.player_node import PlayerNode
+from src.player_node import FastPlayerNode, NodePool, PlayerNode
 from src.player_list import PlayerList
 
 
@@ -171,6 +171,223 @@ class TestPlayerList(unittest.TestCase):
 
         self.assertEqual(self.player_list.tail.player, self.test_player_two)
 
+    def test_append_caches_hash_on_node(self):
+        self.player_list.append(self.test_player_one)
+        self.player_list.append(self.test_player_two, hash_=1234)
+
+        self.assertEqual(self.player_list.head.hash, hash(self.test_player_one))
+        self.assertEqual(self.player_list.tail.hash, 1234)
+
+    def test_find_with_hash_skips_nodes_with_other_hashes(self):
+        self.player_list.append(self.test_player_one, hash_=1)
+        self.player_list.append(self.test_player_two, hash_=2)
+
+        self.assertIs(self.player_list.find("ID_2", 2).player, self.test_player_two)
+        self.assertIsNone(self.player_list.find("ID_2", 1))
+        self.assertIs(self.player_list.find("ID_2").player, self.test_player_two)
+
+    def test_extend_links_every_player_in_order(self):
+        self.player_list.append(self.test_player_one)
+        self.player_list.extend([self.test_player_two, self.test_player_three])
+
+        self.assertEqual(list(self.player_list), [self.test_player_one, self.test_player_two, self.test_player_three])
+        self.assertIs(self.player_list.tail.last.last, self.player_list.head)
+        self.assertIs(self.player_list.head.next.next, self.player_list.tail)
+
+    def test_extend_empty_list_with_hashes(self):
+        self.player_list.extend([self.test_player_one, self.test_player_two], hashes=[1, 2])
+
+        self.assertIs(self.player_list.head.player, self.test_player_one)
+        self.assertEqual([self.player_list.head.hash, self.player_list.tail.hash], [1, 2])
+        self.assertIsNone(self.player_list.head.last)
+        self.assertIsNone(self.player_list.tail.next)
+
+    def test_len_tracks_every_add_and_remove(self):
+        self.assertEqual(len(self.player_list), 0)
+
+        self.player_list.append(self.test_player_one)
+        self.player_list.prepend(self.test_player_two)
+        self.player_list.extend([self.test_player_three, Player("ID_4", "Jo"), Player("ID_5", "Al")])
+        self.assertEqual(len(self.player_list), 5)
+
+        self.player_list.remove("ID_3")
+        self.assertEqual(len(self.player_list), 4)
+
+        self.player_list.remove_at_head()
+        self.player_list.remove_at_tail()
+        self.assertEqual(len(self.player_list), 2)
+
+        with self.assertRaises(KeyError):
+            self.player_list.remove("ID_3")
+        self.assertEqual(len(self.player_list), 2)
+
+        self.player_list.remove_at_head()
+        self.player_list.remove_at_tail()
+        self.assertEqual(len(self.player_list), 0)
+        self.assertEqual(len(self.player_list), len(list(self.player_list)))
+
+    def test_append_and_prepend_return_node_handles(self):
+        node_one = self.player_list.append(self.test_player_one)
+        node_two = self.player_list.prepend(self.test_player_two)
+
+        self.assertIs(node_one, self.player_list.tail)
+        self.assertIs(node_two, self.player_list.head)
+
+    def test_remove_node_unlinks_middle_node(self):
+        self.player_list.append(self.test_player_one)
+        node = self.player_list.append(self.test_player_two)
+        self.player_list.append(self.test_player_three)
+
+        self.assertIs(self.player_list.remove_node(node), self.test_player_two)
+
+        self.assertEqual(list(self.player_list), [self.test_player_one, self.test_player_three])
+        self.assertIs(self.player_list.head.next, self.player_list.tail)
+        self.assertEqual(len(self.player_list), 2)
+
+    def test_indexed_list_finds_updates_and_removes_by_key(self):
+        player_list = PlayerList(indexed=True)
+        player_list.append(self.test_player_one)
+        player_list.prepend(self.test_player_two)
+        player_list.extend([self.test_player_three])
+
+        self.assertTrue(player_list.is_indexed)
+        self.assertIs(player_list.find("ID_3").player, self.test_player_three)
+
+        player_list["ID_1"] = "Robert"
+        self.assertEqual(self.test_player_one.name, "Robert")
+
+        player_list.remove("ID_1")
+        player_list.remove_at_head()
+        self.assertIsNone(player_list.find("ID_1"))
+        self.assertIsNone(player_list.find("ID_2"))
+        self.assertEqual(list(player_list), [self.test_player_three])
+
+        player_list.remove_at_tail()
+        self.assertIsNone(player_list.find("ID_3"))
+        with self.assertRaises(KeyError):
+            player_list.remove("ID_3")
+
+    def test_indexed_list_duplicate_key_raises_value_error(self):
+        player_list = PlayerList(indexed=True)
+        player_list.append(self.test_player_one)
+
+        with self.assertRaises(ValueError):
+            player_list.append(Player("ID_1", "Bobby"))
+        self.assertEqual(len(player_list), 1)
+
+    def test_indexed_list_extend_with_duplicate_key_leaves_list_unchanged(self):
+        pool = NodePool()
+        player_list = PlayerList(indexed=True, pool=pool)
+        player_list.append(self.test_player_one)
+        player_list.append(Player("ID_9", "Bobby"))
+        player_list.remove("ID_9")
+
+        for players in ([Player("ID_2", "Bobby"), Player("ID_1", "Bobby")],
+                        [Player("ID_2", "Bobby"), Player("ID_2", "Robert")]):
+            with self.assertRaises(ValueError):
+                player_list.extend(players)
+
+            self.assert_links(player_list, [self.test_player_one])
+            self.assertEqual(len(player_list), 1)
+            self.assertIsNone(player_list.find("ID_2"))
+            # The node kept for reuse was not taken
+            self.assertEqual(len(pool), 1)
+
+    def assert_links(self, player_list, players):
+        self.assertEqual(list(player_list), players)
+
+        backwards = []
+        node = player_list.tail
+        while node is not None:
+            backwards.append(node.player)
+            node = node.last
+        self.assertEqual(backwards, players[::-1])
+
+    def test_move_to_front_moves_middle_and_tail_nodes(self):
+        self.player_list.append(self.test_player_one)
+        middle = self.player_list.append(self.test_player_two)
+        tail = self.player_list.append(self.test_player_three)
+
+        self.player_list.move_to_front(middle)
+        self.assert_links(self.player_list, [self.test_player_two, self.test_player_one, self.test_player_three])
+
+        self.player_list.move_to_front(tail)
+        self.assert_links(self.player_list, [self.test_player_three, self.test_player_two, self.test_player_one])
+
+        self.player_list.move_to_front(self.player_list.head)
+        self.assert_links(self.player_list, [self.test_player_three, self.test_player_two, self.test_player_one])
+
+    def test_transpose_swaps_node_with_previous_node(self):
+        head = self.player_list.append(self.test_player_one)
+        self.player_list.append(self.test_player_two)
+        tail = self.player_list.append(self.test_player_three)
+
+        self.player_list.transpose(head)
+        self.assert_links(self.player_list, [self.test_player_one, self.test_player_two, self.test_player_three])
+
+        self.player_list.transpose(tail)
+        self.assert_links(self.player_list, [self.test_player_one, self.test_player_three, self.test_player_two])
+
+        self.player_list.transpose(tail)
+        self.assert_links(self.player_list, [self.test_player_three, self.test_player_one, self.test_player_two])
+
+    def test_default_list_uses_fast_player_nodes(self):
+        self.player_list.append(self.test_player_one)
+        self.player_list.prepend(self.test_player_two)
+
+        self.assertIsInstance(self.player_list.head, FastPlayerNode)
+        self.assertIsInstance(self.player_list.tail, FastPlayerNode)
+
+    def test_debug_list_uses_validating_player_nodes(self):
+        player_list = PlayerList(debug=True)
+        player_list.append(self.test_player_one)
+        player_list.append(self.test_player_two)
+
+        self.assertIsInstance(player_list.head, PlayerNode)
+        with self.assertRaises(ValueError):
+            player_list.head.next = self.test_player_three
+
+    def test_find_or_append_appends_only_missing_players(self):
+        for player_list in (self.player_list, PlayerList(debug=True), PlayerList(indexed=True)):
+            node, added = player_list.find_or_append(self.test_player_one)
+            self.assertTrue(added)
+            self.assertIs(node, player_list.tail)
+
+            player_list.find_or_append(self.test_player_two)
+            node, added = player_list.find_or_append(Player(self.test_player_one.uid, "Jane"))
+            self.assertFalse(added)
+            self.assertIs(node.player, self.test_player_one)
+            self.assertEqual(len(player_list), 2)
+
+    def test_find_or_append_not_player_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.player_list.find_or_append("ID_1")
+
+    def test_lists_sharing_a_pool_reuse_removed_nodes(self):
+        pool = NodePool()
+        player_list, other_list = PlayerList(pool=pool), PlayerList(pool=pool)
+
+        head = player_list.append(self.test_player_one)
+        middle = player_list.append(self.test_player_two)
+        tail = player_list.append(self.test_player_three)
+
+        self.assertIs(player_list.remove_node(middle), self.test_player_two)
+        self.assertIs(player_list.remove(self.test_player_one.uid), self.test_player_one)
+        player_list.remove_at_tail()
+        self.assertEqual(len(pool), 3)
+        self.assertTrue(player_list.is_empty)
+
+        other_list.extend([self.test_player_one, self.test_player_two])
+        other_list.prepend(self.test_player_three)
+        nodes = [other_list.head, other_list.head.next, other_list.tail]
+        self.assertCountEqual(map(id, nodes), map(id, [head, middle, tail]))
+        self.assertEqual(list(other_list), [self.test_player_three, self.test_player_one, self.test_player_two])
+        self.assertEqual(len(pool), 0)
+
+    def test_pool_in_debug_mode_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            PlayerList(debug=True, pool=NodePool())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
+import threading
 import unittest
 
-from src.player_node import PlayerNode
+from src.player_node import FastPlayerNode, NodePool, PlayerNode
 from src.player import Player
 
 
@@ -34,5 +35,81 @@ class TestPlayerNode(unittest.TestCase):
         self.assertEqual(self.reference_player_node.player.uid, self.player_node.last.player.uid)
 
 
+class TestFastPlayerNode(unittest.TestCase):
+    def setUp(self):
+        self.player = Player("ID_1234", "Jane Doe")
+        self.player_node = FastPlayerNode(player=self.player)
+
+    def test_key_is_player_uid(self):
+        self.assertEqual(self.player_node.key, self.player.uid)
+
+    def test_links_are_plain_slots(self):
+        reference_player_node = FastPlayerNode(player=Player("ID_4321", "John Doe"))
+
+        self.player_node.next = reference_player_node
+        reference_player_node.last = self.player_node
+
+        self.assertIs(self.player_node.next.last, self.player_node)
+        self.assertFalse(hasattr(self.player_node, "__dict__"))
+
+
+class TestNodePool(unittest.TestCase):
+    def setUp(self):
+        self.pool = NodePool(capacity=2)
+        self.player = Player("ID_1234", "John Doe")
+
+    def test_acquire_allocates_when_empty(self):
+        node = self.pool.acquire(self.player, hash_=7)
+
+        self.assertIsInstance(node, FastPlayerNode)
+        self.assertIs(node.player, self.player)
+        self.assertEqual(node.key, "ID_1234")
+        self.assertEqual(node.hash, 7)
+
+    def test_released_node_is_cleared_and_reused(self):
+        node = self.pool.acquire(self.player)
+        node.next = FastPlayerNode(Player("ID_4321", "Jane Doe"))
+        self.pool.release(node)
+
+        self.assertEqual(len(self.pool), 1)
+        self.assertIsNone(node.player)
+        self.assertIsNone(node.next)
+
+        other = Player("ID_5678", "Jane Doe")
+        self.assertIs(self.pool.acquire(other), node)
+        self.assertIs(node.player, other)
+        self.assertEqual(node.key, "ID_5678")
+        self.assertEqual(node.hash, hash(other))
+        self.assertEqual(len(self.pool), 0)
+
+    def test_pool_is_bounded(self):
+        for _ in range(3):
+            self.pool.release(FastPlayerNode(self.player))
+
+        self.assertEqual(len(self.pool), 2)
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_invalid_capacity_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            NodePool(capacity=0)
+
+    def test_threads_sharing_a_pool_never_exceed_its_capacity(self):
+        pool = NodePool(capacity=8)
+
+        def churn():
+            for _ in range(2000):
+                pool.release(FastPlayerNode(self.player))
+                pool.release(pool.acquire(self.player))
+
+        threads = [threading.Thread(target=churn) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(pool), 8)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+import unittest
+
+from src.player import Player
+from src.sharded_player_store import ShardedPlayerStore
+
+
+class TestShardedPlayerStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ShardedPlayerStore(shards=3)
+        self.addCleanup(self.store.close)
+
+    def test_add_get(self):
+        self.store.add(Player("ID-1", "Jane Doe"))
+
+        player = self.store.get("ID-1")
+        self.assertEqual(player.uid, "ID-1")
+        self.assertEqual(player.name, "Jane Doe")
+        self.assertEqual(hash(player), hash(Player("ID-1", "Jane Doe")))
+
+    def test_put_remove(self):
+        self.store.add(Player("ID-1", "Jane Doe"))
+        self.store.put("ID-1", "John Doe")
+        self.assertEqual(self.store.get("ID-1").name, "John Doe")
+
+        self.store.remove("ID-1")
+        self.assertEqual(len(self.store), 0)
+
+    def test_errors_are_raised_in_the_client(self):
+        with self.assertRaises(KeyError):
+            self.store.get("ID-1")
+        with self.assertRaises(KeyError):
+            self.store.put("ID-1", "John Doe")
+
+        # The store keeps working afterwards
+        self.store.add(Player("ID-1", "Jane Doe"))
+        self.assertEqual(self.store.get("ID-1").name, "Jane Doe")
+
+    def test_add_many_spreads_players_over_shards(self):
+        self.store.add_many(Player(f"ID-{i}", "Jane Doe") for i in range(300))
+
+        self.assertEqual(len(self.store), 300)
+        lengths = self.store._call_many({shard: ("__len__", ()) for shard in range(3)})
+        self.assertTrue(all(length > 50 for length in lengths.values()))
+
+    def test_get_many_keeps_order(self):
+        self.store.add_many(Player(f"ID-{i}", "Jane Doe") for i in range(100))
+
+        keys = [f"ID-{i}" for i in range(150, -1, -3)]
+        players = self.store.get_many(keys, default="missing")
+
+        self.assertEqual([player if player == "missing" else player.uid for player in players],
+                         [key if int(key[3:]) < 100 else "missing" for key in keys])
+
+    def test_close_stops_processes(self):
+        processes = list(self.store._processes)
+        self.store.close()
+        self.assertTrue(all(not process.is_alive() for process in processes))
+
+    def test_invalid_shards(self):
+        with self.assertRaises(ValueError):
+            ShardedPlayerStore(shards=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+from src.hash_map import HashMap
+from src.hashing import make_siphash
+from src.player import Player
+from src.snapshot import MappedSnapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "players.snapshot")
+
+        self.players = [Player(f"ID-{i}", f"Jäne Doe {i}") for i in range(200)]
+        self.hash_map = HashMap.from_players(self.players)
+
+    def test_load_round_trip(self):
+        self.hash_map.save(self.path)
+        loaded = HashMap.load(self.path)
+
+        self.assertEqual(len(loaded), 200)
+        for player in self.players:
+            found = loaded.get(player.uid)
+            self.assertEqual(found.name, player.name)
+            self.assertEqual(hash(found), hash(player))
+
+    def test_load_into_other_storage(self):
+        self.hash_map.save(self.path)
+        loaded = HashMap.load(self.path, storage=HashMap.STORAGE_OPEN_ADDRESSING)
+
+        self.assertEqual(loaded.get("ID-7").name, "Jäne Doe 7")
+
+        loaded.save(self.path)
+        self.assertEqual(len(HashMap.load(self.path)), 200)
+
+    def test_named_hash_function_is_kept(self):
+        HashMap.from_players(self.players, hash_function="fnv1a64").save(self.path)
+
+        loaded = HashMap.load(self.path)
+        self.assertEqual(loaded.get("ID-3").name, "Jäne Doe 3")
+        self.assertEqual(hash(loaded.get("ID-3")), hash(self.players[3]))
+
+        with MappedSnapshot(self.path) as mapped:
+            self.assertEqual(mapped.hash_function, "fnv1a64")
+            self.assertEqual(mapped["ID-3"].name, "Jäne Doe 3")
+
+    def test_load_default_hash_as_pearson32(self):
+        HashMap.from_players(self.players).save(self.path)
+
+        hash_map = HashMap.load(self.path, hash_function="pearson32")
+        self.assertEqual(hash_map.get("ID-3").name, "Jäne Doe 3")
+        with self.assertRaisesRegex(ValueError, "'pearson32' or None"):
+            HashMap.load(self.path, hash_function="fnv1a64")
+
+    def test_load_with_hash_function(self):
+        HashMap.from_players(self.players, hash_function="fnv1a64").save(self.path)
+
+        self.assertEqual(HashMap.load(self.path, hash_function="fnv1a64").get("ID-3").name, "Jäne Doe 3")
+        with self.assertRaises(ValueError):
+            HashMap.load(self.path, hash_function="pearson32")
+
+    def test_mapped_lookup_of_non_str_key_is_a_miss(self):
+        HashMap.from_players(self.players, hash_function="fnv1a64").save(self.path)
+
+        with MappedSnapshot(self.path) as mapped:
+            self.assertNotIn(42, mapped)
+            self.assertIsNone(mapped.get(42))
+            with self.assertRaises(KeyError):
+                mapped[42]
+
+    def test_unsupported_hash_functions(self):
+        with self.assertRaises(ValueError):
+            HashMap(hash_function="siphash").save(self.path)
+        with self.assertRaises(ValueError):
+            HashMap(hash_function=make_siphash(b"0123456789abcdef")).save(self.path)
+
+    def test_mapped_lookups(self):
+        self.hash_map.save(self.path)
+
+        with MappedSnapshot(self.path) as mapped:
+            self.assertEqual(len(mapped), 200)
+            self.assertEqual(mapped["ID-42"].name, "Jäne Doe 42")
+            self.assertEqual(hash(mapped["ID-42"]), hash(self.players[42]))
+            self.assertIn("ID-0", mapped)
+            self.assertNotIn("ID-200", mapped)
+            self.assertIsNone(mapped.get("ID-200"))
+            with self.assertRaises(KeyError):
+                mapped["ID-200"]
+            self.assertCountEqual([player.uid for player in mapped], [player.uid for player in self.players])
+
+    def test_empty_map(self):
+        HashMap().save(self.path)
+
+        self.assertEqual(len(HashMap.load(self.path)), 0)
+        with MappedSnapshot(self.path) as mapped:
+            self.assertNotIn("ID-0", mapped)
+
+    def test_invalid_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot at all, just some bytes")
+        with self.assertRaises(ValueError):
+            MappedSnapshot(self.path)
+
+        self.hash_map.save(self.path)
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 10)
+        with self.assertRaises(ValueError):
+            MappedSnapshot(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
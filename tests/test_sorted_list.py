@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from src.sorted_list import SortedList
+
+
+class TestSortedList(unittest.TestCase):
+
+    def test_add_keeps_values_sorted(self):
+        sorted_list = SortedList(load=4)
+        for value in [5, 1, 4, 1, 9, 2, 6]:
+            sorted_list.add(value)
+
+        self.assertEqual(list(sorted_list), [1, 1, 2, 4, 5, 6, 9])
+        self.assertEqual(list(reversed(sorted_list)), [9, 6, 5, 4, 2, 1, 1])
+        self.assertEqual(len(sorted_list), 7)
+        self.assertEqual((sorted_list[0], sorted_list[-1], sorted_list[3]), (1, 9, 4))
+        self.assertEqual([sorted_list[i] for i in range(-7, 7)], [1, 1, 2, 4, 5, 6, 9] * 2)
+        with self.assertRaises(IndexError):
+            sorted_list[-8]
+
+    def test_remove_and_contains(self):
+        sorted_list = SortedList(range(10), load=2)
+        sorted_list.remove(3)
+        sorted_list.discard(3)
+
+        self.assertNotIn(3, sorted_list)
+        self.assertIn(4, sorted_list)
+        self.assertEqual(list(sorted_list), [0, 1, 2, 4, 5, 6, 7, 8, 9])
+        with self.assertRaises(ValueError):
+            sorted_list.remove(3)
+        with self.assertRaises(ValueError):
+            sorted_list.remove(10)
+
+    def test_irange(self):
+        sorted_list = SortedList(range(0, 100, 5), load=2)
+
+        self.assertEqual(list(sorted_list.irange(12, 30)), [15, 20, 25, 30])
+        self.assertEqual(list(sorted_list.irange(15, 30, inclusive=(False, False))), [20, 25])
+        self.assertEqual(list(sorted_list.irange(maximum=7)), [0, 5])
+        self.assertEqual(list(sorted_list.irange(96)), [])
+
+    def test_random_operations_match_sorted_builtin_list(self):
+        rng = random.Random(0)
+        sorted_list = SortedList(load=8)
+        expected = []
+
+        for _ in range(5000):
+            value = rng.randrange(300)
+            if value in expected and rng.random() < 0.5:
+                sorted_list.remove(value)
+                expected.remove(value)
+            elif rng.random() < 0.01:
+                values = [rng.randrange(300) for i in range(50)]
+                sorted_list.update(values)
+                expected.extend(values)
+            else:
+                sorted_list.add(value)
+                expected.append(value)
+
+        self.assertEqual(list(sorted_list), sorted(expected))
+        self.assertEqual(len(sorted_list), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
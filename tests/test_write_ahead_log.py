@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+
+from src.hash_map import HashMap
+from src.player import Player
+from src.write_ahead_log import OP_ADD, OP_REMOVE, OP_RENAME, WriteAheadLog, encode_record, read_records, recover
+
+
+class TestWriteAheadLog(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.snapshot_path = os.path.join(directory.name, "players.snapshot")
+        self.log_path = os.path.join(directory.name, "players.log")
+
+    def recover(self, **kwargs):
+        hash_map, log = recover(self.snapshot_path, self.log_path, **kwargs)
+        self.addCleanup(log.close)
+        return hash_map, log
+
+    def test_records_round_trip(self):
+        with open(self.log_path, "wb") as file:
+            file.write(encode_record(OP_ADD, "ID-1", "Jäne Doe"))
+            file.write(encode_record(OP_REMOVE, "ID-1"))
+
+        self.assertEqual([record[:3] for record in read_records(self.log_path)],
+                         [(OP_ADD, "ID-1", "Jäne Doe"), (OP_REMOVE, "ID-1", "")])
+
+    def test_changes_are_logged_and_replayed(self):
+        hash_map, log = self.recover()
+        for i in range(5):
+            hash_map.add(Player(f"ID-{i}", "Jane Doe"))
+        hash_map.update_many([Player("ID-5", "Jane Doe")])
+        hash_map.put("ID-1", "John Doe")
+        hash_map.remove("ID-2")
+        log.close()
+
+        self.assertEqual([record[0] for record in read_records(self.log_path)], [OP_ADD] * 6 + [OP_RENAME, OP_REMOVE])
+
+        recovered, log = self.recover()
+        self.assertEqual(len(recovered), 5)
+        self.assertEqual(recovered.get("ID-1").name, "John Doe")
+        self.assertEqual(recovered.get_many(["ID-2"]), [None])
+
+    def test_replay_on_top_of_snapshot(self):
+        HashMap.from_players([Player("ID-1", "Jane Doe"), Player("ID-2", "Jane Doe")]).save(self.snapshot_path)
+
+        hash_map, log = self.recover()
+        hash_map.put("ID-1", "John Doe")
+        hash_map.add(Player("ID-3", "Jane Doe"))
+        log.close()
+
+        recovered, log = self.recover()
+        self.assertEqual(sorted(player.uid for player in recovered), ["ID-1", "ID-2", "ID-3"])
+        self.assertEqual(recovered.get("ID-1").name, "John Doe")
+
+    def test_replaced_player_is_logged_as_one_add(self):
+        hash_map, log = self.recover()
+        hash_map.add(Player("ID-1", "Jane Doe"))
+        hash_map.upsert(Player("ID-1", "John Doe"))
+        log.close()
+
+        self.assertEqual([record[:3] for record in read_records(self.log_path)],
+                         [(OP_ADD, "ID-1", "Jane Doe"), (OP_ADD, "ID-1", "John Doe")])
+
+        recovered, log = self.recover()
+        self.assertEqual(len(recovered), 1)
+        self.assertEqual(recovered.get("ID-1").name, "John Doe")
+
+    def test_torn_record_is_discarded(self):
+        hash_map, log = self.recover()
+        hash_map.add(Player("ID-1", "Jane Doe"))
+        log.close()
+
+        with open(self.log_path, "ab") as file:
+            file.write(encode_record(OP_ADD, "ID-2", "Jane Doe")[:-3])
+        intact_size = len(encode_record(OP_ADD, "ID-1", "Jane Doe"))
+
+        recovered, log = self.recover()
+        self.assertEqual([player.uid for player in recovered], ["ID-1"])
+        self.assertEqual(os.path.getsize(self.log_path), intact_size)
+
+    def test_compact_empties_log(self):
+        hash_map, log = self.recover()
+        hash_map.update_many(Player(f"ID-{i}", "Jane Doe") for i in range(10))
+        hash_map.remove("ID-0")
+        log.compact(hash_map, self.snapshot_path)
+
+        self.assertEqual(os.path.getsize(self.log_path), 0)
+
+        hash_map.put("ID-1", "John Doe")
+        log.close()
+
+        recovered, log = self.recover()
+        self.assertEqual(len(recovered), 9)
+        self.assertEqual(recovered.get("ID-1").name, "John Doe")
+
+    def test_replay_is_idempotent(self):
+        # As if a crash happened after the snapshot was written but before the log was emptied
+        hash_map, log = self.recover()
+        hash_map.add(Player("ID-1", "Jane Doe"))
+        hash_map.add(Player("ID-2", "Jane Doe"))
+        hash_map.put("ID-1", "John Doe")
+        hash_map.remove("ID-2")
+        log.close()
+        hash_map.save(self.snapshot_path)
+
+        recovered, log = self.recover()
+        self.assertEqual(len(recovered), 1)
+        self.assertEqual(recovered.get("ID-1").name, "John Doe")
+
+    def test_group_commit_buffers_until_sync(self):
+        hash_map, log = self.recover(sync_interval=60)
+        hash_map.add(Player("ID-1", "Jane Doe"))
+
+        self.assertEqual(os.path.getsize(self.log_path), 0)
+        log.sync()
+        self.assertGreater(os.path.getsize(self.log_path), 0)
+        self.assertEqual(log.syncs, 1)
+
+    def test_unsynced_log_still_writes(self):
+        hash_map, log = self.recover(sync_interval=None)
+        hash_map.add(Player("ID-1", "Jane Doe"))
+
+        self.assertGreater(os.path.getsize(self.log_path), 0)
+        self.assertEqual(log.syncs, 0)
+
+    def test_closed_log_rejects_records(self):
+        log = WriteAheadLog(self.log_path)
+        log.close()
+
+        with self.assertRaises(ValueError):
+            log.player_added(Player("ID-1", "Jane Doe"))
+
+
+if __name__ == '__main__':
+    unittest.main()